@@ -7,17 +7,25 @@ __version__ = '2.0.90'
 # -----------------------------------------------------------------------------
 
 import asyncio
+import collections
 import concurrent.futures
+import contextvars
+import copy
+import functools
 import socket
 import certifi
 import aiohttp
 import ssl
 import sys
+import time
 import yarl
 
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.throttler import Throttler
+from ccxt.async_support.base.loop_monitor import LoopLagMonitor
+from ccxt.async_support.base.fixtures import AsyncFixtureSession
+from ccxt.base.clock import ClockOffsetEstimator
 
 # -----------------------------------------------------------------------------
 
@@ -33,8 +41,9 @@ from ccxt.base.decimal_to_precision import TRUNCATE, ROUND, TICK_SIZE, DECIMAL_P
 
 # -----------------------------------------------------------------------------
 
-from ccxt.base.exchange import Exchange as BaseExchange, ArgumentsRequired
+from ccxt.base.exchange import Exchange as BaseExchange, ArgumentsRequired, implicit_api_call, shared_market_properties
 from ccxt.base.precise import Precise
+from ccxt.base.metrics import request_metrics, unified_call
 
 # -----------------------------------------------------------------------------
 
@@ -45,9 +54,44 @@ __all__ = [
 
 # -----------------------------------------------------------------------------
 
+# the rate limiter costs of the requests made by the call that is being measured
+request_costs = contextvars.ContextVar('request_costs', default=None)
+
+
+def decode_json(codec, body, quote_numbers):
+    # parse_json() of the base class as a function, which can be sent to a process pool
+    try:
+        if isinstance(body, bytes) or BaseExchange.is_json_encoded_object(body):
+            return codec.loads(body, quote_numbers)
+    except ValueError:
+        pass
+
+# -----------------------------------------------------------------------------
+
 
 class Exchange(BaseExchange):
     synchronous = False
+    shared_markets_loading = {}  # (id, sandbox, options) → the task of the instance that is loading the shared markets
+    singleFlight = False  # the concurrent identical public GET requests share one request, the callers get copies of its response
+    singleFlightTTL = 0  # milliseconds to keep serving the response of a shared request for, not cached by default
+    singleFlightCopy = True  # every caller gets a deep copy of the shared response, set to False to share the same read-only object
+    clockSync = False  # keep estimating the offset of the server clock in the background from fetch_time()
+    clockSyncInterval = 30000  # milliseconds between the samples of the server time
+    clockSyncSamples = 8  # the number of the last samples the offset is estimated from
+    fanIn = False  # the concurrent calls of the single symbol methods are batched into calls of the bulk methods
+    fanInWindow = 5  # milliseconds to collect the calls of a batch for
+    fanInMethods = {
+        'fetch_ticker': 'fetch_tickers',
+        'fetch_funding_rate': 'fetch_funding_rates',
+    }
+    offloadExecutor = None  # 'thread', 'process' or a concurrent.futures executor to run the heavy signing and parsing in
+    offloadJsonSize = 1048576  # the response bodies of at least this many characters are decoded in the executor
+    offloadSignTime = 5  # milliseconds, the signatures of an api are computed in the executor once one takes longer
+    offloadMarkets = 1000  # the markets are indexed, shared and cached in the executor when there are at least this many
+    offload_process_pool = None  # the process pool of offloadExecutor = 'process', shared by the exchanges
+    loopLagMonitor = False  # report the stalls of the event loop and the exchange calls that caused them
+    loopLagThreshold = 100  # milliseconds the event loop must be blocked for to report a stall
+    loop_lag_monitors = {}  # the event loop → its LoopLagMonitor, shared by the exchanges
 
     def __init__(self, config={}):
         if 'asyncio_loop' in config:
@@ -57,13 +101,326 @@ class Exchange(BaseExchange):
         self.own_session = 'session' not in config
         self.cafile = config.get('cafile', certifi.where())
         super(Exchange, self).__init__(config)
-        self.throttle = None
-        self.init_rest_rate_limiter()
         self.markets_loading = None
+        self.markets_refreshing = None
         self.reloading_markets = False
+        self.single_flight_requests = {}  # (api, path, params) → the task of the request in flight
+        self.single_flight_cache = collections.OrderedDict()  # (api, path, params) → [expires, response], oldest first
+        self.single_flight_stats = {'hits': 0, 'cached': 0, 'misses': 0}
+        self.clock_offset = ClockOffsetEstimator(self.clockSyncSamples)
+        self.clock_sync_task = None
+        self.fan_in_batches = {}  # the name of the bulk method → the batch collecting the calls
+        self.fan_in_costs = {}  # the name of the method → the rate limiter cost of its last measured call
+        self.sign_times = {}  # the api → the milliseconds its last signature took, with offloadExecutor
+        self.lag_monitor = None
+        if self.fanIn and (self.metrics is None):
+            # with the metrics, init_metrics() installed them
+            self.init_fan_in()
+        if self.offloadExecutor is not None:
+            self.init_offload()
+
+    async def call_implicit_api(self, entry, kwargs):
+        # the coroutine sets the call in progress in the context of the task that awaits it
+        token = self.enter_implicit_api_call(kwargs)
+        try:
+            if self.singleFlight and (kwargs['method'] == 'GET') and self.is_public_api(kwargs['api']):
+                return await self.call_single_flight(entry, kwargs)
+            return await entry(self, **kwargs)
+        finally:
+            implicit_api_call.reset(token)
+
+    async def throttle(self, cost=None):
+        method, priority, deadline = self.calculate_rate_limiter_scope()
+        costs = request_costs.get()
+        if costs is not None:
+            costs.append(self.throttler.config['cost'] if cost is None else cost)
+        await self.throttler(cost, priority, deadline)
+        for throttle, bucket_cost in self.rate_limit_bucket_costs(method, cost):
+            await throttle(bucket_cost, priority, deadline)
+        if self.metrics is not None:
+            self.mark_request_metrics('throttled')
+        if self.offloadExecutor is not None:
+            await self.offload_sign()
+
+    async def call_single_flight(self, entry, kwargs):
+        # the unsigned request is the key, the callers that come while it is in flight or cached don't sign it or take tokens
+        key = (str(kwargs['api']), kwargs['path'], self.urlencode(self.keysort(kwargs['params'])))
+        cached = self.single_flight_cache.get(key)
+        if cached is not None and cached[0] > self.milliseconds():
+            self.single_flight_stats['cached'] += 1
+            return self.single_flight_response(cached[1])
+        task = self.single_flight_requests.get(key)
+        if task is None:
+            self.single_flight_stats['misses'] += 1
+            task = asyncio.ensure_future(self.fetch_single_flight(key, entry, kwargs))
+            self.single_flight_requests[key] = task
+            task.add_done_callback(lambda task: self.single_flight_done(key, task))
+        else:
+            self.single_flight_stats['hits'] += 1
+        # a cancelled caller does not cancel the request of the others
+        return self.single_flight_response(await asyncio.shield(task))
+
+    def single_flight_response(self, response):
+        # copying a large response such as the markets costs about as much as parsing it again for every caller
+        return copy.deepcopy(response) if self.singleFlightCopy else response
+
+    async def fetch_single_flight(self, key, entry, kwargs):
+        response = await entry(self, **kwargs)
+        if self.singleFlightTTL > 0:
+            now = self.milliseconds()
+            cache = self.single_flight_cache
+            # the responses expire in the order they were stored, the expired ones are dropped from the front
+            while cache and next(iter(cache.values()))[0] <= now:
+                cache.popitem(last=False)
+            cache[key] = [now + self.singleFlightTTL, response]
+            cache.move_to_end(key)
+        return response
+
+    def single_flight_done(self, key, task):
+        if self.single_flight_requests.get(key) is task:
+            del self.single_flight_requests[key]
+        # the error is raised to the callers, the ones that were cancelled don't retrieve it
+        if not task.cancelled():
+            task.exception()
+
+    async def sync_clock(self, params={}):
+        # one sample of the server time, options['timeDifference'] is used by the nonce() of the exchanges
+        sent = self.milliseconds()
+        server_time = await self.fetch_time(params)
+        received = self.milliseconds()
+        self.clock_offset.add(sent, server_time, received)
+        self.options['timeDifference'] = int(round(self.clock_offset.offset))
+        return self.clock_offset.offset
+
+    def start_clock_sync(self):
+        if not self.has['fetchTime']:
+            raise NotSupported(self.id + ' clockSync requires fetchTime()')
+        if self.clock_sync_task is None:
+            self.clock_sync_task = asyncio.ensure_future(self.clock_sync_loop())
+        return self.clock_sync_task
+
+    async def clock_sync_loop(self):
+        while True:
+            delay = self.clockSyncInterval
+            try:
+                await self.sync_clock()
+                # a burst of samples first, for the offset to be estimated from several round trips right away
+                if len(self.clock_offset.samples) < self.clockSyncSamples // 2:
+                    delay = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning("%s failed to sample the server time: %s", self.id, e)
+            await asyncio.sleep(delay / 1000)
+
+    def init_fan_in(self):
+        # the instance attributes shadow the methods of the instance, the bulk methods that are emulated are not used
+        for name, bulk in self.fanInMethods.items():
+            if self.has.get(Exchange.underscore_to_camelcase(bulk)) is True:
+                # the calls that are not batched go to the method the instance had before
+                method = functools.partial(self.fetch_fan_in, name, bulk, getattr(self, name))
+                setattr(self, name, method)
+                setattr(self, Exchange.underscore_to_camelcase(name), method)
+
+    async def fetch_fan_in(self, name, bulk, single, symbol, params={}):
+        if params:
+            # the bulk call could not take the params of every call
+            return await single(symbol, params)
+        await self.load_markets()
+        if symbol not in self.markets:
+            # an id or an unknown symbol doesn't fail the batch of the others
+            return await single(symbol, params)
+        batch = self.fan_in_batches.get(bulk)
+        if batch is None:
+            batch = {'symbols': []}
+            batch['task'] = asyncio.ensure_future(self.fetch_fan_in_batch(name, bulk, single, batch))
+            batch['task'].add_done_callback(self.fan_in_done)
+            self.fan_in_batches[bulk] = batch
+        if symbol not in batch['symbols']:
+            batch['symbols'].append(symbol)
+        try:
+            # a cancelled caller does not cancel the batch of the others
+            results = await asyncio.shield(batch['task'])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # the failed bulk call is not the failure of every caller, each of them makes its own call
+            return await single(symbol, params)
+        result = results.get(symbol)
+        if isinstance(result, Exception):
+            raise result
+        if result is None:
+            # the symbol is missing from the bulk response, it is not returned in bulk
+            return await single(symbol, params)
+        return result
+
+    async def fetch_fan_in_batch(self, name, bulk, single, batch):
+        await asyncio.sleep(self.fanInWindow / 1000)
+        # the calls that come from now on start the next batch
+        if self.fan_in_batches.get(bulk) is batch:
+            del self.fan_in_batches[bulk]
+        symbols = batch['symbols']
+        if self.is_fan_in_separately(name, bulk, len(symbols)):
+            results = await asyncio.gather(*[self.fetch_fan_in_measured(name, single, symbol) for symbol in symbols], return_exceptions=True)
+            return dict(zip(symbols, results))
+        return await self.fetch_fan_in_measured(bulk, getattr(self, bulk), symbols)
+
+    async def fetch_fan_in_measured(self, name, method, argument):
+        # the cost of the call is the sum of the tokens taken by its requests
+        costs = []
+        token = request_costs.set(costs)
+        try:
+            result = await method(argument)
+        finally:
+            request_costs.reset(token)
+        self.fan_in_costs[name] = sum(costs)
+        return result
+
+    def is_fan_in_separately(self, name, bulk, count):
+        # one call is made separately, the others in bulk unless the separate calls are known to cost less
+        if count == 1:
+            return True
+        cost = self.fan_in_costs.get(name)
+        bulk_cost = self.fan_in_costs.get(bulk)
+        if cost is None or bulk_cost is None:
+            return False
+        return cost * count < bulk_cost
+
+    def fan_in_done(self, task):
+        # the error is raised to the callers, the ones that were cancelled don't retrieve it
+        if not task.cancelled():
+            task.exception()
+
+    def get_offload_executors(self):
+        # the executor of the JSON decoding and the one of the rest, which runs methods of the instance and must be
+        # a thread pool, None is the default executor of the loop
+        executor = self.offloadExecutor
+        if executor == 'thread':
+            return None, None
+        if executor == 'process':
+            if Exchange.offload_process_pool is None:
+                Exchange.offload_process_pool = concurrent.futures.ProcessPoolExecutor()
+            return Exchange.offload_process_pool, None
+        if isinstance(executor, concurrent.futures.ThreadPoolExecutor):
+            return executor, executor
+        return executor, None
+
+    def init_offload(self):
+        # the instance attribute returns the signature offload_sign() computed in the executor for the request, or signs it
+        self.inline_sign = self.sign
+        self.sign = self.offloaded_sign
+
+    def offloaded_sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        call = implicit_api_call.get()
+        presigned = call.pop('signed', None) if call is not None else None
+        if (presigned is not None) and (presigned[0] == [path, api, method, params, headers, body]):
+            return presigned[1]
+        return self.timed_sign(path, api, method, params, headers, body)
+
+    async def offload_sign(self):
+        # called by throttle() once the request can be sent, the signatures of the apis known to be slow are computed
+        # in the executor, for the params of the implicit api call in progress, which fetch2() signs right after
+        call = implicit_api_call.get()
+        if (call is None) or (self.sign_times.get(str(call['api']), 0) < self.offloadSignTime):
+            return
+        args = [call['path'], call['api'], call['method'], self.omit_rate_limiter_params(call['params']), None, None]
+        # sign() gets its own copy of the params, the ones compared with the request stay as they are
+        signing = functools.partial(self.timed_sign, args[0], args[1], args[2], dict(args[3]), None, None)
+        request = await self.asyncio_loop.run_in_executor(self.get_offload_executors()[1], signing)
+        call['signed'] = [args, request]
+
+    def timed_sign(self, path, api, method, params, headers, body):
+        started = time.perf_counter()
+        request = self.inline_sign(path, api, method, params, headers, body)
+        self.sign_times[str(api)] = (time.perf_counter() - started) * 1000
+        return request
+
+    def json_document(self, http_response, content, charset):
+        # the JSON responses are decoded from the bytes received, without the text, unless the exchange reads them its own way
+        if (type(self).on_rest_response is not BaseExchange.on_rest_response) or (type(self).parse_json is not BaseExchange.parse_json) or (type(self).on_json_response is not BaseExchange.on_json_response):
+            return http_response
+        if (charset is not None) and (charset.lower() not in ('utf-8', 'utf8')):
+            return http_response
+        return content if self.is_json_encoded_object(http_response) else http_response
+
+    async def offload_parse_json(self, http_response):
+        json_executor, executor = self.get_offload_executors()
+        if (type(self).parse_json is not BaseExchange.parse_json) or (type(self).on_json_response is not BaseExchange.on_json_response):
+            # the responses of the exchanges decoding them their own way are decoded by the instance
+            return await self.asyncio_loop.run_in_executor(executor, self.parse_json, http_response)
+        return await self.asyncio_loop.run_in_executor(json_executor, decode_json, self.json_backend, http_response, self.quoteJsonNumbers)
+
+    async def offload_set_markets(self, count, set_markets, *args):
+        if (self.offloadExecutor is None) or (count < self.offloadMarkets):
+            return set_markets(*args)
+        # the markets are set on a copy of the instance in the executor, the coroutines keep reading the previous ones
+        # from this instance until all the new structures are swapped in at once on the loop
+        shadow = copy.copy(self)
+        shadow.session = None
+        method = getattr(shadow, set_markets.__name__)
+        result = await self.asyncio_loop.run_in_executor(self.get_offload_executors()[1], method, *args)
+        for name in shared_market_properties:
+            setattr(self, name, getattr(shadow, name))
+        return result
+
+    def init_metrics(self):
+        # the fan-in methods are installed first, the metrics measure them as the unified methods of the callers
+        if self.fanIn:
+            self.init_fan_in()
+        super(Exchange, self).init_metrics()
+        self.offload_parse_json = functools.partial(self.measure_offloaded_decode, self.offload_parse_json)
+
+    async def measure_fetch2(self, fetch2, path, api='public', method='GET', params={}, headers=None, body=None, config={}, context={}):
+        endpoint = self.metrics_endpoint(path, api, method)
+        response_metrics = self.start_request_metrics()
+        token = request_metrics.set(response_metrics)
+        try:
+            response = await fetch2(path, api, method, params, headers, body, config, context)
+        except Exception as e:
+            self.metrics.record_error(endpoint, e)
+            raise
+        finally:
+            request_metrics.reset(token)
+        self.record_request_metrics(endpoint, response_metrics)
+        return response
+
+    async def measure_offloaded_decode(self, offload_parse_json, http_response):
+        started = time.perf_counter()
+        result = await offload_parse_json(http_response)
+        self.record_decode_metrics(started, http_response)
+        return result
+
+    async def measure_unified(self, method, *args, **kwargs):
+        call = [None, 0]
+        token = unified_call.set(call)
+        try:
+            result = await method(*args, **kwargs)
+        finally:
+            unified_call.reset(token)
+        if call[0] is not None:
+            self.metrics.record_parse(call[0], (time.perf_counter() - call[1]) * 1000)
+        return result
+
+    def start_loop_lag_monitor(self):
+        monitor = Exchange.loop_lag_monitors.get(self.asyncio_loop)
+        if monitor is None:
+            monitor = LoopLagMonitor(self.asyncio_loop, self.loopLagThreshold, self.logger)
+            monitor.start()
+            Exchange.loop_lag_monitors[self.asyncio_loop] = monitor
+        monitor.references += 1
+        self.lag_monitor = monitor
+
+    def stop_loop_lag_monitor(self):
+        monitor = self.lag_monitor
+        self.lag_monitor = None
+        monitor.references -= 1
+        if monitor.references == 0:
+            monitor.stop()
+            del Exchange.loop_lag_monitors[monitor.loop]
 
     def init_rest_rate_limiter(self):
-        self.throttle = Throttler(self.tokenBucket, self.asyncio_loop)
+        self.throttler = Throttler(self.tokenBucket, self.asyncio_loop, self.init_shared_throttler())
+        self.rate_limit_buckets = self.init_rate_limit_buckets(lambda config: Throttler(config, self.asyncio_loop))
 
     def __del__(self):
         if self.session is not None:
@@ -83,15 +440,30 @@ class Exchange(BaseExchange):
                 self.asyncio_loop = asyncio.get_running_loop()
             else:
                 self.asyncio_loop = asyncio.get_event_loop()
-            self.throttle.loop = self.asyncio_loop
-        if self.own_session and self.session is None:
+            self.throttler.loop = self.asyncio_loop
+        if self.clockSync and (self.clock_sync_task is None):
+            self.start_clock_sync()
+        if self.loopLagMonitor and (self.lag_monitor is None):
+            self.start_loop_lag_monitor()
+        replaying = (self.fixture is not None) and (self.fixture.mode == 'replay')
+        if self.own_session and self.session is None and not replaying:
             # Create our SSL context object with our CA cert file
             context = ssl.create_default_context(cafile=self.cafile) if self.verify else self.verify
             # Pass this SSL context to aiohttp and create a TCPConnector
             connector = aiohttp.TCPConnector(ssl=context, loop=self.asyncio_loop, enable_cleanup_closed=True)
             self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env)
+        if (self.fixture is not None) and not isinstance(self.session, AsyncFixtureSession):
+            self.session = AsyncFixtureSession(self.session, self.fixture)
 
     async def close(self):
+        if self.clock_sync_task is not None:
+            self.clock_sync_task.cancel()
+            self.clock_sync_task = None
+        if self.lag_monitor is not None:
+            self.stop_loop_lag_monitor()
+        if self.markets_refreshing is not None:
+            self.markets_refreshing.cancel()
+            self.markets_refreshing = None
         if self.session is not None:
             if self.own_session:
                 await self.session.close()
@@ -99,6 +471,8 @@ class Exchange(BaseExchange):
 
     async def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
+        if self.metrics is not None:
+            self.mark_request_metrics('signed', len(url) + len(body or ''))
         request_headers = self.prepare_request_headers(headers)
         url = self.proxy + url
 
@@ -121,6 +495,7 @@ class Exchange(BaseExchange):
                                       headers=request_headers,
                                       timeout=(self.timeout / 1000),
                                       proxy=self.aiohttp_proxy) as response:
+                content = await response.read()
                 http_response = await response.text(errors='replace')
                 # CIMultiDictProxy
                 raw_headers = response.headers
@@ -132,8 +507,16 @@ class Exchange(BaseExchange):
                         headers[header] = raw_headers[header]
                 http_status_code = response.status
                 http_status_text = response.reason
+                self.on_rate_limit_headers(http_status_code, headers)
                 http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, http_response, request_headers, request_body)
-                json_response = self.parse_json(http_response)
+                document = self.json_document(http_response, content, response.charset)
+                if (self.offloadExecutor is not None) and (len(http_response) >= self.offloadJsonSize):
+                    json_response = await self.offload_parse_json(document)
+                else:
+                    json_response = self.parse_json(document)
+                if (json_response is None) and (document is content):
+                    # not UTF-8, decoded from the text with the invalid bytes replaced
+                    json_response = self.parse_json(http_response)
                 if self.enableLastHttpResponse:
                     self.last_http_response = http_response
                 if self.enableLastResponseHeaders:
@@ -174,11 +557,41 @@ class Exchange(BaseExchange):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if self.shareMarkets:
+                # another instance may be loading the same markets right now
+                loading = Exchange.shared_markets_loading.get(self.shared_markets_key())
+                if (loading is not None) and (loading is not self.markets_loading):
+                    try:
+                        await asyncio.shield(loading)
+                    except Exception:
+                        pass
+                if self.attach_shared_markets():
+                    return self.markets
+            if self.marketsCachePath is not None:
+                cache = self.read_markets_cache()
+                if cache is not None:
+                    # expired markets are served from the cache while fresh ones are loaded in the background
+                    if self.is_markets_cache_expired(cache):
+                        self.markets_refreshing = asyncio.ensure_future(self.refresh_markets(params))
+                    return await self.offload_set_markets(len(cache['markets']), self.set_cached_markets, cache)
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = await self.fetch_currencies()
         markets = await self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        return await self.offload_set_markets(len(markets), self.set_loaded_markets, markets, currencies)
+
+    async def refresh_markets(self, params={}):
+        try:
+            currencies = None
+            if self.has['fetchCurrencies'] is True:
+                currencies = await self.fetch_currencies()
+            markets = await self.fetch_markets(params)
+            return await self.offload_set_markets(len(markets), self.set_loaded_markets, markets, currencies)
+        except Exception as e:
+            # the cached markets stay in place, the next load_markets() will retry
+            self.logger.warning("%s failed to refresh the cached markets: %s", self.id, e)
+        finally:
+            self.markets_refreshing = None
 
     async def load_markets(self, reload=False, params={}):
         if (reload and not self.reloading_markets) or not self.markets_loading:
@@ -186,6 +599,11 @@ class Exchange(BaseExchange):
             coroutine = self.load_markets_helper(reload, params)
             # coroutines can only be awaited once so we wrap it in a task
             self.markets_loading = asyncio.ensure_future(coroutine)
+            if self.shareMarkets:
+                key = self.shared_markets_key()
+                if key not in Exchange.shared_markets_loading:
+                    Exchange.shared_markets_loading[key] = self.markets_loading
+                    self.markets_loading.add_done_callback(self.on_shared_markets_loaded)
         try:
             result = await self.markets_loading
         except Exception as e:
@@ -195,6 +613,11 @@ class Exchange(BaseExchange):
         self.reloading_markets = False
         return result
 
+    def on_shared_markets_loaded(self, future):
+        key = self.shared_markets_key()
+        if Exchange.shared_markets_loading.get(key) is future:
+            del Exchange.shared_markets_loading[key]
+
     async def fetch_fees(self):
         trading = {}
         funding = {}
@@ -243,6 +666,57 @@ class Exchange(BaseExchange):
     async def fetch_full_tickers(self, symbols=None, params={}):
         return await self.fetch_tickers(symbols, params)
 
+    async def fetch_ohlcv_columns(self, fetch_ohlcv, *args, **kwargs):
+        return self.ohlcv_columns(await fetch_ohlcv(*args, **kwargs))
+
+    async def paginate(self, method, symbol=None, since=None, until=None, timeframe='1m', limit=None, params={}):
+        """
+        The async generator version of the base paginate(): up to paginationConcurrency windows are fetched
+        at the same time, each request still waits for its turn in the throttler, the entries are yielded in order
+        as soon as their page arrives, each window fetches no more than paginationBuffer pages ahead of the consumer
+        """
+        windows, step, limit = self.pagination_windows(method, since, until, timeframe, limit, self.paginationConcurrency)
+        state = {}
+        pending = collections.deque()
+        try:
+            while True:
+                # the windows are scheduled ahead of the consumer by no more than the concurrency
+                while len(pending) < self.paginationConcurrency:
+                    window = next(windows, None)
+                    if window is None:
+                        break
+                    pages = asyncio.Queue(self.paginationBuffer)
+                    task = asyncio.ensure_future(self.fetch_pagination_window(pages, method, symbol, window, timeframe, step, limit, params))
+                    pending.append((task, pages))
+                if not pending:
+                    break
+                # the pages of the oldest window come first
+                entries = await pending[0][1].get()
+                if entries is None:
+                    pending.popleft()
+                    continue
+                if isinstance(entries, Exception):
+                    raise entries
+                for entry in self.deduplicate_paginated_entries(entries, state):
+                    yield entry
+        finally:
+            for task, pages in pending:
+                task.cancel()
+
+    async def fetch_pagination_window(self, pages, method, symbol, window, timeframe, step, limit, params):
+        # puts the entries of every page in the queue, then None at the end of the window or the error
+        start, end = window
+        cursor = start
+        try:
+            while cursor is not None:
+                page = await self.fetch_pagination_page(method, symbol, cursor, timeframe, limit, params)
+                entries, cursor = self.paginated_entries(page, cursor, end, step, limit)
+                await pages.put(entries)
+        except Exception as e:
+            await pages.put(e)
+            return
+        await pages.put(None)
+
     async def sleep(self, milliseconds):
         return await asyncio.sleep(milliseconds / 1000)
 
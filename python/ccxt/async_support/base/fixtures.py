@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""The aiohttp counterpart of ccxt.base.fixtures.FixtureSession"""
+
+# -----------------------------------------------------------------------------
+
+from ccxt.base.fixtures import Fixture
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'AsyncFixtureSession',
+    'FixtureResponse',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class FixtureResponse(object):
+    """The part of aiohttp.ClientResponse that Exchange.fetch() reads, from a recorded response"""
+
+    def __init__(self, entry):
+        self.status = entry['status']
+        self.reason = entry['reason']
+        self.headers = entry['headers']
+        self.content = Fixture.content(entry)
+
+    @property
+    def charset(self):
+        for parameter in self.headers.get('Content-Type', '').split(';')[1:]:
+            name, _, value = parameter.strip().partition('=')
+            if name.lower() == 'charset':
+                return value.strip('"')
+        return None
+
+    async def text(self, encoding='utf-8', errors='strict'):
+        return self.content.decode(encoding, errors)
+
+    async def read(self):
+        return self.content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class FixtureRequest(object):
+
+    def __init__(self, session, method, url, kwargs):
+        self.session = session
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+
+    async def __aenter__(self):
+        fixture = self.session.fixture
+        body = self.kwargs.get('data')
+        if fixture.mode == 'replay':
+            return FixtureResponse(fixture.replay(self.method, str(self.url), body))
+        async with self.session.session.request(self.method, self.url, **self.kwargs) as response:
+            content = await response.read()
+            headers = {}
+            for name in response.headers:
+                headers[name] = response.headers[name] if name not in headers else headers[name] + ', ' + response.headers[name]
+            entry = fixture.record(self.method, str(self.url), body, response.status, response.reason, headers, content)
+        return FixtureResponse(entry)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class AsyncFixtureSession(object):
+    """
+    An aiohttp ClientSession recording its responses into a fixture or replaying them from it, without a session to
+    send the requests with in the replay mode
+    """
+
+    def __init__(self, session, fixture):
+        self.session = session
+        self.fixture = fixture
+
+    def request(self, method, url, **kwargs):
+        return FixtureRequest(self, method.upper(), url, kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    @property
+    def headers(self):
+        return {} if self.session is None else self.session.headers
+
+    @property
+    def closed(self):
+        return (self.session is None) or self.session.closed
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
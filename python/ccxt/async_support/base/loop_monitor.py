@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+"""Detection of the stalls of an event loop and of the exchange calls that caused them"""
+
+# -----------------------------------------------------------------------------
+
+import collections
+import sys
+import threading
+import time
+
+from ccxt.base.exchange import Exchange
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'LoopLagMonitor',
+    'exchange_calls',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def exchange_calls(frame):
+    """The methods of the exchanges on the stack of a frame, outermost first, as 'id.method' strings"""
+    calls = []
+    while frame is not None:
+        code = frame.f_code
+        if code.co_argcount and code.co_varnames[0] == 'self':
+            instance = frame.f_locals.get('self')
+            if isinstance(instance, Exchange):
+                calls.append(str(instance.id) + '.' + code.co_name)
+        frame = frame.f_back
+    calls.reverse()
+    return calls
+
+
+class LoopLagMonitor(object):
+    """
+    A callback of the loop runs every quarter of the threshold and records when it ran. A watchdog thread checks the
+    time of the last run as often, when the callback is late by the threshold the loop is blocked, the watchdog takes
+    the exchange methods on the stack of the loop thread right away, while they are still running. The callback
+    reports the stall with its length when the loop runs it again.
+    """
+
+    def __init__(self, loop, threshold, logger, size=100):
+        self.loop = loop
+        self.threshold = threshold / 1000
+        self.interval = self.threshold / 4
+        self.logger = logger
+        self.stalls = collections.deque(maxlen=size)  # the last stalls, {'timestamp', 'lag', 'calls'} dicts
+        self.references = 0  # the exchanges using the monitor
+        self.beat = None  # the perf_counter() of the last run of the callback
+        self.calls = None  # [the beat, the exchange calls] of the stall in progress
+        self.thread_id = None
+        self.handle = None
+        self.watchdog = None
+        self.running = False
+
+    def start(self):
+        # called on the thread of the loop
+        self.thread_id = threading.get_ident()
+        self.running = True
+        self.beat = time.perf_counter()
+        self.handle = self.loop.call_later(self.interval, self.tick)
+        self.watchdog = threading.Thread(target=self.watch, name='ccxt-loop-lag-monitor', daemon=True)
+        self.watchdog.start()
+
+    def stop(self):
+        self.running = False
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+
+    def tick(self):
+        now = time.perf_counter()
+        lag = now - self.beat - self.interval
+        if lag >= self.threshold:
+            calls = self.calls
+            self.report(lag, calls[1] if (calls is not None) and (calls[0] == self.beat) else [])
+        self.calls = None
+        self.beat = now
+        if self.running:
+            self.handle = self.loop.call_later(self.interval, self.tick)
+
+    def watch(self):
+        while self.running:
+            time.sleep(self.interval)
+            beat = self.beat
+            calls = self.calls
+            if ((calls is None) or (calls[0] != beat)) and (time.perf_counter() - beat - self.interval >= self.threshold):
+                frame = sys._current_frames().get(self.thread_id)
+                self.calls = [beat, exchange_calls(frame)]
+                del frame
+
+    def report(self, lag, calls):
+        stall = {
+            'timestamp': int(time.time() * 1000),
+            'lag': int(lag * 1000),
+            'calls': calls,
+        }
+        self.stalls.append(stall)
+        self.logger.warning('the event loop was blocked for %d ms by %s', stall['lag'], ' > '.join(calls) if calls else 'code outside the exchanges')
@@ -1,49 +1,123 @@
 import asyncio
-import collections
-from time import time
+import heapq
+import itertools
+from time import monotonic
+from ccxt.base.errors import RequestTimeout
 
 
 class Throttler:
-    def __init__(self, config, loop=None):
+    def __init__(self, config, loop=None, shared=None):
         self.loop = loop
+        # a ccxt.base.throttler.SharedThrottler that holds the tokens of the processes sharing the budget
+        self.shared = shared
         self.config = {
             'refillRate': 1.0,
             'delay': 0.001,
             'cost': 1.0,
             'tokens': 0,
             'maxCapacity': 2000,
+            'maxBacklog': 2000,
             'capacity': 1.0,
         }
         self.config.update(config)
-        self.queue = collections.deque()
+        # [priority, sequence, future, cost, deadline] heaps, lower priorities are released first, FIFO within a priority
+        self.queue = []
+        # up to maxBacklog requests over maxCapacity wait here for a place in the queue
+        self.backlog = []
+        self.sequence = itertools.count()
         self.running = False
+        self.last_timestamp = None
+
+    def refill(self):
+        now = monotonic() * 1000
+        elapsed = 0 if self.last_timestamp is None else now - self.last_timestamp
+        if elapsed > 0:
+            tokens = self.config['tokens']
+            # the refill stops at capacity, the initial tokens above it are kept until they are spent
+            self.config['tokens'] = min(tokens + elapsed * self.config['refillRate'], max(tokens, self.config['capacity']))
+        self.last_timestamp = now
+
+    def reconcile(self, tokens):
+        """Lowers the tokens in the bucket to the given number, if it holds more"""
+        if self.shared is not None:
+            return self.shared.reconcile(tokens)
+        self.refill()
+        self.config['tokens'] = min(self.config['tokens'], tokens)
+
+    def admit(self):
+        while self.backlog and len(self.queue) < self.config['maxCapacity']:
+            entry = heapq.heappop(self.backlog)
+            if not entry[2].done():
+                heapq.heappush(self.queue, entry)
 
     async def looper(self):
-        last_timestamp = time() * 1000
         while self.running:
-            future, cost = self.queue[0]
-            cost = self.config['cost'] if cost is None else cost
-            if self.config['tokens'] >= 0:
-                self.config['tokens'] -= cost
-                if not future.done():
-                    future.set_result(None)
-                self.queue.popleft()
-                # context switch
-                await asyncio.sleep(0)
-                if len(self.queue) == 0:
-                    self.running = False
+            priority, sequence, future, cost, deadline = self.queue[0]
+            if future.done():
+                # the caller is gone or its deadline has passed, its request is not sent and takes no tokens
+                heapq.heappop(self.queue)
+                self.admit()
+            elif self.shared is not None:
+                heapq.heappop(self.queue)
+                self.admit()
+                try:
+                    # the tokens are taken from the shared bucket right away, the wait is done here,
+                    # the loop is not blocked while another process holds the bucket
+                    delay = self.shared.try_reserve(cost, deadline)
+                    while (delay is None) and not future.done():
+                        await asyncio.sleep(self.config['delay'])
+                        delay = self.shared.try_reserve(cost, deadline)
+                except RequestTimeout as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if delay is not None:
+                        await asyncio.sleep(delay / 1000)
+                    if not future.done():
+                        future.set_result(None)
             else:
-                await asyncio.sleep(self.config['delay'])
-                now = time() * 1000
-                elapsed = now - last_timestamp
-                last_timestamp = now
-                self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+                self.refill()
+                tokens = self.config['tokens']
+                if tokens >= 0:
+                    self.config['tokens'] -= self.config['cost'] if cost is None else cost
+                    future.set_result(None)
+                    heapq.heappop(self.queue)
+                    self.admit()
+                    # context switch
+                    await asyncio.sleep(0)
+                else:
+                    # sleep once until the bucket is refilled instead of polling it
+                    await asyncio.sleep(-tokens / self.config['refillRate'] / 1000)
+            if len(self.queue) == 0:
+                self.admit()
+                self.running = len(self.queue) > 0
+
+    def expire(self, future):
+        if not future.done():
+            future.set_exception(RequestTimeout('throttle deadline exceeded before the request was sent'))
 
-    def __call__(self, cost=None):
+    def __call__(self, cost=None, priority=0, deadline=None):
+        """
+        Returns a future that is resolved when the request can be sent. The requests with a lower priority
+        are sent first. When a deadline is given, in milliseconds of the monotonic clock, the request is dropped
+        with a RequestTimeout if it is still queued by then. Up to maxBacklog callers over maxCapacity wait for
+        a place in the queue, the ones after them are rejected.
+        """
+        if len(self.queue) >= self.config['maxCapacity'] and len(self.backlog) >= self.config['maxBacklog']:
+            raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + ') and its backlog is over maxBacklog (' + str(int(self.config['maxBacklog'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
         future = asyncio.Future()
-        if len(self.queue) > self.config['maxCapacity']:
-            raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
-        self.queue.append((future, cost))
+        if deadline is not None:
+            delay = (deadline - monotonic() * 1000) / 1000
+            if delay <= 0:
+                self.expire(future)
+                return future
+            handle = (self.loop or asyncio.get_event_loop()).call_later(delay, self.expire, future)
+            future.add_done_callback(lambda _: handle.cancel())
+        entry = [0 if priority is None else priority, next(self.sequence), future, cost, deadline]
+        if len(self.queue) < self.config['maxCapacity']:
+            heapq.heappush(self.queue, entry)
+        else:
+            heapq.heappush(self.backlog, entry)
         if not self.running:
             self.running = True
             asyncio.ensure_future(self.looper(), loop=self.loop)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+"""Estimation of the offset of the clock of an exchange server from the samples of its time"""
+
+# -----------------------------------------------------------------------------
+
+import collections
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'ClockOffsetEstimator',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class ClockOffsetEstimator(object):
+    """
+    The NTP way: every sample is the local time when the request was sent, the time of the server in the response
+    and the local time when the response was received. The server time is assumed to be taken halfway through the
+    round trip, so the offset of a sample is off by half of the round trip at most, and by less when the request and
+    the response take the same time. The offset is the one of the sample with the shortest round trip among the last
+    ones, the uncertainty is half of that round trip.
+
+    The offset is the local time minus the server time in milliseconds, like options['timeDifference'].
+    """
+
+    def __init__(self, size=8):
+        self.samples = collections.deque(maxlen=size)  # [round trip, offset] of the last samples
+
+    def add(self, sent, server_time, received):
+        round_trip = received - sent
+        self.samples.append([round_trip, (sent + received) / 2 - server_time])
+
+    def best(self):
+        return min(self.samples, key=lambda sample: sample[0]) if self.samples else None
+
+    @property
+    def offset(self):
+        best = self.best()
+        return None if best is None else best[1]
+
+    @property
+    def uncertainty(self):
+        best = self.best()
+        return None if best is None else best[0] / 2
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+"""
+Faster implementations of the elliptic curve multiplication of the ecdsa signatures and of keccak, giving the same
+results as the pure Python static dependencies: coincurve for secp256k1 and pycryptodome for keccak when they are
+installed, the cryptography package otherwise, and a pure Python fallback with precomputed tables of the generator.
+"""
+
+# -----------------------------------------------------------------------------
+
+import time
+
+from cryptography.hazmat import backends
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from ccxt.static_dependencies import keccak
+
+# optional, libsecp256k1 multiplies the points of secp256k1 faster than openssl
+try:
+    import coincurve
+except ImportError:
+    coincurve = None
+
+# optional, pycryptodome hashes keccak in C
+try:
+    from Crypto.Hash import keccak as cryptodome_keccak
+except ImportError:
+    try:
+        from Cryptodome.Hash import keccak as cryptodome_keccak
+    except ImportError:
+        cryptodome_keccak = None
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'keccak_256',
+    'generator_multiply',
+    'get_ecdsa_backend',
+    'public_key',
+    'sign_digest_deterministic',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def keccak_256(data):
+    if cryptodome_keccak is not None:
+        return cryptodome_keccak.new(data=data, digest_bits=256).digest()
+    return bytes(keccak.SHA3(data))
+
+
+# -----------------------------------------------------------------------------
+# the points are (x, y) tuples in affine coordinates and (X, Y, Z) tuples in jacobian coordinates, None is the infinity
+
+
+def jacobian_double(point, p, a):
+    if point is None:
+        return None
+    x, y, z = point
+    if y == 0:
+        return None
+    yy = y * y % p
+    s = 4 * x * yy % p
+    m = (3 * x * x + a * pow(z, 4, p)) % p
+    x3 = (m * m - 2 * s) % p
+    return x3, (m * (s - x3) - 8 * yy * yy) % p, 2 * y * z % p
+
+
+def jacobian_add_affine(point, x2, y2, p, a):
+    if point is None:
+        return x2, y2, 1
+    x1, y1, z1 = point
+    zz = z1 * z1 % p
+    h = (x2 * zz - x1) % p
+    r = (y2 * z1 * zz - y1) % p
+    if h == 0:
+        return jacobian_double(point, p, a) if r == 0 else None
+    hh = h * h % p
+    hhh = h * hh % p
+    v = x1 * hh % p
+    x3 = (r * r - hhh - 2 * v) % p
+    return x3, (r * (v - x3) - y1 * hhh) % p, z1 * h % p
+
+
+def to_affine(point, p):
+    return batch_to_affine([point], p)[0]
+
+
+def batch_to_affine(points, p):
+    # one inversion for all the points (Montgomery's trick), p is prime, Fermat's little theorem gives the inverse
+    products = []
+    product = 1
+    for point in points:
+        product = product * point[2] % p
+        products.append(product)
+    inverse = pow(product, p - 2, p)
+    result = [None] * len(points)
+    for i in range(len(points) - 1, -1, -1):
+        x, y, z = points[i]
+        z_inverse = inverse * products[i - 1] % p if i > 0 else inverse
+        inverse = inverse * z % p
+        zz = z_inverse * z_inverse % p
+        result[i] = (x * zz % p, y * zz * z_inverse % p)
+    return result
+
+
+window = 4  # the bits of the scalar added in one step
+tables = {}  # the curve name → table[i][j] = j * 2 ** (window * i) * G in affine coordinates
+
+
+def generator_table(curve):
+    table = tables.get(curve.name)
+    if table is None:
+        p = curve.curve.p()
+        a = curve.curve.a()
+        base = (curve.generator.x(), curve.generator.y())
+        table = []
+        for _ in range((curve.order.bit_length() + window - 1) // window):
+            points = [(base[0], base[1], 1)]
+            for _ in range(2, 1 << window):
+                points.append(jacobian_add_affine(points[-1], base[0], base[1], p, a))
+            # the base of the next row is 2 ** window times the base of this one
+            point = points[0]
+            for _ in range(window):
+                point = jacobian_double(point, p, a)
+            points.append(point)
+            points = batch_to_affine(points, p)
+            table.append([None] + points[:-1])
+            base = points[-1]
+        tables[curve.name] = table
+    return table
+
+
+def python_multiply(curve, k):
+    # one addition per window of the scalar and no doubling, the doublings are in the table
+    table = generator_table(curve)
+    p = curve.curve.p()
+    a = curve.curve.a()
+    mask = (1 << window) - 1
+    point = None
+    i = 0
+    while k:
+        digit = k & mask
+        if digit:
+            x, y = table[i][digit]
+            point = jacobian_add_affine(point, x, y, p, a)
+        k >>= window
+        i += 1
+    return to_affine(point, p)
+
+
+cryptography_curves = {
+    'NIST192p': ec.SECP192R1(),
+    'NIST224p': ec.SECP224R1(),
+    'NIST256p': ec.SECP256R1(),
+    'NIST384p': ec.SECP384R1(),
+    'NIST521p': ec.SECP521R1(),
+    'SECP256k1': ec.SECP256K1(),
+}
+
+
+def cryptography_multiply(curve, k):
+    # the public key of the private key k is k * G
+    numbers = ec.derive_private_key(k, cryptography_curves[curve.name], backends.default_backend()).public_key().public_numbers()
+    return numbers.x, numbers.y
+
+
+def coincurve_multiply(curve, k):
+    from ccxt.static_dependencies.ecdsa.util import number_to_string
+    return coincurve.PublicKey.from_secret(number_to_string(k, curve.order)).point()
+
+
+def ecdsa_multiply(curve, k):
+    point = curve.generator * k
+    return point.x(), point.y()
+
+
+multipliers = {}  # the curve name → [the name of the backend, its multiplication]
+
+
+def get_multiplier(curve):
+    multiplier = multipliers.get(curve.name)
+    if multiplier is None:
+        candidates = [['python', python_multiply]]
+        if curve.name in cryptography_curves:
+            candidates.append(['cryptography', cryptography_multiply])
+        if (coincurve is not None) and (curve.name == 'SECP256k1'):
+            candidates.append(['coincurve', coincurve_multiply])
+        # the backends that give the points of the static ecdsa module are timed, the fastest one is used
+        scalars = [curve.order // 3, curve.order // 7 * 5]
+        expected = [ecdsa_multiply(curve, k) for k in scalars]
+        multiplier = ['ecdsa', ecdsa_multiply]
+        fastest = None
+        for candidate in candidates:
+            try:
+                # the first calls build the tables
+                if [tuple(candidate[1](curve, k)) for k in scalars] != expected:
+                    continue
+                started = time.perf_counter()
+                for k in scalars * 4:
+                    candidate[1](curve, k)
+                elapsed = time.perf_counter() - started
+            except Exception:
+                continue
+            if (fastest is None) or (elapsed < fastest):
+                multiplier = candidate
+                fastest = elapsed
+        multipliers[curve.name] = multiplier
+    return multiplier
+
+
+def get_ecdsa_backend(curve):
+    """Returns the name of the backend multiplying the points of the curve"""
+    return get_multiplier(curve)[0]
+
+
+def generator_multiply(curve, k):
+    return get_multiplier(curve)[1](curve, k)
+
+
+def public_key(curve, secexp):
+    """The public key of a secret exponent as the bytes of x and y, like VerifyingKey.to_string()"""
+    from ccxt.static_dependencies.ecdsa.util import number_to_string
+    x, y = generator_multiply(curve, secexp)
+    return number_to_string(x, curve.order) + number_to_string(y, curve.order)
+
+
+def sign_digest_deterministic(curve, secexp, digest, hashfunc, extra_entropy=b''):
+    """
+    SigningKey.sign_digest_deterministic() of the static ecdsa module with the faster multiplication: k is generated
+    the same way (RFC 6979), the signature is computed with the same formulas and returned as r, s and the recovery
+    parameter, not canonized.
+    """
+    # the static ecdsa module is imported by the first signature, not by `import ccxt`, like the curves passed here
+    from ccxt.static_dependencies import ecdsa
+    from ccxt.static_dependencies.ecdsa import rfc6979
+    from ccxt.static_dependencies.ecdsa.util import string_to_number
+    if len(digest) > curve.baselen:
+        raise ecdsa.BadDigestError('this curve (%s) is too short for your digest (%d)' % (curve.name, 8 * len(digest)))
+    order = curve.order
+    number = string_to_number(digest)
+    retry_gen = 0
+    while True:
+        k = rfc6979.generate_k(order, secexp, hashfunc, digest, retry_gen=retry_gen, extra_entropy=extra_entropy) % order
+        x, y = generator_multiply(curve, k)
+        r = x % order
+        # the order is prime, Fermat's little theorem gives the inverse
+        s = pow(k, order - 2, order) * (number + (secexp * r) % order) % order
+        if (r != 0) and (s != 0):
+            return r, s, y % 2 or (2 if x == k else 0)
+        retry_gen += 1
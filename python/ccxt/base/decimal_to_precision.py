@@ -2,6 +2,13 @@ import decimal
 import numbers
 import itertools
 import re
+from functools import lru_cache
+
+# optional, used to format float64 arrays in bulk
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 __all__ = [
     'TRUNCATE',
@@ -14,6 +21,9 @@ __all__ = [
     'NO_PADDING',
     'PAD_WITH_ZERO',
     'decimal_to_precision',
+    'decimals_to_precision',
+    'precision_plan',
+    'PrecisionPlan',
 ]
 
 
@@ -162,6 +172,154 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
             return precise
 
 
+class PrecisionPlan:
+    """
+    Formats numbers the same way as decimal_to_precision() with the arguments validated and the
+    rounding context, the quantizer and the tick size parsed once, for formatting many numbers
+    with the precision of the same market, see decimals_to_precision()
+    """
+
+    def __init__(self, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+        assert precision is not None
+        if counting_mode == TICK_SIZE:
+            assert(isinstance(precision, float) or isinstance(precision, decimal.Decimal) or isinstance(precision, numbers.Integral))
+        else:
+            assert(isinstance(precision, numbers.Integral))
+        assert rounding_mode in [TRUNCATE, ROUND]
+        assert counting_mode in [DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE]
+        assert padding_mode in [NO_PADDING, PAD_WITH_ZERO]
+        self.rounding_mode = rounding_mode
+        self.precision = precision
+        self.counting_mode = counting_mode
+        self.padding_mode = padding_mode
+        # a private copy of the context decimal_to_precision() sets up on every call
+        self.context = decimal.getcontext().copy()
+        self.context.traps[decimal.Underflow] = True
+        self.context.rounding = decimal.ROUND_HALF_UP
+        # the number of decimal places the values are rounded to, when the plan has a fast path
+        self.decimals = None
+        self.tick = None
+        self.tick_plan = None
+        if counting_mode == DECIMAL_PLACES:
+            if precision >= 0:
+                self.decimals = min(self.context.prec - 2, precision)
+                self.quantizer = decimal.Decimal('10') ** (-self.decimals)
+        elif counting_mode == TICK_SIZE and precision > 0:
+            self.tick = decimal.Decimal(str(precision))
+            self.half_tick = precision / 2
+            parts = re.sub(r'0+$', '', '{:f}'.format(self.tick)).split('.')
+            if len(parts) > 1:
+                new_precision = len(parts[1])
+            else:
+                match = re.search(r'0+$', parts[0])
+                new_precision = 0 if match is None else -len(match.group(0))
+            self.tick_plan = precision_plan(ROUND, new_precision, DECIMAL_PLACES, padding_mode)
+            if self.tick == decimal.Decimal('10') ** (-new_precision):
+                # rounding to a tick size of 10^-n is rounding to n decimal places
+                self.decimals = self.tick_plan.decimals
+
+    def __call__(self, n):
+        if self.tick is not None:
+            return self.format_tick_size(n)
+        elif self.decimals is None:
+            return decimal_to_precision(n, self.rounding_mode, self.precision, self.counting_mode, self.padding_mode)
+        elif self.rounding_mode == ROUND:
+            precise = '{:f}'.format(decimal.Decimal(str(n)).quantize(self.quantizer, context=self.context))
+            if precise == '-0':
+                precise = '0'
+        else:
+            string = '{:f}'.format(decimal.Decimal(str(n)))
+            before, after = string.split('.') if '.' in string else (string, '')
+            precise = before + '.' + after[:self.decimals]
+            if precise == '-0.':
+                precise = '0.'
+            precise = precise.rstrip('.')
+        if self.padding_mode == NO_PADDING:
+            return precise.rstrip('0').rstrip('.') if '.' in precise else precise
+        elif '.' in precise:
+            before, after = precise.split('.')
+            return before + '.' + after.ljust(self.decimals, '0')
+        elif self.decimals > 0:
+            return precise + '.' + self.decimals * '0'
+        return precise
+
+    def format_tick_size(self, n):
+        dec = decimal.Decimal(str(n))
+        tick = self.tick
+        # python modulo with negative numbers behaves different than js/php, so use abs first
+        missing = abs(dec) % tick
+        if missing != 0:
+            if self.rounding_mode == ROUND:
+                if dec > 0:
+                    dec = dec - missing + tick if missing >= self.half_tick else dec - missing
+                else:
+                    dec = dec + missing - tick if missing >= self.half_tick else dec + missing
+            elif dec < 0:
+                dec = dec + missing
+            else:
+                dec = dec - missing
+        return self.tick_plan('{:f}'.format(dec))
+
+    def format_many(self, values):
+        if (numpy is not None) and isinstance(values, numpy.ndarray):
+            return self.format_array(values)
+        return [self(value) for value in values]
+
+    def format_array(self, values):
+        # rounds float64 arrays to the plan decimals in bulk, the few values that can't be
+        # resolved exactly in binary floating point go through the decimal path one by one
+        values = values.ravel()
+        decimals = self.decimals
+        if (decimals is None) or (decimals > 15) or (values.dtype != numpy.float64):
+            return [self(value) for value in values.tolist()]
+        with numpy.errstate(invalid='ignore', over='ignore'):
+            scale = 10.0 ** decimals
+            scaled = values * scale
+            nearest = numpy.rint(scaled)
+            # values that are exactly n / 10^decimals are printed by repr() with at most that many decimals
+            exact = (nearest / scale) == values
+            magnitude = numpy.abs(scaled)
+            tolerance = magnitude * 2e-15
+            if self.rounding_mode == ROUND:
+                rounded = numpy.copysign(numpy.floor(magnitude + 0.5), scaled)
+                boundary = numpy.abs(magnitude - numpy.floor(magnitude) - 0.5)
+            else:
+                rounded = numpy.trunc(scaled)
+                boundary = numpy.abs(scaled - nearest)
+            rounded = numpy.where(exact, nearest, rounded)
+            fast = numpy.isfinite(scaled) & (magnitude < 2 ** 52) & (rounded != 0) & (exact | (boundary > tolerance))
+            # the non-finite and the too large values are cast as zeros and go through the scalar path
+            integers = numpy.where(fast, rounded, 0.0).astype(numpy.int64).tolist()
+        result = []
+        for value, integer, is_fast in zip(values.tolist(), integers, fast.tolist()):
+            result.append(self.format_integer(integer) if is_fast else self(value))
+        return result
+
+    def format_integer(self, integer):
+        # formats integer * 10^-decimals
+        decimals = self.decimals
+        sign = '-' if integer < 0 else ''
+        digits = str(abs(integer))
+        if decimals == 0:
+            return sign + digits
+        digits = digits.rjust(decimals + 1, '0')
+        before, after = digits[:-decimals], digits[-decimals:]
+        if self.padding_mode == NO_PADDING:
+            after = after.rstrip('0')
+            return sign + before + '.' + after if after else sign + before
+        return sign + before + '.' + after
+
+
+@lru_cache(maxsize=1024, typed=True)
+def precision_plan(rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    return PrecisionPlan(rounding_mode, precision, counting_mode, padding_mode)
+
+
+def decimals_to_precision(values, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    """Returns the list of the values formatted by decimal_to_precision(), numpy float64 arrays are formatted in bulk"""
+    return precision_plan(rounding_mode, precision, counting_mode, padding_mode).format_many(values)
+
+
 def number_to_string(x):
     # avoids scientific notation for too large and too small numbers
     if x is None:
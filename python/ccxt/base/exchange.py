@@ -27,7 +27,16 @@ from ccxt.base.errors import RateLimitExceeded
 from ccxt.base.decimal_to_precision import decimal_to_precision
 from ccxt.base.decimal_to_precision import DECIMAL_PLACES, TICK_SIZE, NO_PADDING, TRUNCATE, ROUND, ROUND_UP, ROUND_DOWN
 from ccxt.base.decimal_to_precision import number_to_string
+from ccxt.base.decimal_to_precision import decimals_to_precision
 from ccxt.base.precise import Precise
+from ccxt.base.ohlcv import OHLCVColumns
+from ccxt.base.json_codec import get_json_codec
+from ccxt.base.throttler import Throttler, SharedThrottler
+from ccxt.base.nonce import NonceGenerator, SharedNonceGenerator
+from ccxt.base.signing import SigningContext
+from ccxt.base.crypto_backends import keccak_256, public_key, sign_digest_deterministic
+from ccxt.base.metrics import Metrics, request_metrics, unified_call
+from ccxt.base.fixtures import Fixture, FixtureSession
 
 # -----------------------------------------------------------------------------
 
@@ -39,10 +48,6 @@ from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
 # -----------------------------------------------------------------------------
 
-# ecdsa signing
-from ccxt.static_dependencies import ecdsa
-from ccxt.static_dependencies import keccak
-
 # eddsa signing
 try:
     import axolotl_curve25519 as eddsa
@@ -59,22 +64,28 @@ __all__ = [
 
 import types
 import logging
+from array import array
 import base64
 import binascii
 import calendar
 import collections
+import contextvars
+import copy
 import datetime
 from email.utils import parsedate
 import functools
 import gzip
 import hashlib
 import hmac
+import inspect
 import io
 import json
 import math
+import os
 import random
 from numbers import Number
 import re
+import tempfile
 from requests import Session
 from requests.utils import default_user_agent
 from requests.exceptions import HTTPError, Timeout, TooManyRedirects, RequestException, ConnectionError as requestsConnectionError
@@ -91,6 +102,15 @@ import urllib.parse as _urlencode
 
 # -----------------------------------------------------------------------------
 
+path_delimiters = re.compile('[^a-zA-Z0-9]')
+camelcase_exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
+markets_cache_version = 1  # bump when the layout of the markets cache files changes
+# the implicit api method call in progress, read by throttle(), see call_implicit_api()
+implicit_api_call = contextvars.ContextVar('implicit_api_call', default=None)
+shared_market_properties = ['markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'codes', 'baseCurrencies', 'quoteCurrencies']
+
+# -----------------------------------------------------------------------------
+
 
 class Exchange(object):
     """Base exchange class"""
@@ -103,6 +123,19 @@ class Exchange(object):
     # rate limiter settings
     enableRateLimit = True
     rateLimit = 2000  # milliseconds = seconds * 1000
+    # the queued requests with a lower priority are sent first, see calculate_rate_limiter_priority()
+    requestPriorities = {
+        'trading': 0,  # private requests other than GET: placing and canceling orders, withdrawals
+        'account': 1,  # private GET requests: balances, orders, positions
+        'market': 2,  # public requests: markets, tickers, order books, candles
+    }
+    # named limits reconciled with the usage reported in the response headers, see on_rate_limit_headers()
+    rateLimitHeaders = {}
+    sharedRateLimitPath = None  # a directory for the token buckets shared by the processes of the machine, disabled by default
+    monotonicNonce = False  # the nonces of the instances with the same id and api key are strictly increasing
+    sharedNoncePath = None  # a directory for the last nonces persisted across restarts and shared by the processes of the machine
+    nonce_generators = {}  # (id, apiKey, sharedNoncePath) → the NonceGenerator shared by all instances in the process
+    enableMetrics = False  # per endpoint counters and latency histograms of the requests in self.metrics, see ccxt.base.metrics
     timeout = 10000   # milliseconds = seconds * 1000
     asyncio_loop = None
     aiohttp_proxy = None
@@ -121,9 +154,27 @@ class Exchange(object):
     }
     verbose = False
     markets = None
+    shareMarkets = False  # attach to the markets loaded by another instance of the same exchange
+    shared_markets = {}  # (id, sandbox, options) → markets and currencies shared by all instances in the process
+    sharedMarketsOptions = ['defaultType', 'defaultSubType', 'fetchMarkets', 'fetchMarketsMethod']  # the options that change the loaded markets
+    marketsCachePath = None  # a directory to persist the loaded markets and currencies in, disabled by default
+    marketsCacheTTL = 86400000  # milliseconds = seconds * 1000, the age after which the cached markets are reloaded
+    fixturePath = None  # a file to record the HTTP responses into or to replay them from, see ccxt.base.fixtures
+    fixtureMode = 'replay'  # 'record' sends the requests and records their responses, 'replay' answers them from the file
+    fixtureIgnoredParams = [  # the params left out of the matching of the requests, case-insensitive
+        'nonce', 'tonce', 'timestamp', 'ts',
+        'signature', 'sign', 'sig',
+        'apikey', 'api_key', 'key', 'accesskey', 'access_key', 'accesskeyid',
+        'clientorderid', 'newclientorderid', 'clordid', 'client_oid',
+    ]
     symbols = None
     codes = None
     timeframes = None
+    columnarOHLCV = False  # return candles as OHLCVColumns instead of lists of rows
+    keepOrderBooks = False  # parse_order_book resets the OrderBook kept in exchange.kept_orderbooks[symbol] in place
+    paginationLimit = 1000  # the limit of every request issued by paginate()
+    paginationConcurrency = 4  # the number of windows the async paginate() fetches at the same time
+    paginationBuffer = 2  # the number of pages each window of the async paginate() fetches ahead of the consumer
     fees = {
         'trading': {
             'percentage': True,  # subclasses should rarely have to redefine this
@@ -159,6 +210,7 @@ class Exchange(object):
     token = ''  # reserved for HTTP auth in some cases
     twofa = None
     markets_by_id = None
+    markets_index = None  # secondary market id lookups built from markets_by_id on the first miss of safe_market
     currencies_by_id = None
     precision = None
     exceptions = None
@@ -335,6 +387,8 @@ class Exchange(object):
     minFundingAddressLength = 1  # used in check_address
     substituteCommonCurrencyCodes = True
     quoteJsonNumbers = True
+    jsonCodec = None  # 'orjson', 'ujson' or 'json' to decode the responses with, the fastest installed one by default
+    json_backend = get_json_codec()  # the codec of Exchange.json(), all of them encode the same way
     number = float  # or str (a pointer to a class)
     handleContentTypeApplicationZip = False
     # whether fees should be summed by currency code
@@ -384,6 +438,7 @@ class Exchange(object):
         self.options = dict() if self.options is None else self.options  # Python does not allow to define properties in run-time with setattr
         self.decimal_to_precision = decimal_to_precision
         self.number_to_string = number_to_string
+        self.decimals_to_precision = decimals_to_precision
 
         # version = '.'.join(map(str, sys.version_info[:3]))
         # self.userAgent = {
@@ -401,25 +456,51 @@ class Exchange(object):
             else:
                 setattr(self, key, settings[key])
 
+        cls = type(self)
+
         if self.api:
-            self.define_rest_api(self.api, 'request')
+            # the implicit api methods are attached to the class, so they only have to be generated
+            # once per exchange class, an api definition given in the config is attached to this instance only
+            if 'api' in config:
+                self.define_rest_api(self.api, 'request', [], self)
+            elif not cls.__dict__.get('_rest_api_defined'):
+                self.define_rest_api(self.api, 'request')
+                cls._rest_api_defined = True
+
+        # the instance attribute resolves the ids that are not in markets_by_id with the markets index first
+        self.safe_market = functools.partial(self.indexed_safe_market, self.safe_market)
 
         if self.markets:
             self.set_markets(self.markets)
 
         # convert all properties from underscore notation foo_bar to camelcase notation fooBar
-        cls = type(self)
-        for name in dir(self):
-            if name[0] != '_' and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
-                exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
-                camelcase = parts[0] + ''.join(exceptions.get(i, self.capitalize(i)) for i in parts[1:])
-                attr = getattr(self, name)
-                if isinstance(attr, types.MethodType):
-                    setattr(cls, camelcase, getattr(cls, name))
-                else:
-                    setattr(self, camelcase, attr)
+        if '_camelcase_properties' not in cls.__dict__:
+            cls._camelcase_properties = self.define_camelcase_methods()
+        for name in cls._camelcase_properties + [name for name in self.__dict__ if Exchange.is_underscore_name(name)]:
+            setattr(self, Exchange.underscore_to_camelcase(name), getattr(self, name))
+
+        self.json_backend = get_json_codec(self.jsonCodec)
+
+        # the instance attributes sign with the state prepared from the secrets of this instance
+        self.signing_contexts = {}
+        self.signing_credentials = None
+        for name in ['hmac', 'jwt', 'rsa', 'ecdsa', 'eddsa']:
+            if getattr(cls, name) is getattr(Exchange, name):
+                setattr(self, name, getattr(self, 'prepared_' + name))
+
+        if self.columnarOHLCV:
+            self.init_columnar_ohlcv()
+
+        if self.keepOrderBooks:
+            self.init_kept_order_books()
+
+        if self.monotonicNonce or (self.sharedNoncePath is not None):
+            # the instance attribute wraps the nonce() of the exchange class or the one given in the config, used by sign()
+            self.nonce = functools.partial(self.next_nonce, self.nonce)
+
+        self.metrics = None
+        if self.enableMetrics:
+            self.init_metrics()
 
         self.tokenBucket = self.extend({
             'refillRate': 1.0 / self.rateLimit if self.rateLimit > 0 else float('inf'),
@@ -427,10 +508,14 @@ class Exchange(object):
             'capacity': 1.0,
             'defaultCost': 1.0,
         }, getattr(self, 'tokenBucket', {}))
+        self.init_rest_rate_limiter()
 
         if not self.session and self.synchronous:
             self.session = Session()
             self.session.trust_env = self.requests_trust_env
+        self.fixture = None
+        if self.fixturePath is not None:
+            self.init_fixture()
         self.logger = self.logger if self.logger else logging.getLogger(__name__)
 
     def __del__(self):
@@ -460,10 +545,43 @@ class Exchange(object):
             self.urls['api'] = self.urls['apiBackup']
             del self.urls['apiBackup']
 
-    def define_rest_api_endpoint(self, method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, config={}):
+    @staticmethod
+    def is_underscore_name(name):
+        return name[0] != '_' and name[-1] != '_' and '_' in name
+
+    @staticmethod
+    def underscore_to_camelcase(name):
+        parts = name.split('_')
+        # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
+        return parts[0] + ''.join(camelcase_exceptions.get(i, Exchange.capitalize(i)) for i in parts[1:])
+
+    def define_camelcase_methods(self):
+        """
+        Aliases the underscore methods of the class with camelcase names on the class itself
+        and returns the names of the remaining underscore properties that are aliased per instance
+        """
+        cls = type(self)
+        properties = []
+        for name in dir(self):
+            if name in self.__dict__ or not Exchange.is_underscore_name(name):
+                continue
+            camelcase = Exchange.underscore_to_camelcase(name)
+            attr = getattr(self, name)
+            if isinstance(attr, types.MethodType):
+                setattr(cls, camelcase, getattr(cls, name))
+            else:
+                # getattr() unwraps static methods, fetch the descriptor itself to keep it static
+                static = next((klass.__dict__[name] for klass in cls.__mro__ if name in klass.__dict__), None)
+                if isinstance(static, staticmethod):
+                    setattr(cls, camelcase, static)
+                else:
+                    properties.append(name)
+        return properties
+
+    def define_rest_api_endpoint(self, method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, config={}, instance=None):
         cls = type(self)
         entry = getattr(cls, method_name)  # returns a function (instead of a bound method)
-        delimiters = re.compile('[^a-zA-Z0-9]')
+        delimiters = path_delimiters
         split_path = delimiters.split(path)
         lowercase_path = [x.strip().lower() for x in split_path]
         camelcase_suffix = ''.join([Exchange.capitalize(x) for x in split_path])
@@ -496,43 +614,295 @@ class Exchange(object):
                 if params is not None:
                     inner_kwargs['params'] = params
                 if context is not None:
-                    inner_kwargs['context'] = params
-                return entry(_self, **inner_kwargs)
+                    inner_kwargs['context'] = context
+                return _self.call_implicit_api(entry, inner_kwargs)
             return inner
         to_bind = partialer()
-        setattr(cls, camelcase, to_bind)
-        setattr(cls, underscore, to_bind)
+        if instance is None:
+            setattr(cls, camelcase, to_bind)
+            setattr(cls, underscore, to_bind)
+        else:
+            bound = types.MethodType(to_bind, instance)
+            setattr(instance, camelcase, bound)
+            setattr(instance, underscore, bound)
+
+    def call_implicit_api(self, entry, kwargs):
+        token = self.enter_implicit_api_call(kwargs)
+        try:
+            return entry(self, **kwargs)
+        finally:
+            implicit_api_call.reset(token)
+
+    def enter_implicit_api_call(self, kwargs):
+        # the rate limiter params are taken out of the request params, throttle() reads them from the call in progress
+        params = kwargs.get('params', {})
+        kwargs['params'] = self.omit_rate_limiter_params(params)
+        return implicit_api_call.set({
+            'path': kwargs['path'],
+            'api': kwargs['api'],
+            'method': kwargs['method'],
+            'params': params,
+            'config': kwargs['config'],
+            'context': kwargs.get('context', {}),
+        })
 
-    def define_rest_api(self, api, method_name, paths=[]):
+    def define_rest_api(self, api, method_name, paths=[], instance=None):
+        # the generated methods are attached to the class, or to the given instance only
         for key, value in api.items():
             uppercase_method = key.upper()
             lowercase_method = key.lower()
             camelcase_method = lowercase_method.capitalize()
             if isinstance(value, list):
                 for path in value:
-                    self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths)
+                    self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, {}, instance)
             # the options HTTP method conflicts with the 'options' API url path
             # elif re.search(r'^(?:get|post|put|delete|options|head|patch)$', key, re.IGNORECASE) is not None:
             elif re.search(r'^(?:get|post|put|delete|head|patch)$', key, re.IGNORECASE) is not None:
                 for [endpoint, config] in value.items():
                     path = endpoint.strip()
                     if isinstance(config, dict):
-                        self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, config)
+                        self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, config, instance)
                     elif isinstance(config, Number):
-                        self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, {'cost': config})
+                        self.define_rest_api_endpoint(method_name, uppercase_method, lowercase_method, camelcase_method, path, paths, {'cost': config}, instance)
                     else:
                         raise NotSupported(self.id + ' define_rest_api() API format not supported, API leafs must strings, objects or numbers')
             else:
-                self.define_rest_api(value, method_name, paths + [key])
+                self.define_rest_api(value, method_name, paths + [key], instance)
+
+    def init_rest_rate_limiter(self):
+        # self.throttler(cost, priority, deadline) blocks until the request of the given cost fits into the token bucket
+        self.throttler = self.init_shared_throttler() or Throttler(self.tokenBucket)
+        self.rate_limit_buckets = self.init_rate_limit_buckets(Throttler)
+
+    def init_shared_throttler(self):
+        # the processes throttling the same exchange id and api host share one token bucket
+        if self.sharedRateLimitPath is None:
+            return None
+        url = self.urls.get('api') if self.urls else None
+        while isinstance(url, dict):
+            url = next(iter(url.values()), None)
+        host = _urlencode.urlparse(self.implode_hostname(url)).netloc if isinstance(url, str) else ''
+        os.makedirs(self.sharedRateLimitPath, exist_ok=True)
+        path = os.path.join(self.sharedRateLimitPath, self.id + '-' + host.replace(':', '-') + '.bucket')
+        return SharedThrottler(self.tokenBucket, path)
+
+    def next_nonce(self, nonce):
+        return self.nonce_generator()(nonce())
+
+    def nonce_generator(self):
+        # one generator per credential set, looked up on every call, the api key can be set after the instance is created
+        key = (self.id, self.apiKey, self.sharedNoncePath)
+        generator = Exchange.nonce_generators.get(key)
+        if generator is None:
+            if self.sharedNoncePath is None:
+                generator = NonceGenerator()
+            else:
+                os.makedirs(self.sharedNoncePath, exist_ok=True)
+                # the api key is not written in the name of the file
+                digest = hashlib.sha256(str(self.apiKey).encode()).hexdigest()[:16]
+                generator = SharedNonceGenerator(os.path.join(self.sharedNoncePath, self.id + '-' + digest + '.nonce'))
+            generator = Exchange.nonce_generators.setdefault(key, generator)
+        return generator
+
+    def init_fixture(self):
+        self.fixture = Fixture(self.fixturePath, self.fixtureMode, self.fixtureIgnoredParams)
+        if self.fixtureMode == 'replay':
+            # the recorded responses are served at full speed
+            self.enableRateLimit = False
+        if self.synchronous:
+            self.session = FixtureSession(self.session, self.fixture)
+
+    def init_metrics(self):
+        self.metrics = Metrics()
+        self.metrics_endpoints = {}  # (api, method, path) → the name of the implicit method
+        # the instance attributes wrap the decoding of the responses and the unified methods to measure them
+        self.fetch2 = functools.partial(self.measure_fetch2, self.fetch2)
+        self.parse_json = functools.partial(self.measure_decode, self.parse_json)
+        cls = type(self)
+        if '_unified_methods' not in cls.__dict__:
+            cls._unified_methods = [name for name in dir(cls) if Exchange.is_underscore_name(name) and (Exchange.underscore_to_camelcase(name) in self.has)]
+        for name in cls._unified_methods:
+            method = getattr(self, name)
+            if self.has.get(Exchange.underscore_to_camelcase(name)) and (inspect.iscoroutinefunction(method) != self.synchronous):
+                measured = functools.partial(self.measure_unified, method)
+                setattr(self, name, measured)
+                setattr(self, Exchange.underscore_to_camelcase(name), measured)
+
+    def metrics_endpoint(self, path, api, method):
+        # the name of the implicit method, as in define_rest_api_endpoint()
+        key = (tuple(api) if isinstance(api, list) else api, method, path)
+        endpoint = self.metrics_endpoints.get(key)
+        if endpoint is None:
+            paths = api if isinstance(api, list) else [api]
+            prefix = paths[0] + ''.join([Exchange.capitalize(x) for x in paths[1:]])
+            suffix = ''.join([Exchange.capitalize(x) for x in path_delimiters.split(path)])
+            endpoint = prefix + method.lower().capitalize() + Exchange.capitalize(suffix)
+            self.metrics_endpoints[key] = endpoint
+        return endpoint
+
+    def measure_fetch2(self, fetch2, path, api='public', method='GET', params={}, headers=None, body=None, config={}, context={}):
+        # throttle() and fetch() mark the end of the throttle and sign phases of the request in progress
+        endpoint = self.metrics_endpoint(path, api, method)
+        response_metrics = self.start_request_metrics()
+        token = request_metrics.set(response_metrics)
+        try:
+            response = fetch2(path, api, method, params, headers, body, config, context)
+        except Exception as e:
+            self.metrics.record_error(endpoint, e)
+            raise
+        finally:
+            request_metrics.reset(token)
+        self.record_request_metrics(endpoint, response_metrics)
+        return response
+
+    @staticmethod
+    def start_request_metrics():
+        started = time.perf_counter()
+        return {'started': started, 'throttled': started, 'signed': started, 'sent': 0, 'decode': 0.0, 'received': 0}
+
+    @staticmethod
+    def mark_request_metrics(phase, sent=0):
+        response_metrics = request_metrics.get()
+        if response_metrics is not None:
+            response_metrics[phase] = time.perf_counter()
+            response_metrics['sent'] += sent
+
+    def record_request_metrics(self, endpoint, response_metrics):
+        fetched = time.perf_counter()
+        decode = response_metrics['decode']
+        throttled = response_metrics['throttled']
+        signed = max(response_metrics['signed'], throttled)
+        self.metrics.record(endpoint, {
+            'throttle': (throttled - response_metrics['started']) * 1000,
+            'sign': (signed - throttled) * 1000,
+            'network': (fetched - signed) * 1000 - decode,
+            'decode': decode,
+        }, response_metrics['sent'], response_metrics['received'])
+        call = unified_call.get()
+        if call is not None:
+            call[0] = endpoint
+            call[1] = fetched
+
+    def measure_decode(self, parse_json, http_response):
+        started = time.perf_counter()
+        result = parse_json(http_response)
+        self.record_decode_metrics(started, http_response)
+        return result
+
+    def record_decode_metrics(self, started, http_response):
+        response_metrics = request_metrics.get()
+        if response_metrics is not None:
+            response_metrics['decode'] += (time.perf_counter() - started) * 1000
+            response_metrics['received'] += len(http_response) if http_response else 0
+
+    def measure_unified(self, method, *args, **kwargs):
+        # parse is the time from the last response of the method to its return
+        call = [None, 0]
+        token = unified_call.set(call)
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            unified_call.reset(token)
+        if call[0] is not None:
+            self.metrics.record_parse(call[0], (time.perf_counter() - call[1]) * 1000)
+        return result
+
+    def init_rate_limit_buckets(self, throttler):
+        # a token bucket per named limit, holding the part of the limit that can be used before its threshold
+        buckets = {}
+        for name, limit in self.rateLimitHeaders.items():
+            allowance = limit['limit'] * limit.get('threshold', 0.9)
+            buckets[name] = throttler({
+                'refillRate': limit['limit'] / limit['interval'],
+                'capacity': allowance,
+                'tokens': allowance,
+            })
+        return buckets
+
+    def rate_limit_bucket_costs(self, method, cost):
+        # the named buckets the request counts against, with its cost in each of them
+        result = []
+        for name, limit in self.rateLimitHeaders.items():
+            methods = limit.get('methods')
+            if methods is None or method in methods:
+                result.append([self.rate_limit_buckets[name], limit.get('cost', cost)])
+        return result
+
+    def on_rate_limit_headers(self, http_status_code, headers):
+        """
+        Reconciles the token buckets with the usage reported by the exchange in the response headers,
+        a limit is configured in rateLimitHeaders as
+            {'header': 'X-MBX-USED-WEIGHT-1M', 'limit': 1200, 'interval': 60000}
+        with the optional 'type' ('used' or 'remaining'), 'threshold' (0.9 of the limit by default), 'cost' and
+        'methods' (the HTTP methods counted against the limit, all of them by default). A 418 or a 429 response
+        with a Retry-After header pauses all the buckets for that many seconds. Subclasses can override it.
+        """
+        if not self.enableRateLimit:
+            return
+        retry = http_status_code == 418 or http_status_code == 429
+        if not self.rateLimitHeaders and not retry:
+            return
+        headers = dict((key.lower(), value) for key, value in headers.items())
+        for name, limit in self.rateLimitHeaders.items():
+            value = self.safe_number(headers, limit['header'].lower())
+            if value is None:
+                continue
+            used = limit['limit'] - value if limit.get('type') == 'remaining' else value
+            self.rate_limit_buckets[name].reconcile(limit['limit'] * limit.get('threshold', 0.9) - used)
+        retry_after = self.safe_number(headers, 'retry-after') if retry else None
+        if retry_after is not None:
+            for throttle in [self.throttler] + list(self.rate_limit_buckets.values()):
+                refill_rate = throttle.config['refillRate']
+                if refill_rate != float('inf'):
+                    throttle.reconcile(-retry_after * 1000 * refill_rate)
+
+    def calculate_rate_limiter_priority(self, api, method, path, params, config={}, context={}):
+        # params['requestPriority'] overrides the priority of the endpoint config, the default is guessed from the api
+        priority = self.safe_value(params, 'requestPriority', self.safe_value(context, 'priority', self.safe_value(config, 'priority')))
+        if priority is None:
+            if self.is_public_api(api):
+                priority = 'market'
+            elif method == 'GET':
+                priority = 'account'
+            else:
+                priority = 'trading'
+        return self.requestPriorities[priority] if isinstance(priority, str) else priority
+
+    @staticmethod
+    def is_public_api(api):
+        # a guess from the name of the api, like 'public', ['v1', 'public'] or 'fapiPublic'
+        apis = api if isinstance(api, list) else [api]
+        return any('public' in str(name).lower() for name in apis)
 
     def throttle(self, cost=None):
-        now = float(self.milliseconds())
-        elapsed = now - self.lastRestRequestTimestamp
-        cost = 1 if cost is None else cost
-        sleep_time = self.rateLimit * cost
-        if elapsed < sleep_time:
-            delay = sleep_time - elapsed
-            time.sleep(delay / 1000.0)
+        # blocks until the request fits into the token bucket and the named buckets of its HTTP method
+        method, priority, deadline = self.calculate_rate_limiter_scope()
+        self.throttler(cost, priority, deadline)
+        for throttle, bucket_cost in self.rate_limit_bucket_costs(method, cost):
+            throttle(bucket_cost, priority, deadline)
+        if self.metrics is not None:
+            self.mark_request_metrics('throttled')
+
+    def calculate_rate_limiter_scope(self):
+        # the HTTP method, the priority and the deadline of the implicit api method call in progress
+        call = implicit_api_call.get()
+        if call is None:
+            return None, None, None
+        api, method, path, params, config, context = call['api'], call['method'], call['path'], call['params'], call['config'], call['context']
+        return method, self.calculate_rate_limiter_priority(api, method, path, params, config, context), self.calculate_rate_limiter_deadline(params, context)
+
+    def calculate_rate_limiter_deadline(self, params, context={}):
+        # the deadline is a timestamp in milliseconds, the throttler takes it on the monotonic clock
+        deadline = self.safe_value(params, 'requestDeadline', self.safe_value(context, 'deadline'))
+        if deadline is None:
+            return None
+        return time.monotonic() * 1000 + deadline - self.milliseconds()
+
+    @staticmethod
+    def omit_rate_limiter_params(params):
+        if isinstance(params, dict) and ('requestPriority' in params or 'requestDeadline' in params):
+            return Exchange.omit(params, 'requestPriority', 'requestDeadline')
+        return params
 
     @staticmethod
     def gzip_deflate(response, text):
@@ -566,13 +936,12 @@ class Exchange(object):
         return response_body.strip()
 
     def on_json_response(self, response_body):
-        if self.quoteJsonNumbers:
-            return json.loads(response_body, parse_float=str, parse_int=str)
-        else:
-            return json.loads(response_body)
+        return self.json_backend.loads(response_body, self.quoteJsonNumbers)
 
     def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
+        if self.metrics is not None:
+            self.mark_request_metrics('signed', len(url) + len(body or ''))
         request_headers = self.prepare_request_headers(headers)
         url = self.proxy + url
 
@@ -605,6 +974,7 @@ class Exchange(object):
             headers = response.headers
             http_status_code = response.status_code
             http_status_text = response.reason
+            self.on_rate_limit_headers(http_status_code, headers)
             http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, response.text, request_headers, request_body)
             json_response = self.parse_json(http_response)
             # FIXME remove last_x_responses from subclasses
@@ -668,8 +1038,9 @@ class Exchange(object):
             return response.content
 
     def parse_json(self, http_response):
+        # the bytes of the JSON responses are decoded directly by the async exchanges
         try:
-            if Exchange.is_json_encoded_object(http_response):
+            if isinstance(http_response, bytes) or Exchange.is_json_encoded_object(http_response):
                 return self.on_json_response(http_response)
         except ValueError:  # superclass of JsonDecodeError (python2)
             pass
@@ -1089,15 +1460,12 @@ class Exchange(object):
 
     @staticmethod
     def aggregate(bidasks):
-        ordered = Exchange.ordered({})
+        # the dicts keep the insertion order
+        aggregated = {}
         for [price, volume, *_] in bidasks:
             if volume > 0:
-                ordered[price] = (ordered[price] if price in ordered else 0) + volume
-        result = []
-        items = list(ordered.items())
-        for price, volume in items:
-            result.append([price, volume])
-        return result
+                aggregated[price] = aggregated.get(price, 0) + volume
+        return [[price, volume] for price, volume in aggregated.items()]
 
     @staticmethod
     def sec():
@@ -1223,7 +1591,7 @@ class Exchange(object):
     @staticmethod
     def hash(request, algorithm='md5', digest='hex'):
         if algorithm == 'keccak':
-            binary = bytes(keccak.SHA3(request))
+            binary = keccak_256(request)
         else:
             h = hashlib.new(algorithm, request)
             binary = h.digest()
@@ -1233,10 +1601,45 @@ class Exchange(object):
             return Exchange.binary_to_base16(binary)
         return binary
 
+    def signing_context(self, secret):
+        # the contexts of the keys sign() passes, the secret or the keys derived from it, dropped when the credentials change
+        credentials = (self.secret, self.privateKey)
+        if credentials != self.signing_credentials:
+            self.signing_contexts = {}
+            self.signing_credentials = credentials
+        if not isinstance(secret, (str, bytes)):
+            return None
+        context = self.signing_contexts.get(secret)
+        if context is None:
+            if len(self.signing_contexts) >= 16:
+                # the keys derived for every request are not kept
+                self.signing_contexts.clear()
+            context = SigningContext(secret)
+            self.signing_contexts[secret] = context
+        return context
+
+    def prepared_hmac(self, request, secret, algorithm=hashlib.sha256, digest='hex'):
+        return Exchange.hmac(request, secret, algorithm, digest, self.signing_context(secret))
+
+    def prepared_jwt(self, request, secret, alg='HS256'):
+        return Exchange.jwt(request, secret, alg, self.signing_context(secret))
+
+    def prepared_rsa(self, request, secret, alg='RS256'):
+        return Exchange.rsa(request, secret, alg, self.signing_context(secret))
+
+    def prepared_ecdsa(self, request, secret, algorithm='p256', hash=None, fixed_length=False):
+        return Exchange.ecdsa(request, secret, algorithm, hash, fixed_length, self.signing_context(secret))
+
+    def prepared_eddsa(self, request, secret, curve='ed25519'):
+        return Exchange.eddsa(request, secret, curve, self.signing_context(secret))
+
     @staticmethod
-    def hmac(request, secret, algorithm=hashlib.sha256, digest='hex'):
-        h = hmac.new(secret, request, algorithm)
-        binary = h.digest()
+    def hmac(request, secret, algorithm=hashlib.sha256, digest='hex', context=None):
+        if context is not None:
+            # the HMAC keyed with the secret is prepared once and copied
+            binary = context.hmac(request, algorithm)
+        else:
+            binary = hmac.new(secret, request, algorithm).digest()
         if digest == 'hex':
             return Exchange.binary_to_base16(binary)
         elif digest == 'base64':
@@ -1280,7 +1683,7 @@ class Exchange(object):
         return base64.b64decode(s).decode('utf-8')
 
     @staticmethod
-    def jwt(request, secret, alg='HS256'):
+    def jwt(request, secret, alg='HS256', context=None):
         algos = {
             'HS256': hashlib.sha256,
             'HS384': hashlib.sha384,
@@ -1294,26 +1697,31 @@ class Exchange(object):
         encoded_data = Exchange.base64urlencode(Exchange.encode(Exchange.json(request)))
         token = encoded_header + '.' + encoded_data
         if alg[:2] == 'RS':
-            signature = Exchange.rsa(token, secret, alg)
+            signature = Exchange.rsa(token, secret, alg, context)
         else:
             algorithm = algos[alg]
-            signature = Exchange.hmac(Exchange.encode(token), secret, algorithm, 'binary')
+            signature = Exchange.hmac(Exchange.encode(token), secret, algorithm, 'binary', context)
         return token + '.' + Exchange.base64urlencode(signature)
 
     @staticmethod
-    def rsa(request, secret, alg='RS256'):
+    def rsa(request, secret, alg='RS256', context=None):
         algorithms = {
             "RS256": hashes.SHA256(),
             "RS384": hashes.SHA384(),
             "RS512": hashes.SHA512(),
         }
         algorithm = algorithms[alg]
-        priv_key = load_pem_private_key(secret, None, backends.default_backend())
+        if context is not None:
+            priv_key = context.rsa_private_key()
+        else:
+            priv_key = load_pem_private_key(secret, None, backends.default_backend())
         return priv_key.sign(Exchange.encode(request), padding.PKCS1v15(), algorithm)
 
     @staticmethod
-    def ecdsa(request, secret, algorithm='p256', hash=None, fixed_length=False):
+    def ecdsa(request, secret, algorithm='p256', hash=None, fixed_length=False, context=None):
         # your welcome - frosty00
+        # imported on the first signature, the curves are a large part of the cold start of `import ccxt`
+        from ccxt.static_dependencies import ecdsa
         algorithms = {
             'p192': [ecdsa.NIST192p, 'sha256'],
             'p224': [ecdsa.NIST224p, 'sha256'],
@@ -1331,19 +1739,18 @@ class Exchange(object):
             digest = Exchange.hash(encoded_request, hash, 'binary')
         else:
             digest = base64.b16decode(encoded_request, casefold=True)
-        key = ecdsa.SigningKey.from_string(base64.b16decode(Exchange.encode(secret),
-                                                            casefold=True), curve=curve_info[0])
-        r_binary, s_binary, v = key.sign_digest_deterministic(digest, hashfunc=hash_function,
-                                                              sigencode=ecdsa.util.sigencode_strings_canonize)
-        r_int, s_int = ecdsa.util.sigdecode_strings((r_binary, s_binary), key.privkey.order)
+        curve = curve_info[0]
+        secexp = (context or SigningContext(secret)).ecdsa_secret_exponent(curve)
+        r_int, s_int, v = sign_digest_deterministic(curve, secexp, digest, hash_function)
+        r_binary, s_binary, v = ecdsa.util.sigencode_strings_canonize(r_int, s_int, curve.order, v)
+        r_int, s_int = ecdsa.util.sigdecode_strings((r_binary, s_binary), curve.order)
         counter = 0
         minimum_size = (1 << (8 * 31)) - 1
-        half_order = key.privkey.order / 2
+        half_order = curve.order / 2
         while fixed_length and (r_int > half_order or r_int <= minimum_size or s_int <= minimum_size):
-            r_binary, s_binary, v = key.sign_digest_deterministic(digest, hashfunc=hash_function,
-                                                                  sigencode=ecdsa.util.sigencode_strings_canonize,
-                                                                  extra_entropy=Exchange.number_to_le(counter, 32))
-            r_int, s_int = ecdsa.util.sigdecode_strings((r_binary, s_binary), key.privkey.order)
+            r_int, s_int, v = sign_digest_deterministic(curve, secexp, digest, hash_function, Exchange.number_to_le(counter, 32))
+            r_binary, s_binary, v = ecdsa.util.sigencode_strings_canonize(r_int, s_int, curve.order, v)
+            r_int, s_int = ecdsa.util.sigdecode_strings((r_binary, s_binary), curve.order)
             counter += 1
         r, s = Exchange.decode(base64.b16encode(r_binary)).lower(), Exchange.decode(base64.b16encode(s_binary)).lower()
         return {
@@ -1353,16 +1760,16 @@ class Exchange(object):
         }
 
     @staticmethod
-    def eddsa(request, secret, curve='ed25519'):
+    def eddsa(request, secret, curve='ed25519', context=None):
         random = b'\x00' * 64
         request = base64.b16decode(request, casefold=True)
-        secret = base64.b16decode(secret, casefold=True)
+        secret = (context or SigningContext(secret)).base16_secret()
         signature = eddsa.calculateSignature(random, secret, request)
         return Exchange.binary_to_base58(signature)
 
     @staticmethod
     def json(data, params=None):
-        return json.dumps(data, separators=(',', ':'))
+        return Exchange.json_backend.dumps(data)
 
     @staticmethod
     def is_json_encoded_object(input):
@@ -1380,7 +1787,7 @@ class Exchange(object):
 
     @staticmethod
     def to_array(value):
-        return list(value.values()) if type(value) is dict else value
+        return list(value.values()) if (type(value) is dict) or (type(value) is types.MappingProxyType) else value
 
     @staticmethod
     def check_required_version(required_version, error=True):
@@ -1425,11 +1832,203 @@ class Exchange(object):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if self.shareMarkets and self.attach_shared_markets():
+                return self.markets
+            if self.marketsCachePath is not None:
+                cache = self.read_markets_cache()
+                if (cache is not None) and not self.is_markets_cache_expired(cache):
+                    return self.set_cached_markets(cache)
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = self.fetch_currencies()
         markets = self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        return self.set_loaded_markets(markets, currencies)
+
+    def set_loaded_markets(self, markets, currencies=None):
+        self.detach_shared_markets()
+        result = self.set_markets(markets, currencies)
+        if self.shareMarkets:
+            self.publish_shared_markets()
+        if self.marketsCachePath is not None:
+            self.write_markets_cache(markets, currencies)
+        return result
+
+    def set_cached_markets(self, cache):
+        self.detach_shared_markets()
+        result = self.set_markets(cache['markets'], cache['currencies'])
+        if self.shareMarkets:
+            self.publish_shared_markets()
+        return result
+
+    def indexed_safe_market(self, safe_market, marketId=None, market=None, delimiter=None):
+        # known ids are returned without building the default market, unknown ones are looked up
+        # in the index before the default market is split by the delimiter or the given market is returned
+        if marketId is not None:
+            markets_by_id = self.markets_by_id
+            if (markets_by_id is not None) and (marketId in markets_by_id):
+                return markets_by_id[marketId]
+            if (delimiter is not None) or (market is None):
+                indexed = self.find_market_in_index(marketId, delimiter)
+                if indexed is not None:
+                    return indexed
+        return safe_market(marketId, market, delimiter)
+
+    def build_markets_index(self):
+        """
+        Indexes the markets by their lowercase ids, by their base and quote ids for the ids
+        that are joined with a delimiter, and by their alternative ids, see indexed_safe_market()
+        """
+        lowercase_ids = {}
+        ambiguous_ids = set()
+        base_quote_ids = {}
+        alternative_ids = {}
+        for id, market in self.markets_by_id.items():
+            if not isinstance(market, dict):
+                continue
+            if isinstance(id, str):
+                lowercase = id.lower()
+                if lowercase in lowercase_ids:
+                    # ids that only differ in case can't be resolved case-insensitively
+                    ambiguous_ids.add(lowercase)
+                lowercase_ids[lowercase] = market
+            base_id = market.get('baseId')
+            quote_id = market.get('quoteId')
+            if market.get('spot') and isinstance(base_id, str) and isinstance(quote_id, str):
+                base_quote_ids.setdefault((base_id.lower(), quote_id.lower()), market)
+            alternative_id = market.get('altname')
+            if isinstance(alternative_id, str):
+                alternative_ids.setdefault(alternative_id, market)
+        for lowercase in ambiguous_ids:
+            del lowercase_ids[lowercase]
+        return {
+            'marketsById': self.markets_by_id,
+            'lowercase': lowercase_ids,
+            'baseQuote': base_quote_ids,
+            'alternative': alternative_ids,
+        }
+
+    def find_market_in_index(self, marketId, delimiter=None):
+        if (self.markets_by_id is None) or not isinstance(marketId, str):
+            return None
+        index = self.markets_index
+        # the index is rebuilt after set_markets() replaces markets_by_id
+        if (index is None) or (index['marketsById'] is not self.markets_by_id):
+            index = self.markets_index = self.build_markets_index()
+        market = index['alternative'].get(marketId)
+        if market is None:
+            market = index['lowercase'].get(marketId.lower())
+        if (market is None) and (delimiter is not None):
+            parts = marketId.split(delimiter)
+            if len(parts) == 2:
+                market = index['baseQuote'].get((parts[0].lower(), parts[1].lower()))
+        return market
+
+    def markets_cache_file(self):
+        id, sandbox, options = self.shared_markets_key()
+        return os.path.join(self.marketsCachePath, id + ('-sandbox' if sandbox else '') + '.json')
+
+    def read_markets_cache(self):
+        """Returns the cached markets and currencies or None if the cache is missing, unreadable or incompatible"""
+        try:
+            with open(self.markets_cache_file(), encoding='utf-8') as file:
+                cache = json.load(file)
+        except (OSError, ValueError) as e:
+            self.logger.debug("%s markets cache is not available: %s", self.id, e)
+            return None
+        if not isinstance(cache, dict):
+            return None
+        # markets parsed by a different version of the library or stored in another layout are never reused
+        if (cache.get('version') != markets_cache_version) or (cache.get('ccxt') != __version__) or (cache.get('id') != self.id):
+            return None
+        if not isinstance(cache.get('markets'), list) or not isinstance(cache.get('timestamp'), int):
+            return None
+        return cache
+
+    def write_markets_cache(self, markets, currencies=None):
+        path = self.markets_cache_file()
+        cache = {
+            'version': markets_cache_version,
+            'ccxt': __version__,
+            'id': self.id,
+            'timestamp': self.milliseconds(),
+            'markets': self.to_array(markets),
+            'currencies': currencies,
+        }
+        try:
+            os.makedirs(self.marketsCachePath, exist_ok=True)
+            # write to a unique temporary file and swap it in, so that concurrent readers never see a partial file
+            # and concurrent writers in other threads and processes never write into the same temporary file
+            descriptor, temporary = tempfile.mkstemp(dir=self.marketsCachePath, prefix=os.path.basename(path) + '.', suffix='.tmp')
+            try:
+                with open(descriptor, 'w', encoding='utf-8') as file:
+                    json.dump(cache, file, separators=(',', ':'), default=str)
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            # the cache is an optimization, failing to write it must not break load_markets
+            self.logger.warning("%s failed to write the markets cache %s: %s", self.id, path, e)
+
+    def is_markets_cache_expired(self, cache):
+        return self.milliseconds() - cache['timestamp'] >= self.marketsCacheTTL
+
+    def shared_markets_key(self):
+        sandbox = bool(self.urls) and ('apiBackup' in self.urls)
+        # the instances loading different sets of markets don't share them
+        options = {name: self.options[name] for name in self.sharedMarketsOptions if name in self.options}
+        return (self.id, sandbox, json.dumps(options, sort_keys=True, default=str))
+
+    def publish_shared_markets(self):
+        """
+        Makes the markets and currencies of this instance available to the other instances of the same exchange
+        with the same market options. The structures are published once and referenced by all attached instances,
+        the dicts are wrapped in read-only views, the markets and currencies in them must not be changed either.
+        """
+        shared = {}
+        for name in shared_market_properties:
+            value = getattr(self, name, None)
+            if isinstance(value, dict):
+                value = types.MappingProxyType(value)
+            shared[name] = value
+            setattr(self, name, value)
+        Exchange.shared_markets[self.shared_markets_key()] = shared
+
+    def attach_shared_markets(self):
+        shared = Exchange.shared_markets.get(self.shared_markets_key())
+        if shared is None:
+            return False
+        for name in shared_market_properties:
+            setattr(self, name, shared[name])
+        return True
+
+    def detach_shared_markets(self):
+        # set_markets() extends the current currencies, a reload extends a writable copy of the shared ones
+        if isinstance(self.currencies, types.MappingProxyType):
+            self.currencies = dict(self.currencies)
+
+    def prices_to_precision(self, symbol, prices):
+        # the batch version of price_to_precision for a list or a numpy array of prices
+        if self.overrides_to_precision('price_to_precision'):
+            return [self.price_to_precision(symbol, price) for price in self.precision_values(prices)]
+        market = self.market(symbol)
+        return self.decimals_to_precision(prices, ROUND, market['precision']['price'], self.precisionMode, self.paddingMode)
+
+    def amounts_to_precision(self, symbol, amounts):
+        # the batch version of amount_to_precision for a list or a numpy array of amounts
+        if self.overrides_to_precision('amount_to_precision'):
+            return [self.amount_to_precision(symbol, amount) for amount in self.precision_values(amounts)]
+        market = self.market(symbol)
+        return self.decimals_to_precision(amounts, TRUNCATE, market['precision']['amount'], self.precisionMode, self.paddingMode)
+
+    def overrides_to_precision(self, name):
+        # the exchanges that implement their own price_to_precision or amount_to_precision format every value with it
+        owner = next(klass for klass in type(self).__mro__ if name in klass.__dict__)
+        return not owner.__module__.endswith('base.exchange')
+
+    @staticmethod
+    def precision_values(values):
+        return values.ravel().tolist() if hasattr(values, 'ravel') else values
 
     def load_fees(self, reload=False):
         if not reload:
@@ -1468,6 +2067,8 @@ class Exchange(object):
         raise NotSupported(self.id + ' fetch_order_trades() is not supported yet')
 
     def build_ohlcvc(self, trades, timeframe='1m', since=None, limit=None):
+        if self.columnarOHLCV:
+            return self.build_ohlcvc_columnar(trades, timeframe, since, limit)
         ms = self.parse_timeframe(timeframe) * 1000
         ohlcvs = []
         (timestamp, open, high, low, close, volume, count) = (0, 1, 2, 3, 4, 5, 6)
@@ -1502,6 +2103,180 @@ class Exchange(object):
                 ohlcvs[candle][count] += 1
         return ohlcvs
 
+    def build_ohlcvc_columnar(self, trades, timeframe='1m', since=None, limit=None):
+        ms = self.parse_timeframe(timeframe) * 1000
+        ohlcvs = OHLCVColumns(count=array('q'))
+        (timestamps, highs, lows, closes, volumes, counts) = (ohlcvs.timestamp, ohlcvs.high, ohlcvs.low, ohlcvs.close, ohlcvs.volume, ohlcvs.count)
+        num_trades = len(trades)
+        oldest = (num_trades - 1) if limit is None else min(num_trades - 1, limit)
+        for i in range(0, oldest):
+            trade = trades[i]
+            if (since is not None) and (trade['timestamp'] < since):
+                continue
+            opening_time = None
+            if trade['timestamp']:
+                opening_time = int(math.floor(trade['timestamp'] / ms) * ms)  # Shift the edge of the m/h/d (but not M)
+            elif len(timestamps) == 0:
+                # a candle can't be opened without a timestamp, the trades without one only update the current candle
+                continue
+            price = float(trade['price'])
+            if (len(timestamps) == 0) or (opening_time and opening_time >= timestamps[-1] + ms):
+                # moved to a new timeframe -> create a new candle from opening trade
+                ohlcvs.append(opening_time, price, price, price, price, trade['amount'], 1)
+            else:
+                # still processing the same timeframe -> update opening trade
+                highs[-1] = max(highs[-1], price)
+                lows[-1] = min(lows[-1], price)
+                closes[-1] = price
+                volumes[-1] += trade['amount']
+                counts[-1] += 1
+        return ohlcvs
+
+    def init_kept_order_books(self):
+        # apart from self.orderbooks, which holds the books of the websocket streams of the pro exchanges
+        self.kept_orderbooks = {}
+        # the base parse_order_book is replaced, the books parsed by the implementations of the exchange are kept
+        owner = next(klass for klass in type(self).__mro__ if 'parse_order_book' in klass.__dict__)
+        if owner.__module__.endswith('base.exchange'):
+            parse_order_book = self.keep_order_book
+        else:
+            parse_order_book = functools.partial(self.keep_parsed_order_book, self.parse_order_book)
+        self.parse_order_book = self.parseOrderBook = parse_order_book
+
+    def kept_order_book(self, symbol):
+        book = self.kept_orderbooks.get(symbol)
+        if book is None:
+            # imported here, the order book module imports this one
+            from ccxt.base.order_book import OrderBook
+            book = self.kept_orderbooks[symbol] = OrderBook()
+        return book
+
+    def keep_order_book(self, orderbook, symbol, timestamp=None, bidsKey='bids', asksKey='asks', priceKey=0, amountKey=1):
+        # the parsed levels replace the levels of the book kept for the symbol, which every reference to it sees,
+        # they are sorted once by the book instead of sort_by() in parse_order_book
+        bids = self.parse_bids_asks(self.safe_value(orderbook, bidsKey, []), priceKey, amountKey)
+        asks = self.parse_bids_asks(self.safe_value(orderbook, asksKey, []), priceKey, amountKey)
+        return self.kept_order_book(symbol).load(bids, asks, timestamp, None, symbol)
+
+    def keep_parsed_order_book(self, parse_order_book, orderbook, symbol, *args, **kwargs):
+        snapshot = parse_order_book(orderbook, symbol, *args, **kwargs)
+        book = self.kept_order_book(symbol)
+        book.reset(snapshot)
+        return book
+
+    def init_columnar_ohlcv(self):
+        # the instance attributes return the candles as columns, the base parse_ohlcvs is replaced with the columnar one,
+        # the candles returned by the implementations of the exchange are converted
+        # the base classes of ccxt, ccxt.async_support and ccxt.pro are defined in a base.exchange module
+        owner = next(klass for klass in type(self).__mro__ if 'parse_ohlcvs' in klass.__dict__)
+        if owner.__module__.endswith('base.exchange'):
+            parse_ohlcvs = self.parse_ohlcvs_columnar
+        else:
+            parse_ohlcvs = functools.partial(self.parse_ohlcvs_to_columns, self.parse_ohlcvs)
+        fetch_ohlcv = functools.partial(self.fetch_ohlcv_columns, self.fetch_ohlcv)
+        self.parse_ohlcvs = self.parseOHLCVs = parse_ohlcvs
+        self.fetch_ohlcv = self.fetchOHLCV = fetch_ohlcv
+
+    @staticmethod
+    def ohlcv_columns(ohlcvs):
+        return ohlcvs if isinstance(ohlcvs, OHLCVColumns) else OHLCVColumns.from_rows(ohlcvs)
+
+    def parse_ohlcvs_to_columns(self, parse_ohlcvs, *args, **kwargs):
+        return Exchange.ohlcv_columns(parse_ohlcvs(*args, **kwargs))
+
+    def fetch_ohlcv_columns(self, fetch_ohlcv, *args, **kwargs):
+        return Exchange.ohlcv_columns(fetch_ohlcv(*args, **kwargs))
+
+    def parse_ohlcvs_columnar(self, ohlcvs, market=None, timeframe='1m', since=None, limit=None):
+        # the rows are parsed one by one and appended to the columns right away, without keeping the intermediate lists
+        results = OHLCVColumns.from_rows(self.parse_ohlcv(ohlcv, market) for ohlcv in ohlcvs)
+        tail = (since is None)
+        return results.sort().filter_by_since_limit(since, limit, tail)
+
+    def paginate(self, method, symbol=None, since=None, until=None, timeframe='1m', limit=None, params={}):
+        """
+        Yields the candles or the trades from since to until (exclusive, now by default) in chronological order,
+        issuing as many calls as needed to the fetch_ohlcv-like or fetch_trades-like method with the given name
+
+        :param str method: fetch_ohlcv, fetch_trades, fetch_my_trades or another method with the same arguments
+        :param int limit: the number of entries per request, paginationLimit by default
+        """
+        windows, step, limit = self.pagination_windows(method, since, until, timeframe, limit, 1)
+        state = {}
+        for start, end in windows:
+            cursor = start
+            while cursor is not None:
+                page = self.fetch_pagination_page(method, symbol, cursor, timeframe, limit, params)
+                entries, cursor = self.paginated_entries(page, cursor, end, step, limit)
+                for entry in self.deduplicate_paginated_entries(entries, state):
+                    yield entry
+
+    def pagination_windows(self, method, since, until, timeframe, limit, concurrency):
+        # candles are requested in windows of limit * timeframe, trades in as many windows as the concurrency allows
+        if since is None:
+            raise ArgumentsRequired(self.id + ' paginate() requires a since argument')
+        until = self.milliseconds() if until is None else until
+        limit = self.paginationLimit if limit is None else limit
+        if 'ohlcv' in method.lower():
+            step = self.parse_timeframe(timeframe) * 1000
+            size = limit * step
+        else:
+            step = 0
+            size = max(1, -(-(until - since) // concurrency))
+        windows = ((start, min(start + size, until)) for start in range(since, until, size))
+        return windows, step, limit
+
+    def fetch_pagination_page(self, method, symbol, since, timeframe, limit, params):
+        fetch = getattr(self, method)
+        if 'ohlcv' in method.lower():
+            return fetch(symbol, timeframe, since, limit, params)
+        return fetch(symbol, since, limit, params)
+
+    @staticmethod
+    def paginated_timestamp(entry):
+        return entry[0] if isinstance(entry, list) else entry['timestamp']
+
+    def paginated_entries(self, page, cursor, end, step, limit):
+        """Returns the entries of a page within [cursor, end) and the cursor of the next page, None when the window is done"""
+        timestamp = self.paginated_timestamp
+        entries = sorted((entry for entry in page if cursor <= timestamp(entry) < end), key=timestamp)
+        if not page:
+            return entries, None
+        last = max(timestamp(entry) for entry in page)
+        if (last < cursor) or (last + step >= end):
+            # the exchange ignores since or the window is covered
+            return entries, None
+        following = last + step
+        if following <= cursor:
+            # a full page of trades with the same timestamp, there is no way to get past them with since
+            if len(page) < limit:
+                return entries, None
+            following = cursor + 1
+        return entries, following
+
+    def deduplicate_paginated_entries(self, entries, state):
+        # the windows and the pages are chronological, so only the keys of the latest timestamp are remembered
+        timestamp = self.paginated_timestamp
+        for entry in entries:
+            current = timestamp(entry)
+            if isinstance(entry, list):
+                key = current
+            else:
+                key = entry.get('id') or (current, entry.get('side'), entry.get('price'), entry.get('amount'))
+            previous = state.get('timestamp')
+            if previous is not None:
+                if current < previous:
+                    continue
+                if current == previous:
+                    if key in state['keys']:
+                        continue
+                    state['keys'].add(key)
+                    yield entry
+                    continue
+            state['timestamp'] = current
+            state['keys'] = {key}
+            yield entry
+
     @staticmethod
     def parse_timeframe(timeframe):
         amount = int(timeframe[0:-1])
@@ -1560,9 +2335,9 @@ class Exchange(object):
             raise NotSupported(self.id + ' Eddsa functionality requires python-axolotl-curve25519, install with `pip install python-axolotl-curve25519==0.4.1.post2`: https://github.com/tgalal/python-axolotl-curve25519')
 
     def privateKeyToAddress(self, privateKey):
-        private_key_bytes = base64.b16decode(Exchange.encode(privateKey), True)
-        public_key_bytes = ecdsa.SigningKey.from_string(private_key_bytes, curve=ecdsa.SECP256k1).verifying_key.to_string()
-        public_key_hash = keccak.SHA3(public_key_bytes)
+        from ccxt.static_dependencies import ecdsa
+        secexp = self.signing_context(privateKey).ecdsa_secret_exponent(ecdsa.SECP256k1)
+        public_key_hash = keccak_256(public_key(ecdsa.SECP256k1, secexp))
         return '0x' + Exchange.decode(base64.b16encode(public_key_hash))[-40:].lower()
 
     @staticmethod
@@ -1573,7 +2348,7 @@ class Exchange(object):
 
     def hashMessage(self, message):
         message_bytes = base64.b16decode(Exchange.encode(Exchange.remove0x_prefix(message)), True)
-        hash_bytes = keccak.SHA3(b"\x19Ethereum Signed Message:\n" + Exchange.encode(str(len(message_bytes))) + message_bytes)
+        hash_bytes = keccak_256(b"\x19Ethereum Signed Message:\n" + Exchange.encode(str(len(message_bytes))) + message_bytes)
         return '0x' + Exchange.decode(base64.b16encode(hash_bytes)).lower()
 
     @staticmethod
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""
+Recording of the HTTP requests and responses of an exchange into a fixture file and their replay without the network,
+the requests are matched on their method, their path and their normalized params, without the nonces and signatures
+"""
+
+# -----------------------------------------------------------------------------
+
+import base64
+import gzip
+import json
+import threading
+import urllib.parse
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from ccxt.base.errors import ExchangeError
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Fixture',
+    'FixtureSession',
+    'request_key',
+]
+
+# -----------------------------------------------------------------------------
+
+# the headers of the transfer, the bodies are recorded decoded
+skipped_headers = set(['content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'])
+
+
+def body_params(body):
+    if not body:
+        return []
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', 'replace')
+    try:
+        decoded = json.loads(body)
+    except ValueError:
+        decoded = None
+    if isinstance(decoded, dict):
+        return [(key, value if isinstance(value, str) else json.dumps(value, sort_keys=True)) for key, value in decoded.items()]
+    if decoded is None and '=' in body:
+        return urllib.parse.parse_qsl(body, keep_blank_values=True)
+    return [('', body)]
+
+
+def request_key(method, url, body, ignored_params):
+    """
+    'GET /api/v3/ticker?symbol=BTCUSDT', the params of the query and of the body, form encoded or JSON, sorted,
+    without the ignored ones, lowercase names
+    """
+    parsed = urllib.parse.urlsplit(url)
+    params = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True) + body_params(body)
+    params = sorted((key, value) for key, value in params if key.lower() not in ignored_params)
+    return method.upper() + ' ' + parsed.path + ('?' + urllib.parse.urlencode(params) if params else '')
+
+
+class Fixture(object):
+    """
+    The recorded responses, one JSON object per line, gzipped when the name of the file ends with .gz. In the record
+    mode the file is written from its first request, in the replay mode it is read on the first request, the responses
+    to the same request are replayed in the recorded order and the last one is repeated.
+    """
+
+    def __init__(self, path, mode='replay', ignored_params=()):
+        if mode not in ['record', 'replay']:
+            raise ExchangeError('the fixture mode must be record or replay, not ' + str(mode))
+        self.path = path
+        self.mode = mode
+        self.ignored_params = set(name.lower() for name in ignored_params)
+        self.responses = None  # the request key → [the recorded responses, the index of the next one]
+        self.recording = False
+        self.lock = threading.Lock()
+
+    def open(self, mode):
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, mode + 't', encoding='utf-8')
+        return open(self.path, mode, encoding='utf-8')
+
+    def key(self, method, url, body):
+        return request_key(method, url, body, self.ignored_params)
+
+    def record(self, method, url, body, status, reason, headers, content):
+        entry = {
+            'request': self.key(method, url, body),
+            'status': status,
+            'reason': reason,
+            'headers': dict((name, value) for name, value in headers.items() if name.lower() not in skipped_headers),
+        }
+        try:
+            entry['body'] = content.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['base64'] = base64.b64encode(content).decode()
+        line = json.dumps(entry, separators=(',', ':'), ensure_ascii=False) + '\n'
+        with self.lock:
+            with self.open('a' if self.recording else 'w') as file:
+                file.write(line)
+            self.recording = True
+        return entry
+
+    def load(self):
+        responses = {}
+        with self.open('r') as file:
+            for line in file:
+                if line.strip():
+                    entry = json.loads(line)
+                    responses.setdefault(entry['request'], [[], 0])[0].append(entry)
+        return responses
+
+    def replay(self, method, url, body):
+        key = self.key(method, url, body)
+        with self.lock:
+            if self.responses is None:
+                self.responses = self.load()
+            recorded = self.responses.get(key)
+            if recorded is None:
+                raise ExchangeError('no response to ' + key + ' is recorded in ' + self.path)
+            entries, index = recorded
+            recorded[1] = min(index + 1, len(entries) - 1)
+            return entries[index]
+
+    @staticmethod
+    def content(entry):
+        if 'base64' in entry:
+            return base64.b64decode(entry['base64'])
+        return entry['body'].encode('utf-8')
+
+
+class FixtureSession(object):
+    """A requests Session recording its responses into a fixture or replaying them from it, see Exchange.fixturePath"""
+
+    def __init__(self, session, fixture):
+        self.session = session
+        self.fixture = fixture
+        self.headers = session.headers
+        self.cookies = session.cookies
+        self.trust_env = session.trust_env
+
+    def request(self, method, url, data=None, headers=None, **kwargs):
+        if self.fixture.mode == 'record':
+            response = self.session.request(method, url, data=data, headers=headers, **kwargs)
+            self.fixture.record(method, url, data, response.status_code, response.reason, response.headers, response.content)
+            return response
+        entry = self.fixture.replay(method, url, data)
+        response = Response()
+        response.status_code = entry['status']
+        response.reason = entry['reason']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = Fixture.content(entry)
+        response.url = url
+        response.encoding = 'utf-8'
+        return response
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""Interchangeable JSON codecs: the standard library json module, orjson and ujson"""
+
+# -----------------------------------------------------------------------------
+
+import json
+import re
+
+# optional, orjson is used by default when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'JSONCodec',
+    'OrjsonCodec',
+    'UjsonCodec',
+    'json_codecs',
+    'get_json_codec',
+    'has_number_token',
+]
+
+# -----------------------------------------------------------------------------
+
+# a float or a null after one of :[, in the encoded data, the same characters inside a string
+# can only give false positives, which make the encoding fall back to the json module
+float_or_null_token = re.compile(r'[:\[,](?:-?[0-9]+[.eE]|null)')
+
+# the digits and the minus sign to 0 and the characters a number can follow to :, the whitespace is deleted
+number_token_table = bytes.maketrans(b'0123456789-,[', b'00000000000::')
+
+
+def has_number_token(data):
+    """
+    Whether a document can have numbers outside of the strings: a number starts the document or follows one of :[,
+    the same characters inside a string can only give false positives. The beginning of the document is checked first,
+    where most of the documents with numbers have one.
+    """
+    head = data[:4096]
+    if isinstance(head, str):
+        head = head.encode('utf-8', 'surrogatepass')
+    head = head.translate(number_token_table, b' \t\n\r')
+    if head.startswith(b'0') or (b':0' in head):
+        return True
+    if len(data) <= 4096:
+        return False
+    if isinstance(data, str):
+        data = data.encode('utf-8', 'surrogatepass')
+    return b':0' in data.translate(number_token_table, b' \t\n\r')
+
+
+class JSONCodec(object):
+    """
+    The json module of the standard library, the reference for the other codecs: loads() accepts str and bytes
+    and decodes the numbers to the strings written in the document when quote_numbers is set, dumps() returns
+    the compact ASCII representation.
+    """
+
+    name = 'json'
+
+    def loads(self, data, quote_numbers=True):
+        if quote_numbers:
+            return json.loads(data, parse_float=str, parse_int=str)
+        return json.loads(data)
+
+    def dumps(self, data):
+        return json.dumps(data, separators=(',', ':'))
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    orjson has no hook for the numbers, so the documents with numbers are decoded by the json module when quote_numbers
+    is set, orjson decodes the others, and the json module the ones orjson rejects (NaN, invalid unicode). The integers over
+    64 bits are decoded to floats by orjson. The data with floats, None or non-ASCII strings, which orjson would encode
+    differently, is encoded by the json module.
+    """
+
+    name = 'orjson'
+
+    def loads(self, data, quote_numbers=True):
+        if quote_numbers and has_number_token(data):
+            return JSONCodec.loads(self, data, quote_numbers)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return JSONCodec.loads(self, data, quote_numbers)
+
+    def dumps(self, data):
+        if not isinstance(data, (dict, list)):
+            return JSONCodec.dumps(self, data)
+        try:
+            result = orjson.dumps(data).decode()
+        except TypeError:  # orjson.JSONEncodeError
+            return JSONCodec.dumps(self, data)
+        # the json module escapes the non-ASCII characters, writes NaN and the floats in another notation
+        if not result.isascii() or float_or_null_token.search(result) is not None:
+            return JSONCodec.dumps(self, data)
+        return result
+
+
+class UjsonCodec(JSONCodec):
+    """
+    ujson, like orjson, only decodes the documents without numbers when quote_numbers is set, it is not used by default
+    because its float parsing can differ from the json module in the last digit.
+    """
+
+    name = 'ujson'
+
+    def loads(self, data, quote_numbers=True):
+        if quote_numbers and has_number_token(data):
+            return JSONCodec.loads(self, data, quote_numbers)
+        try:
+            return ujson.loads(data)
+        except ValueError:  # ujson.JSONDecodeError, the integers over 64 bits
+            return JSONCodec.loads(self, data, quote_numbers)
+
+
+json_codecs = {
+    'json': JSONCodec(),
+}
+if ujson is not None:
+    json_codecs['ujson'] = UjsonCodec()
+if orjson is not None:
+    json_codecs['orjson'] = OrjsonCodec()
+
+
+def get_json_codec(name=None):
+    """Returns the codec with the given name, orjson if it is installed or the json module by default"""
+    if name is None:
+        return json_codecs.get('orjson', json_codecs['json'])
+    if name not in json_codecs:
+        raise ImportError('the ' + name + ' JSON codec is not installed, install it with `pip install ' + name + '`')
+    return json_codecs[name]
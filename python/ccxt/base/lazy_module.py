@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""Package module that imports exchange classes on first access"""
+
+# -----------------------------------------------------------------------------
+
+import importlib
+import os
+import types
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'LazyModule',
+    'lazy_loading_enabled',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def lazy_loading_enabled():
+    # opt-in with CCXT_LAZY_LOAD=1 in the environment before the first `import ccxt`
+    return os.environ.get('CCXT_LAZY_LOAD', '').lower() in ('1', 'true', 'yes', 'on')
+
+
+class LazyModule(types.ModuleType):
+    """
+    A drop-in replacement for the class of the ccxt and ccxt.async_support package modules.
+    Exchange classes listed in the module-level `exchanges` are imported when they are first
+    accessed as attributes, so a process only pays for the exchanges it actually uses.
+    """
+
+    def __getattr__(self, name):
+        # only called when the regular attribute lookup fails
+        if name in self.__dict__.get('exchanges', ()):
+            module = importlib.import_module(self.__name__ + '.' + name)
+            exchange = getattr(module, name)
+            self.__dict__[name] = exchange
+            return exchange
+        raise AttributeError("module '%s' has no attribute '%s'" % (self.__name__, name))
+
+    def __setattr__(self, name, value):
+        # the import machinery binds every freshly loaded submodule onto its parent package,
+        # for instance importing ccxt.binanceusdm also loads the ccxt.binance module,
+        # ccxt.binance must keep resolving to the exchange class though, not to the module
+        if isinstance(value, types.ModuleType) and name in self.__dict__.get('exchanges', ()):
+            value = getattr(value, name)
+        super(LazyModule, self).__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super(LazyModule, self).__dir__()) | set(self.__dict__.get('exchanges', ())))
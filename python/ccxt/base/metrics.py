@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+"""Per endpoint counters and latency histograms of the requests of the exchanges"""
+
+# -----------------------------------------------------------------------------
+
+import bisect
+import contextvars
+import threading
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Histogram',
+    'EndpointMetrics',
+    'Metrics',
+    'prometheus_text',
+]
+
+# -----------------------------------------------------------------------------
+
+phases = ['throttle', 'sign', 'network', 'decode', 'parse']
+buckets = [0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]  # the upper bounds in milliseconds
+
+# the perf_counter() of the start of the request in progress and of the end of its throttle and sign phases, the characters
+# sent and received and the milliseconds spent decoding its response, filled by the exchange while the request runs
+request_metrics = contextvars.ContextVar('request_metrics', default=None)
+# [the endpoint, the perf_counter() of its response] of the last request of the unified method in progress
+unified_call = contextvars.ContextVar('unified_call', default=None)
+
+
+class Histogram(object):
+    """The counts of the values up to each bound of the buckets, like a Prometheus histogram"""
+
+    def __init__(self):
+        self.counts = [0] * (len(buckets) + 1)  # the last one is the count of the values over all the bounds
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        result = []
+        total = 0
+        for bound, count in zip(buckets + [float('inf')], self.counts):
+            total += count
+            result.append([bound, total])
+        return result
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'buckets': self.cumulative(),
+        }
+
+
+class EndpointMetrics(object):
+    """
+    The requests of one endpoint: their count, the count of their errors by exception class, the length of their URLs
+    and bodies, the length of their responses, and the milliseconds of every phase in histograms.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = {}  # the name of the exception class → the count
+        self.sent = 0
+        self.received = 0
+        self.latency = dict((phase, Histogram()) for phase in phases)
+
+    def snapshot(self):
+        return {
+            'requests': self.requests,
+            'errors': dict(self.errors),
+            'sent': self.sent,
+            'received': self.received,
+            'latency': dict((phase, histogram.snapshot()) for phase, histogram in self.latency.items()),
+        }
+
+
+class Metrics(object):
+    """
+    The metrics of an exchange by endpoint, the name of its implicit method (publicGetTicker), shared by the threads.
+    Every request is measured in phases: throttle, the wait for the rate limiter, sign, network, the round trip without
+    the decoding, decode, the decoding of the JSON response, and parse, from the last response of a unified method
+    to its return.
+    """
+
+    def __init__(self):
+        self.endpoints = {}  # the endpoint → its EndpointMetrics
+        self.lock = threading.Lock()
+
+    def endpoint(self, endpoint):
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = EndpointMetrics()
+            self.endpoints[endpoint] = metrics
+        return metrics
+
+    def record(self, endpoint, latency, sent, received):
+        with self.lock:
+            metrics = self.endpoint(endpoint)
+            metrics.requests += 1
+            metrics.sent += sent
+            metrics.received += received
+            for phase, milliseconds in latency.items():
+                metrics.latency[phase].observe(milliseconds)
+
+    def record_error(self, endpoint, error):
+        name = type(error).__name__
+        with self.lock:
+            metrics = self.endpoint(endpoint)
+            metrics.requests += 1
+            metrics.errors[name] = metrics.errors.get(name, 0) + 1
+
+    def record_parse(self, endpoint, milliseconds):
+        with self.lock:
+            self.endpoint(endpoint).latency['parse'].observe(milliseconds)
+
+    def reset(self):
+        with self.lock:
+            self.endpoints = {}
+
+    def snapshot(self):
+        """Returns the metrics as a dict of the endpoints, the latencies in milliseconds"""
+        with self.lock:
+            return dict((endpoint, metrics.snapshot()) for endpoint, metrics in self.endpoints.items())
+
+    def prometheus(self, exchange_id):
+        """Returns the metrics in the Prometheus text format, labelled with the id of the exchange"""
+        return prometheus_text({exchange_id: self})
+
+
+def label(value):
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+
+
+def prometheus_text(metrics):
+    """The Prometheus text format of the metrics of several exchanges, a dict of their ids → their Metrics"""
+    snapshots = dict((exchange_id, exchange_metrics.snapshot()) for exchange_id, exchange_metrics in metrics.items())
+    families = [
+        ['ccxt_requests_total', 'counter', 'The requests sent to the endpoint.'],
+        ['ccxt_request_errors_total', 'counter', 'The requests that failed, by exception class.'],
+        ['ccxt_request_bytes_total', 'counter', 'The length of the URLs and the bodies of the requests.'],
+        ['ccxt_response_bytes_total', 'counter', 'The length of the responses.'],
+        ['ccxt_request_duration_seconds', 'histogram', 'The duration of the phases of the requests.'],
+    ]
+    lines = {}
+    for family in families:
+        lines[family[0]] = ['# HELP ' + family[0] + ' ' + family[2], '# TYPE ' + family[0] + ' ' + family[1]]
+    for exchange_id, snapshot in snapshots.items():
+        for endpoint, endpoint_metrics in sorted(snapshot.items()):
+            labels = 'exchange=' + label(exchange_id) + ',endpoint=' + label(endpoint)
+            lines['ccxt_requests_total'].append('ccxt_requests_total{' + labels + '} ' + str(endpoint_metrics['requests']))
+            for error, count in sorted(endpoint_metrics['errors'].items()):
+                lines['ccxt_request_errors_total'].append('ccxt_request_errors_total{' + labels + ',error=' + label(error) + '} ' + str(count))
+            lines['ccxt_request_bytes_total'].append('ccxt_request_bytes_total{' + labels + '} ' + str(endpoint_metrics['sent']))
+            lines['ccxt_response_bytes_total'].append('ccxt_response_bytes_total{' + labels + '} ' + str(endpoint_metrics['received']))
+            histograms = lines['ccxt_request_duration_seconds']
+            for phase in phases:
+                histogram = endpoint_metrics['latency'][phase]
+                phase_labels = labels + ',phase=' + label(phase)
+                for bound, count in histogram['buckets']:
+                    le = '+Inf' if bound == float('inf') else '%g' % (bound / 1000)
+                    histograms.append('ccxt_request_duration_seconds_bucket{' + phase_labels + ',le="' + le + '"} ' + str(count))
+                histograms.append('ccxt_request_duration_seconds_sum{' + phase_labels + '} ' + repr(histogram['sum'] / 1000))
+                histograms.append('ccxt_request_duration_seconds_count{' + phase_labels + '} ' + str(histogram['count']))
+    return '\n'.join(line for family in families for line in lines[family[0]]) + '\n'
@@ -0,0 +1,83 @@
+import os
+import struct
+import threading
+from ccxt.base.errors import NotSupported
+
+# optional, the shared nonce generator locks its file with flock(), which is not available on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class NonceGenerator(object):
+    """
+    Makes the nonces computed by an exchange from the clock strictly increasing: a nonce that is not greater than
+    the last one is replaced by the last one plus one. Bursts of requests within one tick of the clock get the
+    consecutive values, going ahead of the clock by the number of the requests in that tick, and the clock catches
+    up after the burst. The generator is shared by the threads and the coroutines using the same api key.
+
+    Only the integer nonces are changed, the ones an exchange formats as strings are returned as they are.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.last = 0
+
+    def load(self):
+        return self.last
+
+    def store(self, nonce):
+        self.last = nonce
+
+    def __call__(self, nonce):
+        if not isinstance(nonce, int):
+            return nonce
+        with self.lock:
+            nonce = max(nonce, self.load() + 1)
+            self.store(nonce)
+            return nonce
+
+
+class SharedNonceGenerator(NonceGenerator):
+    """
+    A NonceGenerator that keeps the last nonce in a file, updated under an exclusive flock(): the nonces keep
+    increasing after a restart and between all the processes of the machine using the same file.
+    """
+
+    layout = struct.Struct('q')  # the last nonce, a signed 64-bit integer
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise NotSupported('SharedNonceGenerator requires fcntl.flock(), which is not available on this platform')
+        super(SharedNonceGenerator, self).__init__()
+        self.path = path
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def load(self):
+        data = os.pread(self.fd, self.layout.size, 0)
+        return self.layout.unpack(data)[0] if len(data) == self.layout.size else 0
+
+    def store(self, nonce):
+        os.pwrite(self.fd, self.layout.pack(nonce), 0)
+
+    def __call__(self, nonce):
+        if not isinstance(nonce, int):
+            return nonce
+        # flock() does not exclude the threads of the same process, they share the open file
+        with self.lock:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                nonce = max(nonce, self.load() + 1)
+                self.store(nonce)
+                return nonce
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def close(self):
+        if getattr(self, 'fd', None) is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def __del__(self):
+        self.close()
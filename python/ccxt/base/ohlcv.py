@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+"""Columnar (struct-of-arrays) container for OHLCV candles"""
+
+# -----------------------------------------------------------------------------
+
+from array import array
+from bisect import bisect_left
+
+# optional, the columns are exposed as zero-copy numpy arrays when it is installed
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'OHLCVColumns',
+]
+
+# -----------------------------------------------------------------------------
+
+NAN = float('nan')
+
+
+def to_float(value):
+    # missing values are stored as NaN, array('d') can't hold None
+    return NAN if value is None else float(value)
+
+
+class OHLCVColumns(object):
+    """
+    Candles stored as one typed array per field: array('q') for the timestamps and the trade counts,
+    array('d') for the prices and the volumes, missing values are stored as NaN.
+
+    It quacks like the regular list of [timestamp, open, high, low, close, volume(, count)] rows:
+    len(), iteration and indexing return rows, slicing returns another OHLCVColumns instance.
+    """
+
+    fields = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+    def __init__(self, timestamp=None, open=None, high=None, low=None, close=None, volume=None, count=None):
+        self.timestamp = array('q') if timestamp is None else timestamp
+        self.open = array('d') if open is None else open
+        self.high = array('d') if high is None else high
+        self.low = array('d') if low is None else low
+        self.close = array('d') if close is None else close
+        self.volume = array('d') if volume is None else volume
+        # only candles built from trades carry the number of trades
+        self.count = count
+
+    @classmethod
+    def from_rows(cls, rows, with_count=False):
+        # the rows without a timestamp are skipped, they can't be sorted or filtered by time
+        result = cls(count=array('q') if with_count else None)
+        for row in rows:
+            if row[0] is not None:
+                result.append(*row)
+        return result
+
+    def append(self, timestamp, open, high, low, close, volume, count=None):
+        # the timestamps parsed with safe_number() are floats, array('q') only holds integers
+        self.timestamp.append(int(timestamp))
+        self.open.append(to_float(open))
+        self.high.append(to_float(high))
+        self.low.append(to_float(low))
+        self.close.append(to_float(close))
+        self.volume.append(to_float(volume))
+        if self.count is not None:
+            self.count.append(0 if count is None else int(count))
+
+    def columns(self):
+        columns = [self.timestamp, self.open, self.high, self.low, self.close, self.volume]
+        if self.count is not None:
+            columns.append(self.count)
+        return columns
+
+    def __len__(self):
+        return len(self.timestamp)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OHLCVColumns(*[column[index] for column in self.columns()])
+        return [column[index] for column in self.columns()]
+
+    def __iter__(self):
+        return (list(row) for row in zip(*self.columns()))
+
+    def __eq__(self, other):
+        if isinstance(other, OHLCVColumns):
+            other = other.to_list()
+        return self.to_list() == other
+
+    def __repr__(self):
+        return 'OHLCVColumns(' + str(len(self)) + ' candles)'
+
+    def to_list(self):
+        return list(self)
+
+    def without_count(self):
+        return OHLCVColumns(self.timestamp, self.open, self.high, self.low, self.close, self.volume)
+
+    def is_sorted(self):
+        timestamp = self.timestamp
+        return all(timestamp[i] <= timestamp[i + 1] for i in range(len(timestamp) - 1))
+
+    def sort(self):
+        # a stable sort by timestamp, like sort_by(ohlcvs, 0)
+        if self.is_sorted():
+            return self
+        order = sorted(range(len(self)), key=self.timestamp.__getitem__)
+        columns = [array(column.typecode, [column[i] for i in order]) for column in self.columns()]
+        return OHLCVColumns(*columns)
+
+    def filter_by_since_limit(self, since=None, limit=None, tail=False):
+        # the sorted equivalent of Exchange.filter_by_since_limit(ohlcvs, since, limit, 0, tail)
+        result = self
+        if since is not None:
+            result = result[bisect_left(result.timestamp, since):]
+        if limit is not None:
+            result = result[-limit:] if tail else result[:limit]
+        return result
+
+    def to_numpy(self):
+        """Returns a dict of numpy arrays sharing the memory of the columns"""
+        if numpy is None:
+            raise ImportError('OHLCVColumns.to_numpy() requires numpy, install it with `pip install numpy`')
+        names = self.fields + (['count'] if self.count is not None else [])
+        result = {}
+        for name, column in zip(names, self.columns()):
+            dtype = numpy.int64 if column.typecode == 'q' else numpy.float64
+            result[name] = numpy.frombuffer(column, dtype=dtype) if len(column) else numpy.empty(0, dtype=dtype)
+        return result
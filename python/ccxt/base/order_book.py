@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""Sorted order books that are kept up to date with snapshots and deltas, used by the REST and the websocket exchanges"""
+
+# -----------------------------------------------------------------------------
+
+import zlib
+
+from ccxt.base import order_book_side
+from ccxt.base.errors import InvalidNonce
+from ccxt.base.decimal_to_precision import number_to_string
+from ccxt.base.exchange import Exchange
+import sys
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'OrderBook',
+    'CountedOrderBook',
+    'IndexedOrderBook',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class OrderBook(dict):
+    def __init__(self, snapshot={}, depth=None):
+        self.cache = []
+        depth = depth or sys.maxsize
+        defaults = {
+            'bids': [],
+            'asks': [],
+            'timestamp': None,
+            'datetime': None,
+            'nonce': None,
+            'symbol': None,
+        }
+        # do not mutate snapshot
+        defaults.update(snapshot)
+        if not isinstance(defaults['asks'], order_book_side.OrderBookSide):
+            defaults['asks'] = order_book_side.Asks(defaults['asks'], depth)
+        if not isinstance(defaults['bids'], order_book_side.OrderBookSide):
+            defaults['bids'] = order_book_side.Bids(defaults['bids'], depth)
+        defaults['datetime'] = Exchange.iso8601(defaults.get('timestamp'))
+        # merge to self
+        super(OrderBook, self).__init__(defaults)
+
+    def limit(self, n=None):
+        self['asks'].limit(n)
+        self['bids'].limit(n)
+        return self
+
+    def reset(self, snapshot={}):
+        self['asks']._index.clear()
+        self['asks'].clear()
+        for ask in snapshot.get('asks', []):
+            self['asks'].storeArray(ask)
+        self['bids']._index.clear()
+        self['bids'].clear()
+        for bid in snapshot.get('bids', []):
+            self['bids'].storeArray(bid)
+        self['nonce'] = snapshot.get('nonce')
+        self['timestamp'] = snapshot.get('timestamp')
+        self['datetime'] = Exchange.iso8601(self['timestamp'])
+        self['symbol'] = snapshot.get('symbol')
+
+    def load(self, bids=[], asks=[], timestamp=None, nonce=None, symbol=None):
+        # resets the book to the unsorted levels of a snapshot, the levels are stored, not copied
+        self['bids'].load(bids)
+        self['asks'].load(asks)
+        self['nonce'] = nonce
+        self['timestamp'] = timestamp
+        self['datetime'] = Exchange.iso8601(timestamp)
+        self['symbol'] = symbol
+        return self
+
+    def update(self, snapshot):
+        nonce = snapshot.get('nonce')
+        if nonce is not None and self['nonce'] is not None and nonce < self['nonce']:
+            return self
+        self.reset(snapshot)
+
+    def apply_delta(self, bids=[], asks=[], timestamp=None, nonce=None):
+        # the changed levels are stored with a binary search, a zero amount removes the level
+        for bid in bids:
+            self['bids'].storeArray(list(bid))
+        for ask in asks:
+            self['asks'].storeArray(list(ask))
+        if timestamp is not None:
+            self['timestamp'] = timestamp
+            self['datetime'] = Exchange.iso8601(timestamp)
+        if nonce is not None:
+            self['nonce'] = nonce
+        return self
+
+    def best_bid(self):
+        return self['bids'][0] if len(self['bids']) > 0 else None
+
+    def best_ask(self):
+        return self['asks'][0] if len(self['asks']) > 0 else None
+
+    def checksum(self, style='okx', depth=None, format_level=None):
+        """
+        The crc32 of the top levels in the format of the exchange: 'okx' interleaves the first 25 bids and asks
+        as price:amount and is signed, 'kraken' concatenates the first 10 asks and then the bids without the dots
+        and the leading zeros and is unsigned. The exchanges compute it from the strings they send, format_level
+        returns the [price, amount] strings of a level, number_to_string() of both by default, kraken pads
+        them to the precision of the market.
+        """
+        format_level = format_level or (lambda level: [number_to_string(level[0]), number_to_string(level[1])])
+        bids = self['bids']
+        asks = self['asks']
+        if style == 'okx':
+            depth = 25 if depth is None else depth
+            parts = []
+            for i in range(depth):
+                if i < len(bids):
+                    parts.extend(format_level(bids[i]))
+                if i < len(asks):
+                    parts.extend(format_level(asks[i]))
+            checksum = zlib.crc32(':'.join(parts).encode())
+            return checksum - 0x100000000 if checksum > 0x7fffffff else checksum
+        elif style == 'kraken':
+            depth = 10 if depth is None else depth
+            parts = []
+            for level in asks[:depth] + bids[:depth]:
+                parts.extend([part.replace('.', '').lstrip('0') for part in format_level(level)])
+            return zlib.crc32(''.join(parts).encode())
+        raise ValueError('unknown order book checksum style ' + str(style))
+
+    def verify_checksum(self, checksum, style='okx', depth=None, format_level=None):
+        if int(checksum) != self.checksum(style, depth, format_level):
+            raise InvalidNonce(str(self['symbol']) + ' order book checksum error, the book is out of sync')
+        return self
+
+# -----------------------------------------------------------------------------
+# overwrites absolute volumes at price levels
+# or deletes price levels based on order counts (3rd value in a bidask delta)
+
+
+class CountedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.CountedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.CountedBids(snapshot.get('bids', []), depth),
+        })
+        super(CountedOrderBook, self).__init__(copy, depth)
+
+# -----------------------------------------------------------------------------
+# indexed by order ids (3rd value in a bidask delta)
+
+
+class IndexedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.IndexedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth),
+        })
+        super(IndexedOrderBook, self).__init__(copy, depth)
@@ -10,23 +10,78 @@
 #
 # (╯°□°）╯︵ ┻━┻
 
+from functools import lru_cache
+
+# the same prices, amounts and fee rates are parsed over and over again by the safe_* methods
+PARSE_CACHE_SIZE = 4096
+
+powers_of_ten = tuple(10 ** exponent for exponent in range(64))
+
+
+def power_of_ten(exponent):
+    return powers_of_ten[exponent] if exponent < 64 else 10 ** exponent
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_decimal_string(number):
+    """Returns the (integer, decimals) pair representing a decimal string"""
+    modifier = 0
+    number = number.lower()
+    if 'e' in number:
+        number, modifier = number.split('e')
+        modifier = int(modifier)
+    decimal_index = number.find('.')
+    if decimal_index > -1:
+        decimals = len(number) - decimal_index - 1
+        integer = int(number.replace('.', ''))
+    else:
+        decimals = 0
+        integer = int(number)
+    return integer, decimals - modifier
+
+
+def decimal_string(integer, decimals):
+    """Formats an (integer, decimals) pair the same way as str(Precise(integer, decimals))"""
+    if integer == 0:
+        return '0'
+    sign = ''
+    if integer < 0:
+        sign = '-'
+        integer = -integer
+    digits = str(integer)
+    if decimals <= 0:
+        return sign + digits + '0' * -decimals
+    significant = digits.rstrip('0')
+    trailing = len(digits) - len(significant)
+    if trailing >= decimals:
+        return sign + digits[:-decimals]
+    decimals -= trailing
+    length = len(significant)
+    if length > decimals:
+        return sign + significant[:length - decimals] + '.' + significant[length - decimals:]
+    return sign + '0.' + '0' * (decimals - length) + significant
+
+
+def align(integer1, decimals1, integer2, decimals2):
+    """Scales two (integer, decimals) pairs to the same number of decimals"""
+    if decimals1 > decimals2:
+        return integer1, integer2 * power_of_ten(decimals1 - decimals2), decimals1
+    elif decimals1 < decimals2:
+        return integer1 * power_of_ten(decimals2 - decimals1), integer2, decimals2
+    return integer1, integer2, decimals1
+
+
+def compare(string1, string2):
+    integer1, decimals1 = parse_decimal_string(string1)
+    integer2, decimals2 = parse_decimal_string(string2)
+    integer1, integer2, _ = align(integer1, decimals1, integer2, decimals2)
+    return (integer1 > integer2) - (integer1 < integer2)
+
 
 class Precise:
     def __init__(self, number, decimals=None):
         if decimals is None:
-            modifier = 0
-            number = number.lower()
-            if 'e' in number:
-                number, modifier = number.split('e')
-                modifier = int(modifier)
-            decimal_index = number.find('.')
-            if decimal_index > -1:
-                self.decimals = len(number) - decimal_index - 1
-                self.integer = int(number.replace('.', ''))
-            else:
-                self.decimals = 0
-                self.integer = int(number)
-            self.decimals = self.decimals - modifier
+            self.integer, self.decimals = parse_decimal_string(number)
         else:
             self.integer = number
             self.decimals = decimals
@@ -86,11 +141,9 @@ class Precise:
         if distance == 0:
             numerator = self.integer
         elif distance < 0:
-            exponent = self.base ** -distance
-            numerator = self.integer // exponent
+            numerator = self.integer // power_of_ten(-distance)
         else:
-            exponent = self.base ** distance
-            numerator = self.integer * exponent
+            numerator = self.integer * power_of_ten(distance)
         result, mod = divmod(numerator, other.integer)
         # python floors negative numbers down instead of truncating
         # if mod is zero it will be floored to itself so we do not add one
@@ -104,7 +157,7 @@ class Precise:
         else:
             smaller, bigger = [other, self] if self.decimals > other.decimals else [self, other]
             exponent = bigger.decimals - smaller.decimals
-            normalised = smaller.integer * (self.base ** exponent)
+            normalised = smaller.integer * power_of_ten(exponent)
             result = normalised + bigger.integer
             return Precise(result, bigger.decimals)
 
@@ -120,9 +173,9 @@ class Precise:
 
     def mod(self, other):
         rationizerNumberator = max(-self.decimals + other.decimals, 0)
-        numerator = self.integer * (self.base ** rationizerNumberator)
+        numerator = self.integer * power_of_ten(rationizerNumberator)
         rationizerDenominator = max(-other.decimals + self.decimals, 0)
-        denominator = other.integer * (self.base ** rationizerDenominator)
+        denominator = other.integer * power_of_ten(rationizerDenominator)
         result = numerator % denominator
         return Precise(result, rationizerDenominator + other.decimals)
 
@@ -168,20 +221,7 @@ class Precise:
         return self.decimals == other.decimals and self.integer == other.integer
 
     def __str__(self):
-        self.reduce()
-        sign = '-' if self.integer < 0 else ''
-        integer_array = list(str(abs(self.integer)).rjust(self.decimals, '0'))
-        index = len(integer_array) - self.decimals
-        if index == 0:
-            item = '0.'
-        elif self.decimals < 0:
-            item = '0' * (-self.decimals)
-        elif self.decimals == 0:
-            item = ''
-        else:
-            item = '.'
-        integer_array.insert(index, item)
-        return sign + ''.join(integer_array)
+        return decimal_string(self.integer, self.decimals)
 
     def __repr__(self):
         return "Precise(" + str(self) + ")"
@@ -189,20 +229,26 @@ class Precise:
     def __float__(self):
         return float(str(self))
 
+    # the string_* methods below work on the cached (integer, decimals) pairs directly
+    # and skip the allocation of the intermediate Precise instances
+
     @staticmethod
     def string_mul(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).mul(Precise(string2)))
+        integer1, decimals1 = parse_decimal_string(string1)
+        integer2, decimals2 = parse_decimal_string(string2)
+        return decimal_string(integer1 * integer2, decimals1 + decimals2)
 
     @staticmethod
     def string_div(string1, string2, precision=18):
         if string1 is None or string2 is None:
             return None
-        string2_precise = Precise(string2)
-        if string2_precise.integer == 0:
+        integer2, decimals2 = parse_decimal_string(string2)
+        if integer2 == 0:
             return None
-        return str(Precise(string1).div(string2_precise, precision))
+        integer1, decimals1 = parse_decimal_string(string1)
+        return str(Precise(integer1, decimals1).div(Precise(integer2, decimals2), precision))
 
     @staticmethod
     def string_add(string1, string2):
@@ -212,25 +258,71 @@ class Precise:
             return string2
         elif string2 is None:
             return string1
-        return str(Precise(string1).add(Precise(string2)))
+        integer1, decimals1 = parse_decimal_string(string1)
+        integer2, decimals2 = parse_decimal_string(string2)
+        integer1, integer2, decimals = align(integer1, decimals1, integer2, decimals2)
+        return decimal_string(integer1 + integer2, decimals)
 
     @staticmethod
     def string_sub(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).sub(Precise(string2)))
+        integer1, decimals1 = parse_decimal_string(string1)
+        integer2, decimals2 = parse_decimal_string(string2)
+        integer1, integer2, decimals = align(integer1, decimals1, integer2, decimals2)
+        return decimal_string(integer1 - integer2, decimals)
+
+    @staticmethod
+    def string_sum(strings):
+        """Adds up a list of strings in one pass, None values are skipped like in string_add"""
+        total = 0
+        total_decimals = None
+        for string in strings:
+            if string is None:
+                continue
+            integer, decimals = parse_decimal_string(string)
+            if total_decimals is None:
+                total, total_decimals = integer, decimals
+            else:
+                total, integer, total_decimals = align(total, total_decimals, integer, decimals)
+                total += integer
+        if total_decimals is None:
+            return None
+        return decimal_string(total, total_decimals)
+
+    @staticmethod
+    def string_mul_sum(strings1, strings2):
+        """Returns the sum of the pairwise products, for instance the total cost of a list of prices and amounts"""
+        total = 0
+        total_decimals = None
+        for string1, string2 in zip(strings1, strings2):
+            if string1 is None or string2 is None:
+                continue
+            integer1, decimals1 = parse_decimal_string(string1)
+            integer2, decimals2 = parse_decimal_string(string2)
+            integer, decimals = integer1 * integer2, decimals1 + decimals2
+            if total_decimals is None:
+                total, total_decimals = integer, decimals
+            else:
+                total, integer, total_decimals = align(total, total_decimals, integer, decimals)
+                total += integer
+        if total_decimals is None:
+            return None
+        return decimal_string(total, total_decimals)
 
     @staticmethod
     def string_abs(string):
         if string is None:
             return None
-        return str(Precise(string).abs())
+        integer, decimals = parse_decimal_string(string)
+        return decimal_string(abs(integer), decimals)
 
     @staticmethod
     def string_neg(string):
         if string is None:
             return None
-        return str(Precise(string).neg())
+        integer, decimals = parse_decimal_string(string)
+        return decimal_string(-integer, decimals)
 
     @staticmethod
     def string_mod(string1, string2):
@@ -242,46 +334,46 @@ class Precise:
     def string_equals(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        return compare(string1, string2) == 0
 
     @staticmethod
     def string_eq(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        return compare(string1, string2) == 0
 
     @staticmethod
     def string_min(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).min(Precise(string2)))
+        return str(Precise(string1 if compare(string1, string2) < 0 else string2))
 
     @staticmethod
     def string_max(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).max(Precise(string2)))
+        return str(Precise(string1 if compare(string1, string2) > 0 else string2))
 
     @staticmethod
     def string_gt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).gt(Precise(string2))
+        return compare(string1, string2) > 0
 
     @staticmethod
     def string_ge(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).ge(Precise(string2))
+        return compare(string1, string2) >= 0
 
     @staticmethod
     def string_lt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).lt(Precise(string2))
+        return compare(string1, string2) < 0
 
     @staticmethod
     def string_le(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).le(Precise(string2))
+        return compare(string1, string2) <= 0
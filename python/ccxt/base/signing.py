@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""The keyed signing state of a secret, prepared once and reused by the signatures of an exchange instance"""
+
+# -----------------------------------------------------------------------------
+
+import base64
+import hmac
+
+from cryptography.hazmat import backends
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'SigningContext',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class SigningContext(object):
+    """
+    The state prepared from one secret: the HMAC objects already keyed with it, copied for every signature instead of
+    hashing the key again, the parsed RSA key and the decoded secrets.
+    Everything is prepared on the first signature that needs it.
+    """
+
+    def __init__(self, secret):
+        self.secret = secret
+        self.hmacs = {}  # the hash algorithm → the keyed HMAC object
+        self.rsa_key = None
+        self.ecdsa_secrets = {}  # the curve → the secret exponent
+        self.binary = None  # the secret decoded from hex
+
+    def hmac(self, request, algorithm):
+        keyed = self.hmacs.get(algorithm)
+        if keyed is None:
+            keyed = hmac.new(self.secret, None, algorithm)
+            self.hmacs[algorithm] = keyed
+        h = keyed.copy()
+        h.update(request)
+        return h.digest()
+
+    def rsa_private_key(self):
+        if self.rsa_key is None:
+            self.rsa_key = load_pem_private_key(self.secret, None, backends.default_backend())
+        return self.rsa_key
+
+    def base16_secret(self):
+        if self.binary is None:
+            secret = self.secret if isinstance(self.secret, bytes) else self.secret.encode('latin-1')
+            self.binary = base64.b16decode(secret, casefold=True)
+        return self.binary
+
+    def ecdsa_secret_exponent(self, curve):
+        # checked like ecdsa.SigningKey.from_string()
+        secexp = self.ecdsa_secrets.get(curve)
+        if secexp is None:
+            from ccxt.static_dependencies.ecdsa.util import string_to_number
+            binary = self.base16_secret()
+            assert len(binary) == curve.baselen, (len(binary), curve.baselen)
+            secexp = string_to_number(binary)
+            assert 1 <= secexp < curve.order
+            self.ecdsa_secrets[curve] = secexp
+        return secexp
@@ -0,0 +1,174 @@
+import math
+import os
+import struct
+import threading
+import time
+from ccxt.base.errors import NotSupported
+from ccxt.base.errors import RequestTimeout
+
+# optional, the shared throttler locks its file with flock(), which is not available on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class Throttler:
+    """
+    The synchronous counterpart of ccxt.async_support.base.throttler.Throttler: a weighted token bucket
+    refilled at refillRate tokens per millisecond up to capacity, a request is let through when the bucket
+    is not negative and takes cost tokens from it. Calling the throttler blocks the calling thread until its
+    turn comes, the turns are handed out in the order of the calls, so one exchange instance can be shared
+    between threads. The time is measured with the monotonic clock, which is not affected by clock changes.
+
+    The priority is accepted for compatibility with the asynchronous throttler and ignored, a blocked thread
+    has already taken its tokens. A request that would be sent after its deadline raises a RequestTimeout
+    without taking any tokens.
+    """
+
+    def __init__(self, config):
+        self.config = {
+            'refillRate': 1.0,
+            'delay': 0.001,
+            'cost': 1.0,
+            'tokens': 0,
+            'maxCapacity': 2000,
+            'capacity': 1.0,
+        }
+        self.config.update(config)
+        self.lock = threading.Lock()
+        self.last_timestamp = None
+
+    def refill(self):
+        # called with the lock held, returns the current time in milliseconds
+        now = time.monotonic() * 1000
+        if self.last_timestamp is not None:
+            elapsed = now - self.last_timestamp
+            tokens = self.config['tokens']
+            # the refill stops at capacity, the initial tokens above it are kept until they are spent
+            self.config['tokens'] = min(tokens + elapsed * self.config['refillRate'], max(tokens, self.config['capacity']))
+        self.last_timestamp = now
+        return now
+
+    def reserve(self, cost=None, deadline=None):
+        """Takes the tokens for a request and returns the number of milliseconds to wait before sending it"""
+        cost = self.config['cost'] if cost is None else cost
+        refill_rate = self.config['refillRate']
+        if refill_rate == float('inf'):
+            return 0
+        with self.lock:
+            return self.take(cost, deadline)
+
+    def take(self, cost, deadline):
+        # called with the lock held
+        now = self.refill()
+        tokens = self.config['tokens']
+        delay = 0 if tokens >= 0 else -tokens / self.config['refillRate']
+        if deadline is not None and now + delay > deadline:
+            raise RequestTimeout('throttle deadline exceeded before the request was sent')
+        # the tokens are taken right away, the requests that come next wait for them to be refilled
+        self.config['tokens'] = tokens - cost
+        return delay
+
+    def reconcile(self, tokens):
+        """Lowers the tokens in the bucket to the given number, if it holds more"""
+        with self.lock:
+            self.refill()
+            self.config['tokens'] = min(self.config['tokens'], tokens)
+
+    def __call__(self, cost=None, priority=None, deadline=None):
+        delay = self.reserve(cost, deadline)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+
+class SharedBucketLock(object):
+    # the lock of a SharedThrottler: it loads the bucket from the file when acquired and stores it when released
+
+    layout = struct.Struct('dd')  # tokens, last timestamp (NaN until the first request)
+
+    def __init__(self, throttler, path):
+        self.throttler = throttler
+        self.path = path
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        # flock() does not exclude the threads of the same process, they share the open file
+        self.thread_lock = threading.Lock()
+
+    def acquire(self, blocking=True):
+        # returns False right away if another thread or process holds the lock and blocking is False
+        if not self.thread_lock.acquire(blocking):
+            return False
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX if blocking else (fcntl.LOCK_EX | fcntl.LOCK_NB))
+        except BlockingIOError:
+            self.thread_lock.release()
+            return False
+        except BaseException:
+            self.thread_lock.release()
+            raise
+        try:
+            data = os.pread(self.fd, self.layout.size, 0)
+        except BaseException:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            self.thread_lock.release()
+            raise
+        # a new file starts with the configured tokens
+        if len(data) == self.layout.size:
+            tokens, last_timestamp = self.layout.unpack(data)
+            self.throttler.config['tokens'] = tokens
+            self.throttler.last_timestamp = None if math.isnan(last_timestamp) else last_timestamp
+        return True
+
+    def release(self):
+        try:
+            last_timestamp = self.throttler.last_timestamp
+            data = self.layout.pack(self.throttler.config['tokens'], math.nan if last_timestamp is None else last_timestamp)
+            os.pwrite(self.fd, data, 0)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            self.thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def close(self):
+        if getattr(self, 'fd', None) is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def __del__(self):
+        self.close()
+
+
+class SharedThrottler(Throttler):
+    """
+    A Throttler whose bucket is stored in a file, so that all the processes of the machine that throttle with the
+    same file share one budget, like the workers sending their requests from the same IP address. Every request
+    updates the file under an exclusive flock(), the time is taken from the monotonic clock of the system, which
+    is the same in all the processes. The processes should use the same refillRate and capacity.
+    """
+
+    def __init__(self, config, path):
+        if fcntl is None:
+            raise NotSupported('SharedThrottler requires fcntl.flock(), which is not available on this platform')
+        super(SharedThrottler, self).__init__(config)
+        self.lock = SharedBucketLock(self, path)
+
+    def try_reserve(self, cost=None, deadline=None):
+        """Like reserve(), but returns None instead of waiting when another thread or process holds the bucket"""
+        cost = self.config['cost'] if cost is None else cost
+        if self.config['refillRate'] == float('inf'):
+            return 0
+        if not self.lock.acquire(False):
+            return None
+        try:
+            return self.take(cost, deadline)
+        finally:
+            self.lock.release()
+
+    def close(self):
+        self.lock.close()
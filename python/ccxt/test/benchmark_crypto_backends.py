@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import hashlib
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.base import crypto_backends  # noqa: E402
+from ccxt.static_dependencies import ecdsa  # noqa: E402
+from ccxt.static_dependencies import keccak  # noqa: E402
+from ccxt.static_dependencies.ecdsa.util import sigencode_strings_canonize  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures the deterministic ecdsa signatures per second of every curve with one key, signed by the static ecdsa
+# module and with the backend selected for the curve, and the keccak hashes per second of a 1 kB message
+#
+#     python python/ccxt/test/benchmark_crypto_backends.py [seconds per measurement]
+
+duration = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+
+curves = [
+    [ecdsa.NIST192p, hashlib.sha256],
+    [ecdsa.NIST224p, hashlib.sha256],
+    [ecdsa.NIST256p, hashlib.sha256],
+    [ecdsa.NIST384p, hashlib.sha384],
+    [ecdsa.NIST521p, hashlib.sha512],
+    [ecdsa.SECP256k1, hashlib.sha256],
+]
+
+
+def measure(function):
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < duration:
+        function(count)
+        count += 1
+    return count / (time.perf_counter() - started)
+
+
+def main():
+    print('{:<12} {:<14} {:>14} {:>14} {:>8}'.format('curve', 'backend', 'ecdsa sig/s', 'backend sig/s', 'ratio'))
+    for curve, hashfunc in curves:
+        secexp = curve.order // 3
+        key = ecdsa.SigningKey.from_secret_exponent(secexp, curve=curve)
+        backend = crypto_backends.get_ecdsa_backend(curve)
+
+        def library(i):
+            key.sign_digest_deterministic(hashfunc(str(i).encode()).digest()[:curve.baselen], hashfunc=hashfunc, sigencode=sigencode_strings_canonize)
+
+        def accelerated(i):
+            crypto_backends.sign_digest_deterministic(curve, secexp, hashfunc(str(i).encode()).digest()[:curve.baselen], hashfunc)
+
+        before = measure(library)
+        after = measure(accelerated)
+        print('{:<12} {:<14} {:>14.0f} {:>14.0f} {:>8.2f}'.format(curve.name, backend, before, after, after / before))
+    message = b'x' * 1024
+    before = measure(lambda i: keccak.SHA3(message))
+    after = measure(lambda i: crypto_backends.keccak_256(message))
+    name = 'pycryptodome' if crypto_backends.cryptodome_keccak is not None else 'static'
+    print('{:<12} {:<14} {:>14.0f} {:>14.0f} {:>8.2f}'.format('keccak', name, before, after, after / before))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.base import decimal_to_precision as module  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import decimals_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND  # noqa: E402
+from ccxt.base.decimal_to_precision import DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE  # noqa: E402
+from ccxt.base.decimal_to_precision import NO_PADDING, PAD_WITH_ZERO  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures the values/s formatted by decimal_to_precision() one by one, by decimals_to_precision()
+# for a list and, if numpy is installed, for a float64 array, in the modes of test_decimal_to_precision.py
+#
+#     python python/ccxt/test/benchmark_decimal_to_precision.py [values]
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+modes = [
+    ('DECIMAL_PLACES', TRUNCATE, 8, DECIMAL_PLACES),
+    ('DECIMAL_PLACES', ROUND, 2, DECIMAL_PLACES),
+    ('DECIMAL_PLACES', ROUND, -2, DECIMAL_PLACES),
+    ('SIGNIFICANT_DIGITS', TRUNCATE, 5, SIGNIFICANT_DIGITS),
+    ('SIGNIFICANT_DIGITS', ROUND, 5, SIGNIFICANT_DIGITS),
+    ('TICK_SIZE', TRUNCATE, 0.001, TICK_SIZE),
+    ('TICK_SIZE', ROUND, 0.01, TICK_SIZE),
+    ('TICK_SIZE', ROUND, 0.5, TICK_SIZE),
+]
+
+random.seed(0)
+# the price levels of a grid around 27000
+values = [round(27000 + random.uniform(-500, 500), random.randint(2, 6)) for _ in range(count)]
+
+
+def per_second(function):
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    numpy = module.numpy
+    array = None if numpy is None else numpy.array(values, dtype=numpy.float64)
+    print('values:', count, 'numpy:', 'no' if numpy is None else numpy.__version__)
+    header = '{:<20} {:<9} {:>10} {:<14} {:>12} {:>12} {:>12}'
+    row = '{:<20} {:<9} {:>10} {:<14} {:>12.0f} {:>12.0f} {:>12}'
+    print(header.format('counting', 'rounding', 'precision', 'padding', 'scalar/s', 'list/s', 'array/s'))
+    for name, rounding_mode, precision, counting_mode in modes:
+        for padding_mode in [NO_PADDING, PAD_WITH_ZERO]:
+            arguments = (rounding_mode, precision, counting_mode, padding_mode)
+            scalar = per_second(lambda: [decimal_to_precision(value, *arguments) for value in values])
+            batch = per_second(lambda: decimals_to_precision(values, *arguments))
+            vectorized = '-' if array is None else '{:.0f}'.format(per_second(lambda: decimals_to_precision(array, *arguments)))
+            rounding = 'ROUND' if rounding_mode == ROUND else 'TRUNCATE'
+            padding = 'NO_PADDING' if padding_mode == NO_PADDING else 'PAD_WITH_ZERO'
+            print(row.format(name, rounding, precision, padding, scalar, batch, vectorized))
+
+
+if __name__ == '__main__':
+    main()
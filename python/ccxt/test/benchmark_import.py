@@ -0,0 +1,66 @@
+import os
+import sys
+import json
+import subprocess
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+# measures the cold start of `import ccxt` with eager and lazy (CCXT_LAZY_LOAD=1) exchange loading
+# every measurement runs in a fresh interpreter, so the numbers include the whole import graph
+#
+#     python python/ccxt/test/benchmark_import.py [runs] [exchange_id ...]
+
+runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+exchange_ids = sys.argv[2:] if len(sys.argv) > 2 else ['binance']
+
+probe = '''
+import json
+import resource
+import sys
+import time
+start = time.perf_counter()
+import {package} as ccxt
+imported = time.perf_counter()
+for exchange_id in {exchange_ids!r}:
+    getattr(ccxt, exchange_id)()
+instantiated = time.perf_counter()
+maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    'import_ms': (imported - start) * 1000,
+    'instantiate_ms': (instantiated - imported) * 1000,
+    'maxrss_kb': maxrss,
+    'modules': len(sys.modules),
+}}))
+'''
+
+
+def measure(package, lazy):
+    env = dict(os.environ, PYTHONPATH=root)
+    env.pop('CCXT_LAZY_LOAD', None)
+    if lazy:
+        env['CCXT_LAZY_LOAD'] = '1'
+    code = probe.format(package=package, exchange_ids=exchange_ids)
+    results = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', code], env=env)
+        results.append(json.loads(output))
+    # the median run is less sensitive to the disk cache and to the noisy neighbours
+    return {key: sorted(result[key] for result in results)[len(results) // 2] for key in results[0]}
+
+
+def main():
+    print('runs:', runs, 'exchanges:', ', '.join(exchange_ids))
+    header = '{:<20} {:>6} {:>12} {:>16} {:>12} {:>8}'
+    row = '{:<20} {:>6} {:>12.1f} {:>16.1f} {:>12} {:>8}'
+    print(header.format('package', 'mode', 'import ms', 'instantiate ms', 'maxrss kb', 'modules'))
+    for package in ['ccxt', 'ccxt.async_support']:
+        for lazy in [False, True]:
+            result = measure(package, lazy)
+            print(row.format(package, 'lazy' if lazy else 'full', result['import_ms'], result['instantiate_ms'], result['maxrss_kb'], result['modules']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures how many exchange instances per second can be created once the implicit api
+# methods and the camelcase aliases have been generated by the first instance of the class
+#
+#     python python/ccxt/test/benchmark_instantiation.py [instances] [exchange_id ...]
+
+instances = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+exchange_ids = sys.argv[2:] if len(sys.argv) > 2 else ['binance', 'huobi', 'okx', 'bybit', 'gate', 'kucoin', 'kraken']
+
+
+def benchmark(exchange_class):
+    start = time.perf_counter()
+    exchange_class()
+    first = time.perf_counter()
+    for _ in range(instances):
+        exchange_class()
+    end = time.perf_counter()
+    return (first - start) * 1000, instances / (end - first)
+
+
+def main():
+    print('instances:', instances)
+    print('{:<20} {:<8} {:>16} {:>16}'.format('exchange', 'mode', 'first ms', 'instances/s'))
+    for exchange_id in exchange_ids:
+        for mode, package in [('sync', ccxt), ('async', ccxt.async_support)]:
+            first_ms, per_second = benchmark(getattr(package, exchange_id))
+            print('{:<20} {:<8} {:>16.2f} {:>16.1f}'.format(exchange_id, mode, first_ms, per_second))
+
+
+if __name__ == '__main__':
+    main()
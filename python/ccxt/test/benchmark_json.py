@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import json  # noqa: E402
+from ccxt.base.json_codec import json_codecs  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures the time to decode large responses with every installed JSON codec, with quoteJsonNumbers
+# on (the default) and off, recorded responses can be passed as files instead of the generated ones
+#
+#     python python/ccxt/test/benchmark_json.py [response.json ...]
+
+random.seed(1)
+
+
+def exchange_info(count=2000):
+    # the shape of binance exchangeInfo: the prices in strings, the precisions in numbers
+    return {'timezone': 'UTC', 'serverTime': 1660000000000, 'symbols': [{
+        'symbol': 'COIN' + str(i) + 'USDT',
+        'status': 'TRADING',
+        'baseAsset': 'COIN' + str(i),
+        'baseAssetPrecision': 8,
+        'quoteAsset': 'USDT',
+        'quotePrecision': 8,
+        'orderTypes': ['LIMIT', 'LIMIT_MAKER', 'MARKET', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT'],
+        'icebergAllowed': True,
+        'filters': [
+            {'filterType': 'PRICE_FILTER', 'minPrice': '0.00000100', 'maxPrice': '100000.00000000', 'tickSize': '0.00000100'},
+            {'filterType': 'LOT_SIZE', 'minQty': '0.10000000', 'maxQty': '9000000.00000000', 'stepSize': '0.10000000'},
+            {'filterType': 'MAX_NUM_ORDERS', 'maxNumOrders': 200},
+        ],
+        'permissions': ['SPOT', 'MARGIN'],
+    } for i in range(count)]}
+
+
+def tickers(count=3000):
+    # the shape of the okx and bybit tickers: all the numbers in strings
+    return {'code': '0', 'msg': '', 'data': [{
+        'instId': 'COIN' + str(i) + '-USDT',
+        'last': '%.8f' % (random.random() * 1000),
+        'askPx': '%.8f' % (random.random() * 1000),
+        'bidPx': '%.8f' % (random.random() * 1000),
+        'vol24h': '%.8f' % (random.random() * 1e6),
+        'ts': str(1660000000000 + i),
+    } for i in range(count)]}
+
+
+def klines(count=20000):
+    # the shape of binance klines: the timestamps and the trade counts in numbers
+    return [[1660000000000 + i * 60000, '%.2f' % (20000 + i % 1000), '%.2f' % (20010 + i % 1000), '%.2f' % (19990 + i % 1000),
+             '%.2f' % (20005 + i % 1000), '%.5f' % (i % 777 / 7), 1660000059999 + i * 60000, '0', 100, '0', '0', '0'] for i in range(count)]
+
+
+def payloads():
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            with open(path, 'rb') as file:
+                yield os.path.basename(path), file.read()
+    else:
+        for name, generate in [('exchangeInfo', exchange_info), ('tickers', tickers), ('klines', klines)]:
+            yield name, json.dumps(generate(), separators=(',', ':')).encode()
+
+
+def measure(function, repeat=20):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    print('{:<16} {:>8} {:>8} {:>14} {:>14}'.format('payload', 'KB', 'codec', 'quoted ms', 'numbers ms'))
+    for name, data in payloads():
+        text = data.decode()
+        for codec_name, codec in json_codecs.items():
+            quoted = measure(lambda: codec.loads(text, True))
+            numbers = measure(lambda: codec.loads(text, False))
+            print('{:<16} {:>8.0f} {:>8} {:>14.2f} {:>14.2f}'.format(name, len(data) / 1024, codec_name, quoted, numbers))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures the time of a request through fetch2() and of a unified method with the metrics disabled and enabled,
+# without the network, the responses are decoded from a constant body
+#
+#     python python/ccxt/test/benchmark_metrics.py [calls]
+
+calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+body = '{"symbol":"BTCUSDT","last":"19000.1"}'
+
+
+class fake(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), {
+            'id': 'fake',
+            'enableRateLimit': False,
+            'has': {'fetchTicker': True},
+            'urls': {'api': {'public': 'https://api.fake.test'}},
+            'api': {'public': {'get': ['ticker']}},
+        })
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': self.urls['api'][api] + '/' + path, 'method': method, 'body': body, 'headers': headers}
+
+    def fetch(self, url, method='GET', headers=None, body=None):
+        return self.parse_json(body)
+
+    def fetch_ticker(self, symbol, params={}):
+        response = self.publicGetTicker({'symbol': symbol})
+        return {'symbol': symbol, 'last': self.safe_number(response, 'last')}
+
+
+def measure(function):
+    started = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - started) / calls * 1000000
+
+
+def main():
+    print('{:<16} {:>14} {:>14} {:>10}'.format('call', 'disabled (µs)', 'enabled (µs)', 'overhead'))
+    disabled = fake()
+    enabled = fake({'enableMetrics': True})
+    for name, call in [['publicGetTicker', lambda exchange: exchange.publicGetTicker()], ['fetch_ticker', lambda exchange: exchange.fetch_ticker('BTCUSDT')]]:
+        before = measure(lambda: call(disabled))
+        after = measure(lambda: call(enabled))
+        print('{:<16} {:>14.2f} {:>14.2f} {:>10.2f}'.format(name, before, after, after - before))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt.async_support  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures the longest stall of the event loop while responses of a few megabytes are fetched and decoded and while
+# thousands of markets are loaded, with the work on the loop and offloaded to the threads and to the processes, a
+# coroutine ticking every millisecond records how late it runs
+#
+#     python python/ccxt/test/benchmark_offload.py [requests] [trades per response] [markets]
+
+requests = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+size = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+count = int(sys.argv[3]) if len(sys.argv) > 3 else 20000
+
+trades = [{'id': str(i), 'price': '19000.1', 'amount': '0.001', 'side': 'buy', 'timestamp': 1660000000000 + i} for i in range(size)]
+markets = [{
+    'id': 'C' + str(i) + 'USDT',
+    'symbol': 'C' + str(i) + '/USDT',
+    'base': 'C' + str(i),
+    'quote': 'USDT',
+    'baseId': 'C' + str(i),
+    'quoteId': 'USDT',
+    'type': 'spot',
+    'spot': True,
+    'precision': {'amount': 6, 'price': 2},
+    'info': {},
+} for i in range(count)]
+server = FakeServer({'/trades': lambda request: trades}).start()
+
+
+class fake(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), {
+            'id': 'fake',
+            'rateLimit': 1,
+            'urls': {'api': {'public': server.url}},
+            'api': {'public': {'get': ['trades']}},
+        })
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': self.urls['api'][api] + '/' + path, 'method': method, 'body': body, 'headers': headers}
+
+    async def fetch_markets(self, params={}):
+        return markets
+
+
+async def ticker(lags, done):
+    while not done.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append((time.perf_counter() - started) * 1000 - 1)
+
+
+async def measure(executor, work):
+    exchange = fake({'offloadExecutor': executor})
+    await exchange.publicGetTrades()  # the connection, the pools
+    lags = []
+    done = asyncio.Event()
+    task = asyncio.ensure_future(ticker(lags, done))
+    started = time.perf_counter()
+    if work == 'trades':
+        for _ in range(requests):
+            await exchange.publicGetTrades()
+    else:
+        await exchange.load_markets(True)
+    elapsed = time.perf_counter() - started
+    done.set()
+    await task
+    await exchange.close()
+    return elapsed, max(lags)
+
+
+async def main():
+    print('{:<10} {:<10} {:>12} {:>16}'.format('work', 'executor', 'seconds', 'max lag (ms)'))
+    for work in ['trades', 'markets']:
+        for executor in [None, 'thread', 'process']:
+            elapsed, lag = await measure(executor, work)
+            print('{:<10} {:<10} {:>12.2f} {:>16.1f}'.format(work, str(executor), elapsed, lag))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
+    server.stop()
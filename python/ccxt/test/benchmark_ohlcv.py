@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures the time to parse a binance klines response and the memory held by the resulting candles,
+# as lists of rows and as OHLCVColumns (columnarOHLCV), a year of 1m candles is 525600 rows
+#
+#     python python/ccxt/test/benchmark_ohlcv.py [candles]
+
+candles = int(sys.argv[1]) if len(sys.argv) > 1 else 525600
+
+start = 1600000000000
+response = [[
+    start + i * 60000,
+    '%.2f' % (20000 + i % 1000),
+    '%.2f' % (20010 + i % 1000),
+    '%.2f' % (19990 + i % 1000),
+    '%.2f' % (20005 + i % 1000),
+    '%.5f' % (i % 777 / 7),
+    start + i * 60000 + 59999,
+    '0', 100, '0', '0', '0',
+] for i in range(candles)]
+
+
+def measure(exchange):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    result = exchange.parse_ohlcvs(response, None, '1m')
+    elapsed = time.perf_counter() - started
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert len(result) == candles
+    return elapsed, held
+
+
+def main():
+    # tracemalloc slows the parsing down, the timings are measured in a separate pass
+    print('candles:', candles)
+    print('{:<10} {:>12} {:>14} {:>14}'.format('mode', 'parse s', 'candles/s', 'memory MB'))
+    for mode, config in [('rows', {}), ('columns', {'columnarOHLCV': True})]:
+        exchange = ccxt.binance(config)
+        started = time.perf_counter()
+        exchange.parse_ohlcvs(response, None, '1m')
+        elapsed = time.perf_counter() - started
+        _, held = measure(exchange)
+        print('{:<10} {:>12.2f} {:>14.0f} {:>14.1f}'.format(mode, elapsed, candles / elapsed, held / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+import os
+import sys
+import time
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.order_book import OrderBook  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures parse_order_book on books of 5000 levels a side, with and without keepOrderBooks, and keeping
+# a book up to date with deltas against sorting the whole book again after every delta
+#
+#     python python/ccxt/test/benchmark_order_book.py [levels] [changed levels per delta]
+
+levels = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+changes = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+random.seed(2)
+
+
+def side(start, step):
+    prices = [start + i * step for i in range(levels)]
+    random.shuffle(prices)
+    return [['%.2f' % price, '%.4f' % random.uniform(0.001, 5)] for price in prices]
+
+
+response = {'bids': side(19999.99, -0.01), 'asks': side(20000.01, 0.01)}
+deltas = [[
+    ['%.2f' % (19999.99 - random.randint(0, levels) * 0.01), random.choice(['0', '%.4f' % random.uniform(0.001, 5)])]
+    for _ in range(changes)
+] for _ in range(200)]
+
+
+def measure(function, repeat=20):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def compare(first, second, repeat=50):
+    # alternated, so that both see the same load of the machine
+    firsts = []
+    seconds = []
+    for _ in range(repeat):
+        firsts.append(measure(first, 1))
+        seconds.append(measure(second, 1))
+    return min(firsts), min(seconds)
+
+
+def deltas_sort_by(exchange):
+    bids = dict(exchange.parse_bids_asks(response['bids']))
+    for delta in deltas:
+        for price, amount in exchange.parse_bids_asks(delta):
+            if amount > 0:
+                bids[price] = amount
+            else:
+                bids.pop(price, None)
+        exchange.sort_by([[price, amount] for price, amount in bids.items()], 0, True)
+
+
+def deltas_order_book(exchange):
+    book = OrderBook({'bids': exchange.sort_by(exchange.parse_bids_asks(response['bids']), 0, True)})
+    for delta in deltas:
+        book.apply_delta(exchange.parse_bids_asks(delta))
+
+
+def main():
+    exchange = ccxt.Exchange()
+    keeping = ccxt.Exchange({'keepOrderBooks': True})
+    book = keeping.parse_order_book(response, 'BTC/USDT')
+    assert book == exchange.parse_order_book(response, 'BTC/USDT')
+    print('levels:', levels, 'changed levels per delta:', changes)
+    print('{:<36} {:>12}'.format('operation', 'ms'))
+    plain, kept = compare(lambda: exchange.parse_order_book(response, 'BTC/USDT'), lambda: keeping.parse_order_book(response, 'BTC/USDT'))
+    print('{:<36} {:>12.2f}'.format('parse_order_book', plain))
+    print('{:<36} {:>12.2f}'.format('parse_order_book, keepOrderBooks', kept))
+    print('{:<36} {:>12.2f}'.format('200 deltas, sorted again', measure(lambda: deltas_sort_by(exchange), 3)))
+    print('{:<36} {:>12.2f}'.format('200 deltas, OrderBook.apply_delta', measure(lambda: deltas_order_book(exchange), 3)))
+    started = time.perf_counter()
+    for _ in range(100000):
+        book.best_bid()
+        book.best_ask()
+    print('{:<36} {:>12.5f}'.format('best bid and ask', (time.perf_counter() - started) * 1000 / 100000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+import os
+import sys
+import copy
+import time
+import random
+import importlib
+import importlib.util
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.precise import Precise  # noqa: E402
+
+# ccxt.base is also the name of the list of the base exchange names in the ccxt package
+exchange_module = importlib.import_module('ccxt.base.exchange')
+
+# ----------------------------------------------------------------------------
+
+# measures the Precise string arithmetic on its own and inside safe_trade, safe_order, safe_balance
+# and reduce_fees_by_currency over realistic payloads, optionally against a reference implementation
+# loaded from another precise.py file, for instance one exported from an older revision:
+#
+#     git show <revision>:python/ccxt/base/precise.py > /tmp/precise_reference.py
+#     python python/ccxt/test/benchmark_precise.py [rows] [/tmp/precise_reference.py]
+
+rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+reference_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+random.seed(0)
+
+
+def random_decimal(digits, decimals):
+    return str(round(random.uniform(0, 10 ** digits), decimals))
+
+
+prices = [random_decimal(5, 2) for _ in range(100)]
+amounts = [random_decimal(1, 6) for _ in range(rows)]
+
+trades = [{
+    'id': str(index),
+    'timestamp': 1600000000000 + index,
+    'symbol': 'BTC/USDT',
+    'side': 'buy',
+    'price': random.choice(prices),
+    'amount': amounts[index],
+    'fee': {'cost': random_decimal(0, 8), 'currency': 'USDT', 'rate': '0.001'},
+    'info': {},
+} for index in range(rows)]
+
+orders = [{
+    'id': str(index),
+    'timestamp': 1600000000000 + index,
+    'symbol': 'BTC/USDT',
+    'type': 'limit',
+    'side': 'sell',
+    'price': random.choice(prices),
+    'amount': amounts[index],
+    'remaining': '0',
+    'status': 'closed',
+    'trades': [dict(trade, fee=dict(trade['fee'])) for trade in trades[index:index + 3]],
+    'info': {},
+} for index in range(rows)]
+
+balances = {'info': {}}
+for index in range(rows):
+    balances['C%05d' % index] = {'free': amounts[index], 'used': random.choice(amounts)}
+
+fees = [{'cost': trade['fee']['cost'], 'currency': 'USDT', 'rate': '0.001'} for trade in trades]
+
+
+class benchmark(ccxt.Exchange):
+
+    def parse_trade(self, trade, market=None):
+        return self.safe_trade(trade, market)
+
+
+def arithmetic(precise):
+    for price, amount in zip(prices * (rows // len(prices)), amounts):
+        precise.string_add(precise.string_mul(price, amount), amount)
+        precise.string_div(price, amount)
+        precise.string_gt(price, amount)
+
+
+def workloads(exchange, precise):
+    # safe_trade and safe_order parse the payloads in place, every run gets its own copy
+    market = exchange.market('BTC/USDT')
+    return [
+        ('string arithmetic', None, lambda payload: arithmetic(precise)),
+        ('safe_trade', trades, lambda payload: [exchange.safe_trade(trade, market) for trade in payload]),
+        ('safe_order', orders, lambda payload: [exchange.safe_order(order, market) for order in payload]),
+        ('safe_balance', balances, lambda payload: exchange.safe_balance(payload)),
+        ('reduce_fees_by_currency', fees, lambda payload: exchange.reduce_fees_by_currency(payload)),
+    ]
+
+
+def run(precise):
+    exchange_module.Precise = precise
+    exchange = benchmark({'id': 'benchmark'})
+    exchange.set_markets([{
+        'id': 'BTCUSDT',
+        'symbol': 'BTC/USDT',
+        'base': 'BTC',
+        'quote': 'USDT',
+        'baseId': 'BTC',
+        'quoteId': 'USDT',
+        'spot': True,
+        'type': 'spot',
+    }])
+    results = {}
+    for workload, payload, function in workloads(exchange, precise):
+        function(copy.deepcopy(payload))
+        payload = copy.deepcopy(payload)
+        start = time.perf_counter()
+        function(payload)
+        results[workload] = rows / (time.perf_counter() - start)
+    exchange_module.Precise = Precise
+    return results
+
+
+def load_reference(path):
+    spec = importlib.util.spec_from_file_location('precise_reference', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Precise
+
+
+def main():
+    implementations = [('current', Precise)]
+    if reference_path is not None:
+        implementations.append(('reference', load_reference(reference_path)))
+    results = {name: run(precise) for name, precise in implementations}
+    print('rows:', rows)
+    print(('{:<28}' + ' {:>16}' * len(implementations)).format('rows/s', *[name for name, _ in implementations]))
+    for workload in results['current']:
+        values = [results[name][workload] for name, _ in implementations]
+        print(('{:<28}' + ' {:>16.1f}' * len(values)).format(workload, *values))
+
+
+if __name__ == '__main__':
+    main()
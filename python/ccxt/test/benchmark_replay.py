@@ -0,0 +1,46 @@
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures a unified method on the responses replayed from a fixture, without the network and the rate limiter,
+# the fixture is recorded with python python/ccxt/test/test_sync.py --record directory exchange
+#
+#     python python/ccxt/test/benchmark_replay.py fixture exchange method [args...] [--calls=N]
+
+calls = 1000
+
+
+def main():
+    global calls
+    args = []
+    for arg in sys.argv[1:]:
+        if arg.startswith('--calls='):
+            calls = int(arg[len('--calls='):])
+        else:
+            args.append(arg)
+    if len(args) < 3:
+        print('usage: benchmark_replay.py fixture exchange method [args...] [--calls=N]')
+        sys.exit(1)
+    path, id, method = args[:3]
+    exchange = getattr(ccxt, id)({'fixturePath': path})
+    function = getattr(exchange, method)
+    started = time.perf_counter()
+    exchange.load_markets()
+    print('{:<24} {:>12.2f} ms'.format('load_markets', (time.perf_counter() - started) * 1000))
+    started = time.perf_counter()
+    for _ in range(calls):
+        function(*args[3:])
+    print('{:<24} {:>12.2f} µs'.format(method, (time.perf_counter() - started) / calls * 1000000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures parse_tickers and safe_market lookups over a set of synthetic binance spot markets,
+# including the case-insensitive and delimiter-split ids resolved by the markets index
+#
+#     python python/ccxt/test/benchmark_safe_market.py [symbols] [rounds]
+
+symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+lookups = 100000
+
+
+def synthetic_markets():
+    markets = []
+    for i in range(symbols):
+        base = 'C%05d' % i
+        markets.append({
+            'id': base + 'USDT',
+            'symbol': base + '/USDT',
+            'base': base,
+            'quote': 'USDT',
+            'baseId': base,
+            'quoteId': 'USDT',
+            'type': 'spot',
+            'spot': True,
+            'precision': {'amount': 8, 'price': 8},
+        })
+    return markets
+
+
+def synthetic_tickers(markets):
+    return [{
+        'symbol': market['id'],
+        'lastPrice': '1.2345',
+        'openPrice': '1.2',
+        'highPrice': '1.3',
+        'lowPrice': '1.1',
+        'volume': '1000',
+        'quoteVolume': '1234',
+        'closeTime': 1600000000000,
+        'bidPrice': '1.23',
+        'askPrice': '1.24',
+        'bidQty': '1',
+        'askQty': '2',
+    } for market in markets]
+
+
+def lookups_per_second(exchange, market_id, delimiter=None):
+    start = time.perf_counter()
+    for _ in range(lookups):
+        exchange.safe_market(market_id, None, delimiter)
+    return lookups / (time.perf_counter() - start)
+
+
+def main():
+    exchange = ccxt.binance()
+    markets = synthetic_markets()
+    exchange.set_markets(markets)
+    tickers = synthetic_tickers(markets)
+    exchange.parse_tickers(tickers)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        exchange.parse_tickers(tickers)
+    print('symbols:', symbols, 'rounds:', rounds)
+    print('{:<32} {:>16.1f}'.format('parse_tickers tickers/s', rounds * len(tickers) / (time.perf_counter() - start)))
+    market_id = markets[1]['id']
+    cases = [
+        ('safe_market exact id/s', market_id, None),
+        ('safe_market lowercase id/s', market_id.lower(), None),
+        ('safe_market delimited id/s', markets[1]['baseId'] + '_' + markets[1]['quoteId'], '_'),
+        ('safe_market unknown id/s', 'UNKNOWN_ID', '_'),
+    ]
+    for name, market_id, delimiter in cases:
+        print('{:<32} {:>16.1f}'.format(name, lookups_per_second(exchange, market_id, delimiter)))
+
+
+if __name__ == '__main__':
+    main()
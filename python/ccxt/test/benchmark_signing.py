@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import base64
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.exchange import eddsa  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# measures the signatures per second of the sign() of binance (hmac), kraken (hmac with a base64 secret) and
+# upbit (jwt), and of the ecdsa signatures of bytetrade and the eddsa ones of wavesexchange, with the signing
+# contexts of the instance prepared once (cached) and prepared again for every signature (cold, as before they were cached)
+#
+#     python python/ccxt/test/benchmark_signing.py [seconds per measurement]
+
+duration = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+
+Exchange = ccxt.Exchange
+private_key = '1a' * 32
+
+
+def signers():
+    exchange = Exchange()
+    binance = ccxt.binance({'apiKey': 'key', 'secret': 's' * 64})
+    yield 'binance', binance, lambda: binance.sign('account', 'private', 'GET', {})
+    kraken = ccxt.kraken({'apiKey': 'key', 'secret': base64.b64encode(b'k' * 64).decode()})
+    yield 'kraken', kraken, lambda: kraken.sign('Balance', 'private', 'POST', {})
+    upbit = ccxt.upbit({'apiKey': 'key', 'secret': 'u' * 40})
+    yield 'upbit (jwt)', upbit, lambda: upbit.sign('accounts', 'private', 'GET', {})
+    yield 'bytetrade (ecdsa)', exchange, lambda: exchange.ecdsa(private_key, private_key, 'secp256k1', None)
+    if eddsa is not None:
+        yield 'wavesexchange (eddsa)', exchange, lambda: exchange.eddsa(private_key, private_key, 'ed25519')
+
+
+def measure(exchange, function, cold):
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < duration:
+        if cold:
+            exchange.signing_contexts.clear()
+        function()
+        count += 1
+    return count / (time.perf_counter() - started)
+
+
+def main():
+    print('{:<24} {:>14} {:>14} {:>8}'.format('signer', 'cold sig/s', 'cached sig/s', 'ratio'))
+    for name, exchange, function in signers():
+        cold = measure(exchange, function, True)
+        cached = measure(exchange, function, False)
+        print('{:<24} {:>14.0f} {:>14.0f} {:>8.2f}'.format(name, cold, cached, cached / cold))
+    if eddsa is None:
+        print('wavesexchange (eddsa) skipped, axolotl_curve25519 is not installed')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+import asyncio
+import importlib.util
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# saturates many async throttlers in one event loop, as many exchange instances would, and measures
+# the CPU time used by the process and how late every request is released compared to its ideal time,
+# optionally against a reference implementation loaded from another throttler.py file:
+#
+#     git show <revision>:python/ccxt/async_support/base/throttler.py > /tmp/throttler_reference.py
+#     python python/ccxt/test/benchmark_throttler.py [instances] [seconds] [/tmp/throttler_reference.py]
+
+instances = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+reference_path = sys.argv[3] if len(sys.argv) > 3 else None
+
+rate_limit = 50  # ms per request of cost 1, like {'rateLimit': 50}
+
+
+async def saturate(throttler_class):
+    # every instance has its whole run queued up front, the queue never drains before the end
+    requests = int(seconds * 1000 / rate_limit)
+    lateness = []
+
+    async def instance():
+        throttle = throttler_class({'refillRate': 1 / rate_limit, 'capacity': 1.0, 'maxCapacity': requests + 1})
+        futures = [throttle(1) for _ in range(requests)]
+        await futures[0]
+        # the first request is free, then one every rate_limit ms
+        start = time.monotonic()
+        for index, future in enumerate(futures[1:], 1):
+            await future
+            ideal = start + index * rate_limit / 1000
+            lateness.append((time.monotonic() - ideal) * 1000)
+
+    wall = time.monotonic()
+    cpu = time.process_time()
+    await asyncio.gather(*[instance() for _ in range(instances)])
+    return time.process_time() - cpu, time.monotonic() - wall, sorted(lateness)
+
+
+def load_reference(path):
+    spec = importlib.util.spec_from_file_location('throttler_reference', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Throttler
+
+
+def main():
+    implementations = [('current', Throttler)]
+    if reference_path is not None:
+        implementations.append(('reference', load_reference(reference_path)))
+    print('instances:', instances, 'seconds:', seconds, 'rateLimit:', rate_limit)
+    header = '{:<10} {:>10} {:>10} {:>8} {:>12} {:>12} {:>12}'
+    row = '{:<10} {:>10.2f} {:>10.2f} {:>8.1f} {:>12.2f} {:>12.2f} {:>12.2f}'
+    print(header.format('throttler', 'cpu s', 'wall s', 'cpu %', 'late p50 ms', 'late p99 ms', 'late max ms'))
+    for name, throttler_class in implementations:
+        cpu, wall, lateness = asyncio.run(saturate(throttler_class))
+        p50 = lateness[len(lateness) // 2]
+        p99 = lateness[int(len(lateness) * 0.99)]
+        print(row.format(name, cpu, wall, cpu / wall * 100, p50, p99, lateness[-1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ----------------------------------------------------------------------------
+
+# a local HTTP server for the tests of the base exchange classes
+#
+#     server = FakeServer({'/klines': lambda request: [...]}).start()
+#     server.url  # http://127.0.0.1:<port>
+#     server.stop()
+#
+# a route returns the response body, or a (status, headers, body) tuple, bodies that are not
+# strings or bytes are sent as json, every request is recorded as a dict in server.requests
+
+
+class FakeServer(object):
+
+    def __init__(self, routes, delay=0):
+        self.routes = routes
+        self.delay = delay  # seconds to wait before responding
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.handler())
+        self.server.daemon_threads = True
+        self.url = 'http://127.0.0.1:' + str(self.server.server_address[1])
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def handle(self, handler, method):
+        parsed = urllib.parse.urlparse(handler.path)
+        length = int(handler.headers.get('Content-Length') or 0)
+        request = {
+            'method': method,
+            'path': parsed.path,
+            'query': dict(urllib.parse.parse_qsl(parsed.query)),
+            'headers': dict(handler.headers),
+            'body': handler.rfile.read(length).decode() if length else None,
+            'time': time.monotonic(),
+        }
+        with self.lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            route = self.routes.get(parsed.path)
+            if route is None:
+                status, headers, body = 404, {}, {'error': 'not found'}
+            else:
+                response = route(request)
+                status, headers, body = response if isinstance(response, tuple) else (200, {}, response)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        if isinstance(body, str):
+            body = body.encode()
+        elif not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+            headers = dict({'Content-Type': 'application/json'}, **headers)
+        handler.send_response(status)
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            protocol_version = 'HTTP/1.1'
+            # the headers and the body are sent at once, without waiting for the delayed acks
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server.handle(self, 'GET')
+
+            def do_POST(self):
+                server.handle(self, 'POST')
+
+            def do_DELETE(self):
+                server.handle(self, 'DELETE')
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,135 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.clock import ClockOffsetEstimator  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# the estimator picks the sample with the shortest round trip
+
+estimator = ClockOffsetEstimator(3)
+assert estimator.offset is None and estimator.uncertainty is None
+estimator.add(1000, 600, 1200)  # 200 ms round trip, the server time taken after 100 ms
+estimator.add(2000, 1550, 2100)  # 100 ms round trip, the server time taken after 50 ms
+estimator.add(3000, 2590, 3300)
+assert estimator.offset == 500 and estimator.uncertainty == 50
+estimator.add(4000, 3510, 4020)
+estimator.add(5000, 4500, 5400)
+assert estimator.offset == 500 and estimator.uncertainty == 10
+estimator.add(6000, 5500, 6400)
+estimator.add(7000, 6500, 7400)
+# the old samples are dropped
+assert estimator.uncertainty == 200
+
+
+class fake(ccxt.async_support.Exchange):
+    """
+    A fake local clock 500 ms ahead of the server, the requests and the responses of fetch_time() take
+    the times in the delays list, which repeats.
+    """
+
+    ahead = 500
+    delays = [(300, 50), (40, 40), (10, 200), (100, 100)]
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), {
+            'id': 'fake',
+            'has': {'fetchTime': True},
+            'options': {'timeDifference': 0},
+        })
+
+    def __init__(self, config={}):
+        super(fake, self).__init__(config)
+        self.now = 1660000000000
+        self.requests = 0
+        self.fail = False
+
+    def milliseconds(self):
+        return self.now
+
+    async def fetch_time(self, params={}):
+        if self.fail:
+            raise ccxt.ExchangeNotAvailable('fake is down')
+        request, response = self.delays[self.requests % len(self.delays)]
+        self.requests += 1
+        await asyncio.sleep(0)
+        self.now += request
+        server_time = self.now - self.ahead
+        self.now += response
+        return server_time
+
+    def nonce(self):
+        # the way binance computes its timestamps
+        return self.milliseconds() - self.options['timeDifference']
+
+
+async def test():
+
+    # every sample refines the offset, and nonce() follows the server clock
+
+    exchange = fake()
+    await exchange.sync_clock()
+    assert exchange.clock_offset.offset == 375 and exchange.clock_offset.uncertainty == 175
+    assert exchange.options['timeDifference'] == 375
+    await exchange.sync_clock()
+    assert exchange.clock_offset.offset == 500 and exchange.clock_offset.uncertainty == 40
+    assert exchange.nonce() == exchange.now - 500
+    await exchange.sync_clock()
+    assert exchange.clock_offset.offset == 500
+
+    # load_time_difference() alone takes the round trip for the offset
+
+    exchange = fake()
+    await exchange.load_time_difference()
+    assert exchange.options['timeDifference'] == 550
+
+    # the background sampling starts with the first request, with a burst of samples
+
+    exchange = fake({'clockSync': True, 'clockSyncInterval': 20})
+    exchange.open()
+    await asyncio.sleep(0.005)
+    assert exchange.requests == exchange.clockSyncSamples // 2
+    assert exchange.options['timeDifference'] == 500
+    await asyncio.sleep(0.05)
+    assert exchange.clockSyncSamples // 2 < exchange.requests < 10
+
+    # the errors are logged and the sampling goes on
+
+    exchange.fail = True
+    await asyncio.sleep(0.05)
+    exchange.fail = False
+    requests = exchange.requests
+    await asyncio.sleep(0.05)
+    assert exchange.requests > requests
+
+    # the sampling stops when the exchange is closed
+
+    task = exchange.clock_sync_task
+    await exchange.close()
+    await asyncio.sleep(0)
+    assert task.cancelled() and exchange.clock_sync_task is None
+    requests = exchange.requests
+    await asyncio.sleep(0.05)
+    assert exchange.requests == requests
+
+    # the exchanges without fetchTime are not supported
+
+    exchange = fake({'has': {'fetchTime': False}})
+    try:
+        exchange.start_clock_sync()
+        assert False
+    except ccxt.NotSupported:
+        pass
+    await exchange.close()
+
+
+asyncio.run(test())
+
+print('clock sync tests passed')
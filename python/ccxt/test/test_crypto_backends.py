@@ -0,0 +1,116 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import base64  # noqa: E402
+import hashlib  # noqa: E402
+import random  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.base import crypto_backends  # noqa: E402
+from ccxt.base.crypto_backends import keccak_256, public_key, sign_digest_deterministic  # noqa: E402
+from ccxt.static_dependencies import ecdsa  # noqa: E402
+from ccxt.static_dependencies import keccak  # noqa: E402
+from ccxt.static_dependencies.ecdsa.util import number_to_string, sigencode_strings_canonize  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+Exchange = ccxt.Exchange
+generator = random.Random(1660000000)
+curves = [
+    [ecdsa.NIST192p, hashlib.sha256],
+    [ecdsa.NIST224p, hashlib.sha256],
+    [ecdsa.NIST256p, hashlib.sha256],
+    [ecdsa.NIST384p, hashlib.sha384],
+    [ecdsa.NIST521p, hashlib.sha512],
+    [ecdsa.SECP256k1, hashlib.sha256],
+]
+
+# every backend multiplies like the static ecdsa module
+
+backends = [crypto_backends.python_multiply, crypto_backends.cryptography_multiply]
+if crypto_backends.coincurve is not None:
+    backends.append(crypto_backends.coincurve_multiply)
+for curve, _ in curves:
+    order = curve.order
+    scalars = [1, 2, 15, 16, 17, order - 1, order // 2] + [generator.randrange(1, order) for _ in range(3)]
+    for k in scalars:
+        expected = crypto_backends.ecdsa_multiply(curve, k)
+        for backend in backends:
+            if (backend is not crypto_backends.coincurve_multiply) or (curve is ecdsa.SECP256k1):
+                assert tuple(backend(curve, k)) == expected, (curve.name, backend, k)
+    assert crypto_backends.get_ecdsa_backend(curve) in ['python', 'cryptography', 'coincurve']
+
+# the signatures are the ones of the static ecdsa module, bit for bit
+
+for curve, hashfunc in curves:
+    secexp = generator.randrange(1, curve.order)
+    key = ecdsa.SigningKey.from_secret_exponent(secexp, curve=curve)
+    assert public_key(curve, secexp) == key.verifying_key.to_string()
+    for i in range(4):
+        digest = number_to_string(generator.getrandbits(8 * curve.baselen), curve.order)[:hashfunc().digest_size]
+        extra_entropy = b'' if i % 2 else Exchange.number_to_le(i, 32)
+        r, s, v = sign_digest_deterministic(curve, secexp, digest, hashfunc, extra_entropy)
+        expected = key.sign_digest_deterministic(digest, hashfunc=hashfunc, sigencode=sigencode_strings_canonize, extra_entropy=extra_entropy)
+        assert sigencode_strings_canonize(r, s, curve.order, v) == expected, (curve.name, i)
+
+# the digests longer than the curve are rejected like before
+
+try:
+    sign_digest_deterministic(ecdsa.NIST192p, 1, b'\x01' * 64, hashlib.sha512)
+    assert False
+except ecdsa.BadDigestError:
+    pass
+
+# the vectors of test_crypto.py, with every backend
+
+private_key = '1a' * 32
+vectors = [
+    [['1a', private_key, 'p256', 'sha256'], {
+        'r': '3f4537ef9e72240cdefaea19d68fd483b5e10227e89747c58a3b543bfaf9cc46',
+        's': '278d65adebd8d52dac34820c02cee0a0e3348f9aee91a21b8e9bfa0a23b40001',
+        'v': 1,
+    }],
+    [[private_key, private_key, 'p256', None], {
+        'r': '9aadbfe7feca28a8b665731abd8fdd19f8b1be5fcdd1264d111b291a01c8dea2',
+        's': '5084765e08e169fbba470ed1f573c9fed8d68a9d883049054b601f66a6648912',
+        'v': 0,
+    }],
+    [['1a', private_key, 'secp256k1', 'sha256'], {
+        'r': '23dcb2a2a3728a35eb1a35cc01743c4609550d9cceaf2083550f13a9eb135f9f',
+        's': '317963fcac18e4ec9f7921b97d7ea0c82a873dd6299cbfb6af016e08ef5ed667',
+        'v': 0,
+    }],
+    [[private_key, private_key, 'secp256k1', None], {
+        'r': 'b84a36a6fbabd5277ede578448b93d48e70b38efb5b15b1d4e2a298accf938b1',
+        's': '66ebfb8221cda925526e699a59cd221bb4cc84bdc563024b1802c4d9e1d8bbe9',
+        'v': 1,
+    }],
+]
+address = '0x' + keccak.SHA3(ecdsa.SigningKey.from_string(base64.b16decode(private_key, casefold=True), curve=ecdsa.SECP256k1).verifying_key.to_string())[-20:].hex()
+exchange = Exchange()
+selected = dict(crypto_backends.multipliers)
+for backend in backends:
+    for curve in [ecdsa.NIST256p, ecdsa.SECP256k1]:
+        if (backend is not crypto_backends.coincurve_multiply) or (curve is ecdsa.SECP256k1):
+            crypto_backends.multipliers[curve.name] = [backend.__name__, backend]
+    for arguments, expected in vectors:
+        assert Exchange.ecdsa(*arguments) == expected, (backend, arguments)
+    # the canonical signatures without the short r or s and with r below the half of the order
+    signature = Exchange.ecdsa('1a', private_key, 'secp256k1', 'sha256', True)
+    assert len(signature['r']) == 64 and len(signature['s']) == 64
+    assert int(signature['r'], 16) <= ecdsa.SECP256k1.order / 2
+    assert exchange.privateKeyToAddress(private_key) == address
+crypto_backends.multipliers.clear()
+crypto_backends.multipliers.update(selected)
+
+# keccak is the keccak of the static dependencies
+
+for data in [b'', b'abc', b'x' * 135, b'x' * 136, b'x' * 137, bytes(range(256)) * 10]:
+    assert keccak_256(data) == bytes(keccak.SHA3(data))
+assert Exchange.hash(b'', 'keccak', 'hex') == 'c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470'
+
+print('crypto backends tests passed')
@@ -0,0 +1,149 @@
+import os
+import ast
+import sys
+import random
+import warnings
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import decimal_to_precision as module  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import decimals_to_precision  # noqa: E402
+from ccxt.base.decimal_to_precision import precision_plan  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND  # noqa: E402
+from ccxt.base.decimal_to_precision import DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE  # noqa: E402
+from ccxt.base.decimal_to_precision import NO_PADDING, PAD_WITH_ZERO  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# the batch formatting must give the same results as decimal_to_precision() for every
+# call in the generated test_decimal_to_precision.py
+
+
+def calls_from_generated_tests():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_decimal_to_precision.py')
+    with open(path, encoding='utf-8') as file:
+        tree = ast.parse(file.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'decimal_to_precision':
+            arguments = []
+            for argument in node.args:
+                if isinstance(argument, ast.Name):
+                    arguments.append(getattr(module, argument.id))
+                else:
+                    arguments.append(ast.literal_eval(argument))
+            yield tuple(arguments)
+
+
+def outcome(function, *args):
+    try:
+        return function(*args)
+    except Exception as e:
+        return type(e)
+
+
+generated_calls = list(calls_from_generated_tests())
+assert len(generated_calls) > 100
+
+for n, *arguments in generated_calls:
+    expected = outcome(decimal_to_precision, n, *arguments)
+    assert outcome(lambda: precision_plan(*arguments)(n)) == expected, (n, arguments)
+    assert outcome(lambda: decimals_to_precision([n, n], *arguments)) in (expected, [expected, expected]), (n, arguments)
+
+# ----------------------------------------------------------------------------
+# random floats in every mode
+
+random.seed(7)
+
+modes = []
+for rounding_mode in [TRUNCATE, ROUND]:
+    for padding_mode in [NO_PADDING, PAD_WITH_ZERO]:
+        for precision in [-2, 0, 1, 2, 4, 8]:
+            modes.append((rounding_mode, precision, DECIMAL_PLACES, padding_mode))
+            modes.append((rounding_mode, max(precision, 0), SIGNIFICANT_DIGITS, padding_mode))
+        for tick in [0.01, 0.5, 0.25, 1e-8, 5, 10, 100, 0.00025]:
+            modes.append((rounding_mode, tick, TICK_SIZE, padding_mode))
+
+
+def random_float():
+    kind = random.random()
+    if kind < 0.3:
+        # values exactly on the rounding boundaries
+        return random.randint(-100000, 100000) / random.choice([1, 2, 4, 8, 10, 100, 1000, 200, 2000])
+    elif kind < 0.6:
+        return round(random.uniform(-1000, 1000), random.randint(0, 10))
+    return random.uniform(-1, 1) * 10 ** random.randint(-9, 9)
+
+
+values = [random_float() for _ in range(2000)] + [0.0, -0.0, 0.125, -0.125, 0.005, -0.005, 1e-9, -1e-9]
+
+numpy = module.numpy
+
+for arguments in modes:
+    # decimal_to_precision() raises for some of the values in the SIGNIFICANT_DIGITS mode
+    valid = [value for value in values if not isinstance(outcome(decimal_to_precision, value, *arguments), type)]
+    expected = [decimal_to_precision(value, *arguments) for value in valid]
+    assert decimals_to_precision(valid, *arguments) == expected, arguments
+    if numpy is not None:
+        assert decimals_to_precision(numpy.array(valid, dtype=numpy.float64), *arguments) == expected, arguments
+
+# ----------------------------------------------------------------------------
+# exchange methods
+
+exchange = ccxt.Exchange({'id': 'precision'})
+exchange.set_markets([{
+    'id': 'BTCUSDT',
+    'symbol': 'BTC/USDT',
+    'base': 'BTC',
+    'quote': 'USDT',
+    'baseId': 'BTC',
+    'quoteId': 'USDT',
+    'precision': {'price': 2, 'amount': 4},
+}])
+
+prices = [0.125, 27123.456, '19999.995', 3]
+amounts = [0.123456, '1.00009', 7]
+assert exchange.prices_to_precision('BTC/USDT', prices) == [exchange.price_to_precision('BTC/USDT', price) for price in prices]
+assert exchange.amounts_to_precision('BTC/USDT', amounts) == [exchange.amount_to_precision('BTC/USDT', amount) for amount in amounts]
+assert exchange.pricesToPrecision('BTC/USDT', [1.005]) == ['1.01']
+
+exchange.precisionMode = TICK_SIZE
+exchange.markets['BTC/USDT']['precision'] = {'price': 0.5, 'amount': 0.001}
+assert exchange.prices_to_precision('BTC/USDT', prices) == [exchange.price_to_precision('BTC/USDT', price) for price in prices]
+assert exchange.amounts_to_precision('BTC/USDT', amounts) == [exchange.amount_to_precision('BTC/USDT', amount) for amount in amounts]
+
+# the exchanges that override price_to_precision or amount_to_precision format every value with their own methods
+
+
+class overriding(ccxt.Exchange):
+
+    def price_to_precision(self, symbol, price):
+        return 'price ' + str(price)
+
+    def amount_to_precision(self, symbol, amount):
+        return 'amount ' + str(amount)
+
+
+exchange = overriding({'id': 'overriding'})
+exchange.set_markets([{'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'precision': {'price': 2, 'amount': 4}}])
+assert exchange.prices_to_precision('BTC/USDT', [1.005, '2']) == ['price 1.005', 'price 2']
+assert exchange.amounts_to_precision('BTC/USDT', [0.5]) == ['amount 0.5']
+if numpy is not None:
+    assert exchange.prices_to_precision('BTC/USDT', numpy.array([1.5, 2.5])) == ['price 1.5', 'price 2.5']
+
+# ----------------------------------------------------------------------------
+# the values that can't be cast to integers go through the scalar path without warnings
+
+if numpy is not None:
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        large = numpy.array([1.5, 1e20, -1e20, 123456789012345678.0, 2.25], dtype=numpy.float64)
+        assert decimals_to_precision(large, ROUND, 2) == [decimal_to_precision(value, ROUND, 2) for value in large.tolist()]
+        for value in [1e300, float('inf'), float('-inf'), float('nan')]:
+            expected = outcome(decimal_to_precision, value, ROUND, 2)
+            assert outcome(decimals_to_precision, numpy.array([1.5, value]), ROUND, 2) == (expected if isinstance(expected, type) else ['1.5', expected])
+
+print('decimals_to_precision tests passed')
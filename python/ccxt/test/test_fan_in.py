@@ -0,0 +1,186 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+symbols = ['BTC/USDT', 'ETH/USDT', 'XRP/USDT', 'LTC/USDT', 'ADA/USDT']
+state = {'fail': False, 'fail_bulk': False}
+
+
+def ticker(request):
+    if state['fail']:
+        return (500, {}, 'internal error')
+    return {'symbol': request['query'].get('symbol'), 'last': '100'}
+
+
+def tickers(request):
+    if state['fail'] or state['fail_bulk']:
+        return (500, {}, 'internal error')
+    # the delisted ETHUSDT is missing from the bulk response
+    return [{'symbol': symbol.replace('/', ''), 'last': '100'} for symbol in symbols if symbol != 'ETH/USDT']
+
+
+def funding_rates(request):
+    return [{'symbol': symbol.replace('/', ''), 'rate': '0.0001'} for symbol in symbols]
+
+
+server = FakeServer({'/ticker': ticker, '/tickers': tickers, '/fundingRates': funding_rates}, delay=0.02).start()
+
+
+class fake(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), {
+            'id': 'fake',
+            'rateLimit': 1,
+            'has': {
+                'fetchTicker': True,
+                'fetchTickers': True,
+                'fetchFundingRate': 'emulated',
+                'fetchFundingRates': True,
+            },
+            'urls': {'api': {'public': server.url}},
+            'api': {
+                'public': {'get': {'ticker': 1, 'tickers': 3, 'fundingRates': 1}},
+            },
+        })
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        url = self.urls['api'][api] + '/' + path + '?' + self.urlencode(params)
+        return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+    async def fetch_markets(self, params={}):
+        return [{
+            'id': symbol.replace('/', ''),
+            'symbol': symbol,
+            'base': symbol.split('/')[0],
+            'quote': 'USDT',
+            'type': 'swap',
+            'contract': True,
+            'active': True,
+        } for symbol in symbols]
+
+    def parse_ticker(self, ticker, market=None):
+        return {'symbol': self.safe_symbol(ticker['symbol']), 'last': self.safe_number(ticker, 'last')}
+
+    async def fetch_ticker(self, symbol, params={}):
+        await self.load_markets()
+        return self.parse_ticker(await self.publicGetTicker(self.extend({'symbol': self.market_id(symbol)}, params)))
+
+    async def fetch_tickers(self, symbols=None, params={}):
+        await self.load_markets()
+        result = {}
+        for ticker in await self.publicGetTickers(params):
+            ticker = self.parse_ticker(ticker)
+            result[ticker['symbol']] = ticker
+        return self.filter_by_array(result, 'symbol', symbols)
+
+    async def fetch_funding_rates(self, symbols=None, params={}):
+        await self.load_markets()
+        result = [{'symbol': self.safe_symbol(rate['symbol']), 'fundingRate': self.safe_number(rate, 'rate')} for rate in await self.publicGetFundingRates(params)]
+        return self.filter_by_array(result, 'symbol', symbols)
+
+
+def requests_to(path):
+    return len([request for request in server.requests if request['path'] == path])
+
+
+async def test():
+    exchange = fake({'fanIn': True})
+
+    # the concurrent calls are batched into one bulk call and every caller gets its ticker
+
+    results = await asyncio.gather(*[exchange.fetch_ticker(symbol) for symbol in ['BTC/USDT', 'XRP/USDT', 'LTC/USDT', 'BTC/USDT']])
+    assert [result['symbol'] for result in results] == ['BTC/USDT', 'XRP/USDT', 'LTC/USDT', 'BTC/USDT']
+    assert results[0] is results[3]
+    assert requests_to('/tickers') == 1 and requests_to('/ticker') == 0
+    assert exchange.fan_in_costs == {'fetch_tickers': 3}
+    assert exchange.fan_in_batches == {}
+
+    # a single call is made separately, the camelcase alias is batched too
+
+    assert (await exchange.fetchTicker('ADA/USDT'))['symbol'] == 'ADA/USDT'
+    assert requests_to('/ticker') == 1
+    assert exchange.fan_in_costs == {'fetch_tickers': 3, 'fetch_ticker': 1}
+
+    # with the costs known, two calls are made separately, being cheaper than the bulk call
+
+    await asyncio.gather(exchange.fetch_ticker('BTC/USDT'), exchange.fetch_ticker('XRP/USDT'))
+    assert requests_to('/tickers') == 1 and requests_to('/ticker') == 3
+    await asyncio.gather(*[exchange.fetch_ticker(symbol) for symbol in ['BTC/USDT', 'XRP/USDT', 'LTC/USDT']])
+    assert requests_to('/tickers') == 2 and requests_to('/ticker') == 3
+
+    # a symbol missing from the bulk response is fetched separately, the calls with params are not batched
+
+    results = await asyncio.gather(*[exchange.fetch_ticker(symbol) for symbol in ['BTC/USDT', 'XRP/USDT', 'ETH/USDT']])
+    assert results[2]['symbol'] == 'ETH/USDT'
+    assert requests_to('/tickers') == 3 and requests_to('/ticker') == 4
+    await asyncio.gather(exchange.fetch_ticker('BTC/USDT', {'type': 'spot'}), exchange.fetch_ticker('XRP/USDT', {'type': 'spot'}))
+    assert requests_to('/ticker') == 6
+
+    # an unknown symbol fails its own call only
+
+    results = await asyncio.gather(*[exchange.fetch_ticker(symbol) for symbol in ['BTC/USDT', 'DOGE/USDT', 'XRP/USDT']], return_exceptions=True)
+    assert isinstance(results[1], ccxt.BadSymbol), results
+    assert results[0]['symbol'] == 'BTC/USDT' and results[2]['symbol'] == 'XRP/USDT'
+
+    # when the bulk call fails, every caller makes its own call, the errors are raised to the callers that fail too
+
+    bulk_requests = requests_to('/tickers')
+    requests = requests_to('/ticker')
+    state['fail_bulk'] = True
+    results = await asyncio.gather(*[exchange.fetch_ticker(symbol) for symbol in ['BTC/USDT', 'XRP/USDT', 'LTC/USDT']])
+    assert [result['symbol'] for result in results] == ['BTC/USDT', 'XRP/USDT', 'LTC/USDT']
+    assert requests_to('/tickers') == bulk_requests + 1 and requests_to('/ticker') == requests + 3
+    state['fail_bulk'] = False
+    state['fail'] = True
+    results = await asyncio.gather(*[exchange.fetch_ticker(symbol) for symbol in ['BTC/USDT', 'XRP/USDT', 'LTC/USDT']], return_exceptions=True)
+    assert all(isinstance(result, ccxt.ExchangeNotAvailable) for result in results), results
+    state['fail'] = False
+
+    # a cancelled caller does not cancel the batch of the others
+
+    first = asyncio.ensure_future(exchange.fetch_ticker('BTC/USDT'))
+    second = asyncio.ensure_future(exchange.fetch_ticker('XRP/USDT'))
+    third = asyncio.ensure_future(exchange.fetch_ticker('LTC/USDT'))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert (await second)['symbol'] == 'XRP/USDT' and (await third)['symbol'] == 'LTC/USDT'
+
+    # the funding rates are batched into fetch_funding_rates
+
+    requests = requests_to('/fundingRates')
+    results = await asyncio.gather(*[exchange.fetch_funding_rate(symbol) for symbol in symbols])
+    assert [result['fundingRate'] for result in results] == [0.0001] * len(symbols)
+    assert [result['symbol'] for result in results] == symbols
+    assert requests_to('/fundingRates') == requests + 1
+    await exchange.close()
+
+    # disabled by default, and for the bulk methods that are not supported natively
+
+    requests = requests_to('/ticker')
+    exchange = fake()
+    await asyncio.gather(*[exchange.fetch_ticker(symbol) for symbol in symbols[:3]])
+    assert requests_to('/ticker') == requests + 3
+    await exchange.close()
+    exchange = fake({'fanIn': True, 'has': {'fetchTickers': 'emulated'}})
+    await asyncio.gather(*[exchange.fetch_ticker(symbol) for symbol in symbols[:3]])
+    assert requests_to('/ticker') == requests + 6
+    await exchange.close()
+
+
+try:
+    asyncio.run(test())
+finally:
+    server.stop()
+
+print('fan in tests passed')
@@ -0,0 +1,209 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import gzip  # noqa: E402
+import hashlib  # noqa: E402
+import json  # noqa: E402
+import shutil  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.fixtures import request_key  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+state = {'last': 19000}
+
+
+def ticker(request):
+    state['last'] += 1
+    return (200, {'X-Used-Weight': '5'}, {'symbol': request['query'].get('symbol'), 'last': str(state['last'])})
+
+
+def order(request):
+    body = json.loads(request['body'])
+    return {'id': '1', 'symbol': body['symbol'], 'amount': body['amount']}
+
+
+server = FakeServer({
+    '/ticker': ticker,
+    '/order': order,
+    '/missing': lambda request: (404, {}, 'not found'),
+    '/binary': lambda request: (200, {'Content-Type': 'application/octet-stream'}, b'\x1f\x8b\xff\x00'),
+}).start()
+
+description = {
+    'id': 'fake',
+    'rateLimit': 1000,
+    'urls': {'api': {'public': server.url, 'private': server.url}},
+    'api': {
+        'public': {'get': ['ticker', 'missing', 'binary']},
+        'private': {'post': ['order']},
+    },
+    'httpExceptions': {'404': ccxt.BadRequest},
+}
+
+
+def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+    # a nonce and a signature in the query of the public requests and in the body of the private ones
+    url = self.urls['api'][api] + '/' + path
+    params = self.extend(params, {'nonce': self.milliseconds(), 'apiKey': self.apiKey})
+    params['signature'] = hashlib.sha256(self.encode(self.urlencode(params))).hexdigest()
+    if api == 'public':
+        url += '?' + self.urlencode(params)
+    else:
+        body = self.json(params)
+        headers = {'Content-Type': 'application/json'}
+    return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+
+class fake(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), description)
+
+    sign = sign
+
+
+class async_fake(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(async_fake, self).describe(), description)
+
+    sign = sign
+
+
+def run(exchange):
+    return [
+        exchange.publicGetTicker({'symbol': 'BTCUSDT'}),
+        exchange.publicGetTicker({'symbol': 'BTCUSDT'}),
+        exchange.publicGetTicker({'symbol': 'ETHUSDT'}),
+        exchange.privatePostOrder({'symbol': 'BTCUSDT', 'amount': 1.5, 'clientOrderId': str(time.time())}),
+        exchange.publicGetBinary(),
+    ]
+
+
+async def async_run(exchange):
+    responses = []
+    for response in run(exchange):
+        responses.append(await response)
+    return responses
+
+
+def requests_count():
+    return len(server.requests)
+
+
+# the nonces, signatures, keys and client order ids are left out of the keys, the params are sorted
+
+ignored = set(name.lower() for name in ccxt.Exchange.fixtureIgnoredParams)
+assert request_key('get', 'https://api.test/ticker?symbol=BTC&nonce=1&Signature=x', None, ignored) == 'GET /ticker?symbol=BTC'
+assert request_key('POST', 'https://api.test/order', '{"b":2,"a":{"c":1},"nonce":3}', ignored) == 'POST /order?a=%7B%22c%22%3A+1%7D&b=2'
+assert request_key('POST', 'https://api.test/order', 'b=2&a=1&timestamp=3', ignored) == 'POST /order?a=1&b=2'
+assert request_key('DELETE', 'https://api.test/order', None, ignored) == 'DELETE /order'
+
+directory = tempfile.mkdtemp()
+
+try:
+    for name in ['sync.jsonl', 'sync.jsonl.gz']:
+        path = os.path.join(directory, name)
+
+        # the responses are recorded
+
+        exchange = fake({'fixturePath': path, 'fixtureMode': 'record', 'apiKey': 'recording', 'enableRateLimit': False})
+        sent = requests_count()
+        recorded = run(exchange)
+        try:
+            exchange.publicGetMissing()
+            assert False
+        except ccxt.BadRequest:
+            pass
+        assert requests_count() == sent + 6
+        assert recorded[0]['last'] != recorded[1]['last']
+        assert recorded[3] == {'id': '1', 'symbol': 'BTCUSDT', 'amount': '1.5'}
+        with (gzip.open(path, 'rt') if name.endswith('.gz') else open(path)) as file:
+            lines = [json.loads(line) for line in file]
+        assert [line['request'] for line in lines] == [
+            'GET /ticker?symbol=BTCUSDT',
+            'GET /ticker?symbol=BTCUSDT',
+            'GET /ticker?symbol=ETHUSDT',
+            'POST /order?amount=1.5&symbol=BTCUSDT',
+            'GET /binary',
+            'GET /missing',
+        ]
+        assert 'recording' not in json.dumps(lines) and 'Content-Length' not in lines[0]['headers']
+        assert lines[4]['base64'] == 'H4v/AA=='
+
+        # and replayed in order, with other nonces, signatures and keys, without the network or the rate limiter
+
+        exchange = fake({'fixturePath': path, 'apiKey': 'replaying'})
+        started = time.perf_counter()
+        assert run(exchange) == recorded
+        assert time.perf_counter() - started < 0.5
+        # the last response is repeated
+        assert exchange.publicGetTicker({'symbol': 'ETHUSDT'}) == recorded[2]
+        assert exchange.last_response_headers['X-Used-Weight'] == '5'
+        try:
+            exchange.publicGetMissing()
+            assert False
+        except ccxt.BadRequest:
+            pass
+        try:
+            exchange.publicGetTicker({'symbol': 'LTCUSDT'})
+            assert False
+        except ccxt.ExchangeError as e:
+            assert 'GET /ticker?symbol=LTCUSDT' in str(e)
+        assert requests_count() == sent + 6
+
+    # the async exchanges record and replay the same way, and read the fixtures of the sync ones
+
+    async def test():
+        path = os.path.join(directory, 'async.jsonl')
+        exchange = async_fake({'fixturePath': path, 'fixtureMode': 'record', 'apiKey': 'recording', 'enableRateLimit': False})
+        sent = requests_count()
+        recorded = await async_run(exchange)
+        assert requests_count() == sent + 5
+        await exchange.close()
+        for fixture in [path, os.path.join(directory, 'sync.jsonl')]:
+            exchange = async_fake({'fixturePath': fixture})
+            responses = await async_run(exchange)
+            assert exchange.session.session is None
+            await exchange.publicGetTicker({'symbol': 'ETHUSDT'})
+            assert exchange.last_response_headers['X-Used-Weight'] == '5'
+            try:
+                await exchange.publicGetMissing()
+                assert False
+            except ccxt.ExchangeError as e:
+                # not recorded by the async exchange
+                assert isinstance(e, ccxt.BadRequest) == (fixture != path)
+            await exchange.close()
+            if fixture == path:
+                assert responses == recorded
+            else:
+                assert responses[3] == fake({'fixturePath': fixture}).privatePostOrder({'symbol': 'BTCUSDT', 'amount': 1.5})
+        assert requests_count() == sent + 5
+
+    asyncio.run(test())
+
+    # a missing fixture is an error on the first request
+
+    exchange = fake({'fixturePath': os.path.join(directory, 'none.jsonl')})
+    try:
+        exchange.publicGetTicker()
+        assert False
+    except FileNotFoundError:
+        pass
+
+finally:
+    shutil.rmtree(directory)
+    server.stop()
+
+print('fixtures tests passed')
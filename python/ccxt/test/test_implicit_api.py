@@ -0,0 +1,65 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+calls = {'define_rest_api': 0, 'define_camelcase_methods': 0}
+
+
+class fake(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), {
+            'id': 'fake',
+            'api': {
+                'public': {'get': ['ticker', 'order/book']},
+                'private': {'post': {'order': 2}},
+            },
+        })
+
+    def define_rest_api(self, api, method_name, paths=[], instance=None):
+        if not paths:
+            calls['define_rest_api'] += 1
+        return super(fake, self).define_rest_api(api, method_name, paths, instance)
+
+    def define_camelcase_methods(self):
+        calls['define_camelcase_methods'] += 1
+        return super(fake, self).define_camelcase_methods()
+
+
+# the implicit api methods and the camelcase aliases are generated once per exchange class
+
+first = fake()
+second = fake()
+assert calls == {'define_rest_api': 1, 'define_camelcase_methods': 1}
+assert fake.__dict__['_rest_api_defined'] is True
+for name in ['publicGetTicker', 'public_get_ticker', 'publicGetOrderBook', 'public_get_order_book', 'privatePostOrder']:
+    assert name in fake.__dict__ and name not in first.__dict__ and name not in second.__dict__
+    assert getattr(first, name).__func__ is getattr(second, name).__func__
+# the methods are aliased on the class, the other properties on every instance
+assert 'fetchTicker' in fake.__dict__ and 'fetchTicker' not in first.__dict__
+assert first.fetchTicker.__func__ is second.fetchTicker.__func__ is ccxt.Exchange.fetch_ticker
+assert 'last_http_response' in fake.__dict__['_camelcase_properties'] and 'lastHttpResponse' in first.__dict__
+# the other exchange classes generate their own methods
+assert '_rest_api_defined' not in ccxt.Exchange.__dict__
+assert ccxt.binance().publicGetTime.__func__ is ccxt.binance.__dict__['publicGetTime']
+assert not hasattr(first, 'publicGetTime')
+
+# an api given in the config is bound to that instance, the class and its other instances don't change
+
+configured = fake({'api': {'public': {'get': ['trades']}}})
+assert calls == {'define_rest_api': 2, 'define_camelcase_methods': 1}
+assert 'publicGetTrades' in configured.__dict__ and 'public_get_trades' in configured.__dict__
+assert 'publicGetTrades' not in fake.__dict__
+assert not hasattr(first, 'publicGetTrades') and not hasattr(fake(), 'publicGetTrades')
+assert configured.publicGetTrades.__self__ is configured and configured.public_get_trades == configured.publicGetTrades
+assert first.publicGetTicker.__func__ is fake.__dict__['publicGetTicker']
+
+print('implicit api tests passed')
@@ -0,0 +1,143 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import math  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.json_codec import json_codecs, get_json_codec, has_number_token  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+# every codec decodes and encodes like the json module
+
+documents = [
+    '{"symbol":"BTCUSDT","price":"19000.10","qty":"0.00100000","isBuyer":true,"orderListId":null}',
+    '[{"a":"1"},{"b":["x","y"]},[]]',
+    '{"price":19000.10,"qty":1e-8,"id":12345678901234567890,"time":1660000000000,"neg":-0.5}',
+    '[[1660000000000,"19000.1","19001","18999.5","19000","12.5"]]',
+    '{"text":"a:1,[2 is not a number"}',
+    '{"nan":NaN,"inf":-Infinity}',
+    '{"unicode":"\\u00e9t\\u00e9 \\ud83d\\ude00","raw":"été"}',
+    '{"duplicate":"1","duplicate":"2"}',
+    '  {"padded":"yes"}  ',
+    '{"lone":"\\ud800"}',
+    '{"quoted":["1","-2.5"],"flag":false}',
+    '[ 1, {"a" :\n-2}]',
+    '{"padding":"' + 'x' * 5000 + '","late":[true, 1.5]}',
+]
+
+
+def same(a, b):
+    # NaN is not equal to itself
+    return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True) and type(a) is type(b)
+
+
+reference = json_codecs['json']
+for name, codec in json_codecs.items():
+    for document in documents:
+        for quote_numbers in [True, False]:
+            expected = reference.loads(document, quote_numbers)
+            assert same(codec.loads(document, quote_numbers), expected), (name, document, quote_numbers)
+            assert same(codec.loads(document.encode(), quote_numbers), expected), (name, document, quote_numbers)
+
+# the numbers are decoded to the strings written in the document, the integers over 64 bits included
+
+for codec in json_codecs.values():
+    decoded = codec.loads('{"price":19000.10,"qty":1E-8,"id":123456789012345678901234567890}')
+    assert decoded == {'price': '19000.10', 'qty': '1E-8', 'id': '123456789012345678901234567890'}
+assert math.isnan(get_json_codec().loads('{"nan":NaN}', False)['nan'])
+
+# only the documents without numbers outside of the strings are decoded by the faster codecs with quote_numbers
+
+assert not has_number_token(b'{"price":"19000.10","list":["1","2"],"empty":[],"ok":true}')
+assert not has_number_token('{"padding":"' + 'x' * 5000 + '","late":["1.5"]}')
+assert has_number_token(b'{"price": 19000.10}')
+assert has_number_token('[\n -1]')
+assert has_number_token('{"padding":"' + 'x' * 5000 + '","late":[true, 1.5]}')
+assert has_number_token(b'12')
+# the same characters in a string give a false positive
+assert has_number_token(b'{"text":"a:1"}')
+
+data = [
+    {'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': '0.001', 'timestamp': 1660000000000, 'reduceOnly': False},
+    {'price': 0.1, 'stop': 1e-7, 'big': 1e16},
+    {'nan': float('nan'), 'none': None},
+    {'unicode': 'été'},
+    {1: 'integer keys'},
+    {'big': 2 ** 70},
+    ['a', 1, [True, None]],
+]
+for name, codec in json_codecs.items():
+    for value in data:
+        assert codec.dumps(value) == json.dumps(value, separators=(',', ':')), (name, value)
+
+# the exchange decodes the responses with the configured codec
+
+exchange = ccxt.Exchange()
+assert exchange.json_backend is get_json_codec()
+assert exchange.parse_json('{"price":1.50}') == {'price': '1.50'}
+exchange = ccxt.Exchange({'jsonCodec': 'json', 'quoteJsonNumbers': False})
+assert exchange.json_backend is json_codecs['json']
+assert exchange.parse_json('{"price":1.50}') == {'price': 1.5}
+assert exchange.parse_json('not json') is None
+assert ccxt.Exchange.json({'a': [1, '2']}) == '{"a":[1,"2"]}'
+
+# the async exchanges decode the UTF-8 JSON responses from the bytes received
+
+server = FakeServer({
+    '/ticker': lambda request: (200, {'Content-Type': 'application/json'}, '{"last":"19000.10","name":"\u00e9t\u00e9"}'.encode()),
+    '/latin': lambda request: (200, {'Content-Type': 'application/json; charset=latin-1'}, '{"name":"\u00e9t\u00e9"}'.encode('latin-1')),
+    '/invalid': lambda request: (200, {'Content-Type': 'application/json'}, b'{"name":"\xff"}'),
+    '/text': lambda request: (200, {'Content-Type': 'text/plain'}, b'OK'),
+}).start()
+
+
+class async_fake(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(async_fake, self).describe(), {
+            'id': 'fake',
+            'urls': {'api': {'public': server.url}},
+            'api': {'public': {'get': ['ticker', 'latin', 'invalid', 'text']}},
+        })
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': self.urls['api'][api] + '/' + path, 'method': method, 'body': body, 'headers': headers}
+
+
+async def test_async_decode():
+    exchange = async_fake()
+    documents = []
+    parse_json = exchange.parse_json
+    exchange.parse_json = lambda document: documents.append(document) or parse_json(document)
+    try:
+        assert await exchange.publicGetTicker() == {'last': '19000.10', 'name': 'été'}
+        assert exchange.last_http_response == '{"last":"19000.10","name":"été"}'
+        assert await exchange.publicGetLatin() == {'name': 'été'}
+        assert await exchange.publicGetInvalid() == {'name': '\ufffd'}
+        assert await exchange.publicGetText() == 'OK'
+    finally:
+        await exchange.close()
+    assert [type(document) for document in documents] == [bytes, str, bytes, str, str]
+
+
+try:
+    asyncio.run(test_async_decode())
+finally:
+    server.stop()
+
+try:
+    get_json_codec('simdjson')
+    assert False
+except ImportError:
+    pass
+
+print('json codec tests passed (' + ', '.join(json_codecs) + ')')
@@ -0,0 +1,53 @@
+import os
+import sys
+import json
+import subprocess
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+# every case runs in a fresh interpreter, the modules loaded by `import ccxt` can't be unloaded
+
+probe = '''
+import json
+import sys
+import {package} as ccxt
+from {package} import binance
+loaded = [name for name in ccxt.exchanges if ('{package}.' + name) in sys.modules]
+ecdsa = 'ccxt.static_dependencies.ecdsa' in sys.modules
+ccxt.binanceusdm
+print(json.dumps({{
+    'loaded': loaded,
+    'ecdsa': ecdsa,
+    'class': ccxt.binance is binance and isinstance(binance, type) and binance().id == 'binance',
+    'submodule': isinstance(ccxt.binance, type) and isinstance(ccxt.binanceusdm, type),
+    'dir': 'binance' in dir(ccxt) and 'kraken' in dir(ccxt) and 'Exchange' in dir(ccxt),
+    'missing': not hasattr(ccxt, 'no_such_exchange'),
+    'signed': ccxt.Exchange.ecdsa('ab' * 32, 'cd' * 32, 'secp256k1')['v'] in [0, 1],
+}}))
+'''
+
+
+def run(package, lazy):
+    env = dict(os.environ, PYTHONPATH=root)
+    env.pop('CCXT_LAZY_LOAD', None)
+    if lazy:
+        env['CCXT_LAZY_LOAD'] = '1'
+    output = subprocess.check_output([sys.executable, '-c', probe.format(package=package)], env=env)
+    return json.loads(output)
+
+
+for package in ['ccxt', 'ccxt.async_support']:
+    # the exchange classes are imported on first access, the static ecdsa module by the first signature
+    result = run(package, True)
+    assert result['loaded'] == ['binance'], result
+    assert result['ecdsa'] is False
+    assert result['class'] and result['submodule'] and result['dir'] and result['missing'] and result['signed'], result
+    # all of them are imported eagerly by default
+    result = run(package, False)
+    assert len(result['loaded']) > 100 and result['ecdsa'] is False, result
+    assert result['class'] and result['submodule'] and result['dir'] and result['missing'] and result['signed'], result
+
+print('lazy module tests passed')
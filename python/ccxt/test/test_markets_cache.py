@@ -0,0 +1,207 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+markets = [
+    {
+        'id': 'BTCUSDT',
+        'symbol': 'BTC/USDT',
+        'base': 'BTC',
+        'quote': 'USDT',
+        'baseId': 'BTC',
+        'quoteId': 'USDT',
+        'type': 'spot',
+        'spot': True,
+        'precision': {'amount': 6, 'price': 2},
+        'info': {'symbol': 'BTCUSDT'},
+    },
+    {
+        'id': 'ETHUSDT',
+        'symbol': 'ETH/USDT',
+        'base': 'ETH',
+        'quote': 'USDT',
+        'baseId': 'ETH',
+        'quoteId': 'USDT',
+        'type': 'spot',
+        'spot': True,
+        'precision': {'amount': 4, 'price': 2},
+        'info': {'symbol': 'ETHUSDT'},
+    },
+]
+
+
+class stub(ccxt.Exchange):
+
+    calls = 0
+
+    def describe(self):
+        return self.deep_extend(super(stub, self).describe(), {
+            'id': 'stub',
+            'urls': {'api': 'https://api.stub.test', 'test': 'https://testnet.stub.test'},
+        })
+
+    def fetch_markets(self, params={}):
+        stub.calls += 1
+        return json.loads(json.dumps(markets))
+
+
+class async_stub(ccxt.async_support.Exchange):
+
+    calls = 0
+    delay = 0
+
+    def describe(self):
+        return self.deep_extend(super(async_stub, self).describe(), {
+            'id': 'stub',
+        })
+
+    async def fetch_markets(self, params={}):
+        async_stub.calls += 1
+        await asyncio.sleep(async_stub.delay)
+        return json.loads(json.dumps(markets))
+
+
+directory = tempfile.mkdtemp()
+
+try:
+
+    # the first load fetches the markets and writes the cache file
+
+    exchange = stub({'marketsCachePath': directory})
+    exchange.load_markets()
+    assert stub.calls == 1
+    assert os.path.isfile(os.path.join(directory, 'stub.json'))
+
+    # the other instances and processes load the markets from the cache
+
+    exchange = stub({'marketsCachePath': directory})
+    loaded = exchange.load_markets()
+    assert stub.calls == 1
+    assert list(loaded.keys()) == ['BTC/USDT', 'ETH/USDT']
+    assert exchange.markets_by_id['ETHUSDT']['symbol'] == 'ETH/USDT'
+    assert exchange.market('BTC/USDT')['precision']['amount'] == 6
+    assert exchange.symbols == ['BTC/USDT', 'ETH/USDT']
+    assert sorted(exchange.currencies.keys()) == ['BTC', 'ETH', 'USDT']
+
+    # a forced reload bypasses the cache
+
+    exchange.load_markets(True)
+    assert stub.calls == 2
+
+    # sandbox markets are cached separately
+
+    exchange = stub({'marketsCachePath': directory})
+    exchange.set_sandbox_mode(True)
+    exchange.load_markets()
+    assert stub.calls == 3
+    assert os.path.isfile(os.path.join(directory, 'stub-sandbox.json'))
+
+    # expired caches are reloaded synchronously
+
+    exchange = stub({'marketsCachePath': directory, 'marketsCacheTTL': 0})
+    exchange.load_markets()
+    assert stub.calls == 4
+
+    # caches written by another version of the library or in another layout are ignored
+
+    path = os.path.join(directory, 'stub.json')
+    for key, value, calls in [('ccxt', '0.0.1', 5), ('version', -1, 6)]:
+        with open(path, encoding='utf-8') as file:
+            cache = json.load(file)
+        cache[key] = value
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(cache, file)
+        exchange = stub({'marketsCachePath': directory})
+        exchange.load_markets()
+        assert stub.calls == calls
+
+    # a corrupt cache file is ignored and replaced
+
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('{"version":')
+    exchange = stub({'marketsCachePath': directory})
+    exchange.load_markets()
+    assert stub.calls == 7
+    assert stub({'marketsCachePath': directory}).read_markets_cache() is not None
+
+    # the threads of a process writing the same cache file don't collide
+
+    workers = [threading.Thread(target=stub({'marketsCachePath': directory, 'marketsCacheTTL': 0}).load_markets) for _ in range(8)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    assert stub.calls == 15
+    assert stub({'marketsCachePath': directory}).read_markets_cache() is not None
+    assert not [name for name in os.listdir(directory) if name.endswith('.tmp')]
+
+    # async instances serve expired markets from the cache and refresh them in the background
+
+    async def test_async_refresh():
+        async_stub.delay = 0.05
+        exchange = async_stub({'marketsCachePath': directory, 'marketsCacheTTL': 0})
+        stale = await exchange.load_markets()
+        assert exchange.markets_refreshing is not None
+        assert 'BTC/USDT' in stale
+        # callers keep receiving the cached markets while the refresh is running
+        assert (await exchange.load_markets()) is stale
+        await asyncio.sleep(0.1)
+        assert async_stub.calls == 1
+        assert exchange.markets_refreshing is None
+        assert exchange.markets is not stale
+        assert 'ETH/USDT' in exchange.markets
+        await exchange.close()
+
+    asyncio.run(test_async_refresh())
+
+    with open(path, encoding='utf-8') as file:
+        timestamp = json.load(file)['timestamp']
+    assert ccxt.Exchange.milliseconds() - timestamp < 1000
+
+    # the shared markets are published once and referenced by the instances with the same market options
+
+    calls = stub.calls
+    first = stub({'shareMarkets': True})
+    first.load_markets()
+    second = stub({'shareMarkets': True})
+    second.load_markets()
+    assert stub.calls == calls + 1
+    assert second.markets is first.markets
+    assert second.markets_by_id is first.markets_by_id
+    assert second.currencies is first.currencies
+    assert second.market('BTC/USDT') is first.market('BTC/USDT')
+    assert second.to_array(second.markets) == list(first.markets.values())
+    try:
+        second.markets['DOGE/USDT'] = second.markets['BTC/USDT']
+        assert False
+    except TypeError:
+        pass
+    assert 'DOGE/USDT' not in first.markets
+    # a reload publishes new structures, the instances attached before it keep the previous ones
+    published = first.markets
+    second.load_markets(True)
+    assert stub.calls == calls + 2
+    assert second.markets is not published and first.markets is published
+    assert second.markets is stub({'shareMarkets': True}).load_markets()
+    assert stub.calls == calls + 2
+    stub({'shareMarkets': True, 'options': {'defaultType': 'future'}}).load_markets()
+    assert stub.calls == calls + 3
+
+finally:
+    shutil.rmtree(directory)
+
+print('markets cache tests passed')
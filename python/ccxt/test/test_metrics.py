@@ -0,0 +1,198 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import time  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.metrics import Histogram, prometheus_text  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+server = FakeServer({
+    '/ticker': lambda request: {'symbol': request['query'].get('symbol'), 'last': '19000.1'},
+    '/tickers': lambda request: [{'symbol': 'BTCUSDT', 'last': '19000.1'}, {'symbol': 'ETHUSDT', 'last': '1300.1'}],
+    '/order': lambda request: (500, {}, 'internal error'),
+}, delay=0.02).start()
+
+description = {
+    'id': 'fake',
+    'rateLimit': 1,
+    'has': {'fetchTicker': True},
+    'urls': {'api': {'public': server.url, 'private': server.url}},
+    'api': {
+        'public': {'get': ['ticker', 'tickers']},
+        'private': {'post': ['order']},
+    },
+}
+
+
+def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+    time.sleep(0.002)  # a slow signature
+    url = self.urls['api'][api] + '/' + path + '?' + self.urlencode(params)
+    return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+
+def parse_ticker(self, ticker, market=None):
+    time.sleep(0.01)  # a slow parsing
+    return {'symbol': ticker['symbol'], 'last': float(ticker['last'])}
+
+
+class fake(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), description)
+
+    sign = sign
+    parse_ticker = parse_ticker
+
+    def fetch_ticker(self, symbol, params={}):
+        return self.parse_ticker(self.publicGetTicker({'symbol': symbol}))
+
+
+class async_fake(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(async_fake, self).describe(), description)
+
+    sign = sign
+    parse_ticker = parse_ticker
+
+    async def fetch_ticker(self, symbol, params={}):
+        return self.parse_ticker(await self.publicGetTicker({'symbol': symbol}))
+
+
+class fan_in_fake(async_fake):
+
+    def describe(self):
+        return self.deep_extend(super(fan_in_fake, self).describe(), {
+            'has': {'fetchTickers': True},
+        })
+
+    async def fetch_markets(self, params={}):
+        return [{'id': id, 'symbol': id, 'base': id[:3], 'quote': 'USDT'} for id in ['BTCUSDT', 'ETHUSDT']]
+
+    async def fetch_ticker(self, symbol, params={}):
+        await self.load_markets()
+        return await super(fan_in_fake, self).fetch_ticker(symbol, params)
+
+    async def fetch_tickers(self, symbols=None, params={}):
+        await self.load_markets()
+        tickers = [self.parse_ticker(ticker) for ticker in await self.publicGetTickers()]
+        return self.filter_by_array(tickers, 'symbol', symbols)
+
+
+def check(exchange):
+    snapshot = exchange.metrics.snapshot()
+    assert set(snapshot) == set(['publicGetTicker', 'privatePostOrder'])
+    ticker = snapshot['publicGetTicker']
+    assert ticker['requests'] == 3 and ticker['errors'] == {}
+    assert ticker['sent'] == 3 * len(server.url + '/ticker?symbol=BTCUSDT')
+    assert ticker['received'] == 3 * len('{"symbol": "BTCUSDT", "last": "19000.1"}')
+    latency = ticker['latency']
+    assert all(latency[phase]['count'] == 3 for phase in ['throttle', 'sign', 'network', 'decode'])
+    assert latency['sign']['sum'] >= 6 and latency['network']['sum'] >= 60 and latency['decode']['sum'] < 10
+    # the raw calls of the endpoint are not parsed, only the two calls of fetch_ticker
+    assert latency['parse']['count'] == 2 and latency['parse']['sum'] >= 20
+    assert latency['network']['buckets'][-1] == [float('inf'), 3]
+    order = snapshot['privatePostOrder']
+    assert order['requests'] == 1 and order['errors'] == {'ExchangeNotAvailable': 1}
+    assert order['latency']['network']['count'] == 0
+    text = exchange.metrics.prometheus(exchange.id)
+    assert '# TYPE ccxt_request_duration_seconds histogram\n' in text
+    assert 'ccxt_requests_total{exchange="fake",endpoint="publicGetTicker"} 3\n' in text
+    assert 'ccxt_request_errors_total{exchange="fake",endpoint="privatePostOrder",error="ExchangeNotAvailable"} 1\n' in text
+    assert 'ccxt_request_duration_seconds_bucket{exchange="fake",endpoint="publicGetTicker",phase="sign",le="+Inf"} 3\n' in text
+    assert 'ccxt_request_duration_seconds_count{exchange="fake",endpoint="publicGetTicker",phase="parse"} 2\n' in text
+
+
+# the histograms count the values up to each bound
+
+histogram = Histogram()
+for value in [0.1, 0.5, 0.7, 1000, 20000]:
+    histogram.observe(value)
+buckets = dict((bound, count) for bound, count in histogram.cumulative())
+assert buckets[0.5] == 2 and buckets[1] == 3 and buckets[500] == 3 and buckets[1000] == 4 and buckets[float('inf')] == 5
+assert histogram.count == 5 and histogram.sum == 21001.3
+
+# disabled by default
+
+exchange = fake()
+assert exchange.metrics is None
+assert exchange.fetch_ticker('BTCUSDT') == {'symbol': 'BTCUSDT', 'last': 19000.1}
+
+# every phase of the requests of the sync exchanges
+
+exchange = fake({'enableMetrics': True})
+assert exchange.fetch_ticker('BTCUSDT') == {'symbol': 'BTCUSDT', 'last': 19000.1}
+assert exchange.fetchTicker('BTCUSDT') == {'symbol': 'BTCUSDT', 'last': 19000.1}
+exchange.publicGetTicker({'symbol': 'BTCUSDT'})
+try:
+    exchange.privatePostOrder()
+    assert False
+except ccxt.ExchangeNotAvailable:
+    pass
+check(exchange)
+exchange.metrics.reset()
+assert exchange.metrics.snapshot() == {}
+
+# and of the async ones
+
+
+async def test():
+    exchange = async_fake({'enableMetrics': True})
+    await asyncio.gather(exchange.fetch_ticker('BTCUSDT'), exchange.fetchTicker('BTCUSDT'), exchange.publicGetTicker({'symbol': 'BTCUSDT'}))
+    try:
+        await exchange.privatePostOrder()
+        assert False
+    except ccxt.ExchangeNotAvailable:
+        pass
+    check(exchange)
+
+    # the large responses decoded in the executor, and the requests shared by the callers
+
+    exchange.metrics.reset()
+    exchange.offloadExecutor = 'thread'
+    exchange.offloadJsonSize = 10
+    await exchange.fetch_ticker('BTCUSDT')
+    decode = exchange.metrics.snapshot()['publicGetTicker']['latency']['decode']
+    assert decode['count'] == 1 and decode['sum'] > 0
+    exchange.singleFlight = True
+    await asyncio.gather(*[exchange.publicGetTicker({'symbol': 'BTCUSDT'}) for _ in range(5)])
+    # the callers sharing a request are measured once
+    assert exchange.metrics.snapshot()['publicGetTicker']['requests'] == 2
+    await exchange.close()
+
+    # the fan-in methods are measured, the batched calls are parsed once in the bulk call
+
+    exchange = fan_in_fake({'enableMetrics': True, 'fanIn': True})
+    assert exchange.fetch_ticker.func == exchange.measure_unified and exchange.fetch_ticker.args[0].func == exchange.fetch_fan_in
+    results = await asyncio.gather(exchange.fetch_ticker('BTCUSDT'), exchange.fetchTicker('ETHUSDT'))
+    assert [result['last'] for result in results] == [19000.1, 1300.1]
+    await exchange.fetch_ticker('BTCUSDT')
+    snapshot = exchange.metrics.snapshot()
+    assert snapshot['publicGetTickers']['requests'] == 1 and snapshot['publicGetTicker']['requests'] == 1
+    assert snapshot['publicGetTickers']['latency']['parse']['count'] == 1
+    assert snapshot['publicGetTicker']['latency']['parse']['count'] == 1
+    await exchange.close()
+
+    # several exchanges in one text
+
+    other = async_fake({'enableMetrics': True, 'id': 'other'})
+    await other.fetch_ticker('BTCUSDT')
+    text = prometheus_text({'fake': exchange.metrics, 'other': other.metrics})
+    assert text.count('# TYPE ccxt_requests_total counter') == 1
+    assert 'ccxt_requests_total{exchange="other",endpoint="publicGetTicker"} 1\n' in text
+    await other.close()
+
+
+asyncio.run(test())
+server.stop()
+
+print('metrics tests passed')
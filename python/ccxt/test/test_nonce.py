@@ -0,0 +1,112 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import multiprocessing  # noqa: E402
+import tempfile  # noqa: E402
+import threading  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.base.nonce import NonceGenerator, SharedNonceGenerator  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+calls = 2000
+threads = 8
+processes = 4
+
+
+class fake(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), {'id': 'fake'})
+
+    def nonce(self):
+        # a clock that does not move, like many calls within the same millisecond
+        return 1660000000000
+
+
+def collect(exchange, results):
+    results.extend([exchange.nonce() for _ in range(calls)])
+
+
+def nonce_worker(directory, barrier, results):
+    exchange = fake({'apiKey': 'key', 'sharedNoncePath': directory})
+    barrier.wait()
+    results.put([exchange.nonce() for _ in range(calls)])
+
+
+if __name__ == '__main__':
+
+    # disabled by default
+
+    assert fake().nonce() == fake().nonce() == 1660000000000
+
+    # the nonces are strictly increasing for the threads of one or more instances with the same api key
+
+    exchanges = [fake({'apiKey': 'key', 'monotonicNonce': True}) for _ in range(2)]
+    lists = [[] for _ in range(threads)]
+    workers = [threading.Thread(target=collect, args=(exchanges[i % 2], lists[i])) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    nonces = sum(lists, [])
+    assert len(set(nonces)) == threads * calls
+    assert all(a < b for nonces in lists for a, b in zip(nonces, nonces[1:]))
+    assert min(nonces) == 1660000000000 and max(nonces) == 1660000000000 + threads * calls - 1
+
+    # the other api keys have their own nonces, the api key can change after the instance is created
+
+    other = fake({'apiKey': 'other', 'monotonicNonce': True})
+    assert other.nonce() == 1660000000000
+    other.apiKey = 'key'
+    assert other.nonce() == 1660000000000 + threads * calls
+
+    # the nonce given in the config is wrapped too
+
+    exchange = fake({'apiKey': 'config', 'monotonicNonce': True, 'nonce': lambda: 7})
+    assert [exchange.nonce(), exchange.nonce()] == [7, 8]
+
+    # the nonces that are ahead of the last one and the ones formatted as strings are kept as they are
+
+    generator = NonceGenerator()
+    assert [generator(5), generator(5), generator(10), generator(7), generator('1.5')] == [5, 6, 10, 11, '1.5']
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        # the shared nonces are persisted across restarts
+
+        path = os.path.join(directory, 'nonce')
+        generator = SharedNonceGenerator(path)
+        assert [generator(100), generator(100)] == [100, 101]
+        generator.close()
+        assert SharedNonceGenerator(path)(100) == 102
+
+        # and strictly increasing across the processes
+
+        context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+        barrier = context.Barrier(processes)
+        results = context.Queue()
+        workers = [context.Process(target=nonce_worker, args=(directory, barrier, results)) for _ in range(processes)]
+        for worker in workers:
+            worker.start()
+        lists = [results.get(timeout=60) for _ in workers]
+        for worker in workers:
+            worker.join()
+        nonces = sum(lists, [])
+        assert len(set(nonces)) == processes * calls
+        assert all(a < b for nonces in lists for a, b in zip(nonces, nonces[1:]))
+        assert len(os.listdir(directory)) == 2
+        assert 'key' not in ''.join(os.listdir(directory))
+
+        # a restarted process continues after the last nonce
+
+        Exchange = ccxt.Exchange
+        Exchange.nonce_generators = {}
+        assert fake({'apiKey': 'key', 'sharedNoncePath': directory}).nonce() == max(nonces) + 1
+
+    print('nonce tests passed')
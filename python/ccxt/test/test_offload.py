@@ -0,0 +1,183 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import concurrent.futures  # noqa: E402
+import logging  # noqa: E402
+import threading  # noqa: E402
+import time  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+logging.getLogger('ccxt.base.exchange').setLevel(logging.ERROR)
+
+trades = [{'id': str(i), 'price': '19000.1', 'amount': '0.001', 'side': 'buy' if i % 2 else 'sell'} for i in range(2000)]
+markets = [{
+    'id': 'C' + str(i) + 'USDT',
+    'symbol': 'C' + str(i) + '/USDT',
+    'base': 'C' + str(i),
+    'quote': 'USDT',
+    'baseId': 'C' + str(i),
+    'quoteId': 'USDT',
+    'type': 'spot',
+    'spot': True,
+    'precision': {'amount': 6, 'price': 2},
+    'info': {},
+} for i in range(1500)]
+
+server = FakeServer({
+    '/trades': lambda request: trades,
+    '/markets': lambda request: markets[:int(request['query'].get('limit', len(markets)))],
+    '/order': lambda request: {'id': '1'},
+}).start()
+
+
+class fake(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), {
+            'id': 'fake',
+            'rateLimit': 1,
+            'urls': {'api': {'public': server.url, 'private': server.url}},
+            'api': {
+                'public': {'get': ['trades', 'markets']},
+                'private': {'get': ['order']},
+            },
+        })
+
+    def __init__(self, config={}):
+        super(fake, self).__init__(config)
+        self.threads = {'sign': [], 'set_markets': []}
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        self.threads['sign'].append(threading.get_ident())
+        if api == 'private':
+            time.sleep(0.01)  # a slow signature
+        url = self.urls['api'][api] + '/' + path + '?' + self.urlencode(params)
+        return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+    def set_markets(self, markets, currencies=None):
+        self.threads['set_markets'].append(threading.get_ident())
+        return super(fake, self).set_markets(markets, currencies)
+
+    async def fetch_markets(self, params={}):
+        return await self.publicGetMarkets(params)
+
+
+class counting_pool(concurrent.futures.ThreadPoolExecutor):
+
+    def __init__(self):
+        super(counting_pool, self).__init__(2)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super(counting_pool, self).submit(*args, **kwargs)
+
+
+class blocking(fake):
+
+    async def fetch_markets(self, params={}):
+        time.sleep(0.3)  # blocks the event loop
+        return markets[:10]
+
+
+async def test():
+    loop_thread = threading.get_ident()
+
+    # disabled by default, everything runs on the loop
+
+    exchange = fake()
+    await exchange.load_markets()
+    await exchange.publicGetTrades()
+    await exchange.privateGetOrder()
+    await exchange.privateGetOrder()
+    assert all(thread == loop_thread for thread in exchange.threads['sign'] + exchange.threads['set_markets'])
+    await exchange.close()
+
+    # the large responses are decoded, the many markets are set and the slow signatures are computed in the executor
+
+    for executor in ['thread', 'process', counting_pool()]:
+        exchange = fake({'offloadExecutor': executor, 'offloadJsonSize': 100000})
+        assert await exchange.publicGetTrades() == trades
+        assert (await exchange.publicGetMarkets({'limit': 1}))[0]['id'] == 'C0USDT'
+        await exchange.load_markets()
+        assert len(exchange.markets) == 1500 and exchange.markets_by_id['C7USDT']['symbol'] == 'C7/USDT'
+        assert exchange.threads['set_markets'][-1] != loop_thread
+        await exchange.load_markets(True, {'limit': 10})
+        assert len(exchange.markets) == 10 and exchange.threads['set_markets'][-1] == loop_thread
+        assert await exchange.privateGetOrder() == {'id': '1'}  # takes 10 ms to sign, on the loop
+        assert exchange.threads['sign'][-1] == loop_thread
+        assert await exchange.privateGetOrder() == {'id': '1'}  # known to be slow, in the executor
+        assert exchange.threads['sign'][-1] != loop_thread
+        assert exchange.sign_times['private'] >= 10
+        assert exchange.sign_times['public'] < exchange.offloadSignTime
+        if executor == 'thread':
+            # the coroutines see the previous markets or the new ones, never a mix of both
+            await exchange.load_markets(True)
+            reloading = asyncio.ensure_future(exchange.load_markets(True, {'limit': 1200}))
+            seen = set()
+            while not reloading.done():
+                seen.add((len(exchange.markets), len(exchange.markets_by_id), len(exchange.symbols)))
+                await asyncio.sleep(0)
+            await reloading
+            assert seen <= set([(1500, 1500, 1500), (1200, 1200, 1200)]), seen
+            assert len(exchange.markets) == 1200 and exchange.threads['set_markets'][-1] != loop_thread
+        if isinstance(executor, counting_pool):
+            # the trades, the markets, the reloaded markets and the slow signature
+            assert executor.submitted == 4
+            executor.shutdown()
+        await exchange.close()
+
+    # the exchanges decoding the responses their own way decode them in a thread
+
+    class quoting(fake):
+        def on_json_response(self, response_body):
+            return {'decoded': super(quoting, self).on_json_response(response_body)}
+
+    exchange = quoting({'offloadExecutor': 'process', 'offloadJsonSize': 100000})
+    assert await exchange.publicGetTrades() == {'decoded': trades}
+    await exchange.close()
+
+    # the stalls of the loop are reported with the exchange calls that caused them
+
+    exchange = blocking({'loopLagMonitor': True, 'loopLagThreshold': 100})
+    other = fake({'loopLagMonitor': True})
+    exchange.open()
+    other.open()
+    monitor = exchange.lag_monitor
+    assert other.lag_monitor is monitor and monitor.references == 2
+    await exchange.load_markets()
+    await asyncio.sleep(0.1)
+    stalls = [stall for stall in monitor.stalls if stall['calls']]
+    assert len(stalls) == 1
+    stall = stalls[0]
+    # at least the blocking time, a loaded machine can add to it
+    assert 250 <= stall['lag'] < 1000, stall['lag']
+    assert stall['calls'] == ['fake.load_markets_helper', 'fake.fetch_markets'], stall['calls']
+
+    # the blocking code outside of the exchanges is reported too
+
+    time.sleep(0.2)
+    await asyncio.sleep(0.1)
+    assert monitor.stalls[-1]['lag'] >= 150 and monitor.stalls[-1]['calls'] == []
+
+    # the monitor stops with the last exchange
+
+    await exchange.close()
+    assert monitor.running and (exchange.lag_monitor is None)
+    await other.close()
+    assert not monitor.running and (asyncio.get_running_loop() not in ccxt.async_support.Exchange.loop_lag_monitors)
+
+
+asyncio.run(test())
+server.stop()
+
+print('offload tests passed')
@@ -0,0 +1,167 @@
+import os
+import sys
+import math
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.ohlcv import OHLCVColumns  # noqa: E402
+from ccxt.base import ohlcv as module  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+random.seed(3)
+
+minute = 60000
+start = 1600000000000
+
+
+def raw_candle(i):
+    return [start + i * minute, str(random.uniform(1, 2)), '2.5', '0.5', str(random.uniform(1, 2)), str(random.randint(0, 1000))]
+
+
+trades = []
+for i in range(500):
+    price = round(random.uniform(100, 200), 2)
+    trades.append({'timestamp': start + i * 7000, 'price': price, 'amount': round(random.uniform(0, 3), 4)})
+
+
+class stub(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(stub, self).describe(), {
+            'id': 'stub',
+            'has': {'fetchTrades': True},
+        })
+
+    def fetch_markets(self, params={}):
+        return []
+
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        return trades
+
+
+class async_stub(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(async_stub, self).describe(), {
+            'id': 'stub',
+            'has': {'fetchTrades': True},
+        })
+
+    async def fetch_markets(self, params={}):
+        return []
+
+    async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        return trades
+
+
+rows = stub()
+columns = stub({'columnarOHLCV': True})
+
+# parse_ohlcvs gives the same candles with the same sorting and filtering, in either order
+
+raw = [raw_candle(i) for i in range(300)]
+shuffled = raw[:]
+random.shuffle(shuffled)
+for candles in [raw, raw[::-1], shuffled, []]:
+    for since in [None, start, start + 100 * minute + 1, start + 1000 * minute]:
+        for limit in [None, 0, 1, 50, 1000]:
+            expected = rows.parse_ohlcvs(candles, None, '1m', since, limit)
+            result = columns.parse_ohlcvs(candles, None, '1m', since, limit)
+            assert isinstance(result, OHLCVColumns)
+            assert result == expected
+            assert len(result) == len(expected)
+            assert result.to_list() == expected
+
+result = columns.parse_ohlcvs(raw)
+assert result[0] == rows.parse_ohlcvs(raw)[0]
+assert result[-1][0] == start + 299 * minute
+assert isinstance(result[10:20], OHLCVColumns)
+assert len(result[10:20]) == 10
+assert result.timestamp.typecode == 'q'
+assert result.close.typecode == 'd'
+
+# missing values are stored as NaN
+
+result = columns.parse_ohlcvs([[start, '1', '1', '1', '1', None]])
+assert math.isnan(result.volume[0])
+
+# the float timestamps of safe_number() are stored as integers, the candles without a timestamp are skipped
+
+result = columns.parse_ohlcvs([[float(start + minute), '1', '2', '0.5', '1.5', '10'], [start, '1', '1', '1', '1', '1']])
+assert list(result.timestamp) == [start, start + minute]
+assert result == rows.parse_ohlcvs([[start, '1', '1', '1', '1', '1'], [start + minute, '1', '2', '0.5', '1.5', '10']])
+result = OHLCVColumns.from_rows([[None, 1.0, 1.0, 1.0, 1.0, 1.0], [float(start), 1.0, 1.0, 1.0, 1.0, 1.0]])
+assert len(result) == 1 and result.timestamp[0] == start
+result = columns.parse_ohlcvs([[None, '1', '1', '1', '1', '1']] + raw[:10], None, '1m', start + minute)
+assert result == rows.parse_ohlcvs(raw[:10], None, '1m', start + minute)
+result = OHLCVColumns.from_rows([[float(start), 1.0, 1.0, 1.0, 1.0, 1.0, 2.0], [start + minute, 1.0, 1.0, 1.0, 1.0, 1.0, None]], True)
+assert list(result.count) == [2, 0]
+
+# candles built from trades
+
+for since in [None, start + 600000]:
+    for limit in [None, 100]:
+        expected = rows.build_ohlcvc(trades, '1m', since, limit)
+        result = columns.build_ohlcvc(trades, '1m', since, limit)
+        assert result.count is not None
+        assert result == expected
+
+assert columns.fetch_ohlcvc('BTC/USDT') == rows.fetch_ohlcvc('BTC/USDT')
+result = columns.fetch_ohlcv('BTC/USDT', '5m')
+assert result.count is None
+assert result == rows.fetch_ohlcv('BTC/USDT', '5m')
+assert columns.fetchOHLCV('BTC/USDT', '5m') == result
+
+# the trades without a timestamp are merged into the current candle, they can't open one
+
+untimed = [{'timestamp': None, 'price': 50.0, 'amount': 1.0}] + trades[:10] + [{'timestamp': None, 'price': 500.0, 'amount': 1.0}] + trades[10:20]
+result = columns.build_ohlcvc(untimed)
+assert result[0][0] == trades[0]['timestamp'] // minute * minute
+assert max(result.high) == 500.0 and sum(result.count) == len(untimed) - 2
+
+# the candles parsed by the exchange are converted
+
+
+class custom_stub(stub):
+
+    def parse_ohlcvs(self, ohlcvs, market=None, timeframe='1m', since=None, limit=None):
+        return super(custom_stub, self).parse_ohlcvs(ohlcvs, market, timeframe, since, limit)[::-1]
+
+
+result = custom_stub({'columnarOHLCV': True}).parse_ohlcvs(raw)
+assert isinstance(result, OHLCVColumns)
+assert list(result) == rows.parse_ohlcvs(raw)[::-1]
+
+
+async def test_async():
+    exchange = async_stub({'columnarOHLCV': True})
+    result = await exchange.fetch_ohlcv('BTC/USDT', '5m')
+    assert isinstance(result, OHLCVColumns)
+    assert result == rows.fetch_ohlcv('BTC/USDT', '5m')
+    await exchange.close()
+
+
+asyncio.run(test_async())
+
+# numpy views
+
+if module.numpy is not None:
+    result = columns.parse_ohlcvs(raw)
+    arrays = result.to_numpy()
+    assert sorted(arrays.keys()) == ['close', 'high', 'low', 'open', 'timestamp', 'volume']
+    assert arrays['timestamp'].dtype == module.numpy.int64
+    assert arrays['close'].tolist() == result.close.tolist()
+    # the arrays share the memory of the columns
+    result.close[0] = 0.0
+    assert arrays['close'][0] == 0.0
+    assert columns.build_ohlcvc(trades).to_numpy()['count'].sum() == len(trades) - 1
+
+print('ohlcv columns tests passed')
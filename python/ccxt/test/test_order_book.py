@@ -0,0 +1,123 @@
+import os
+import sys
+import json
+import zlib
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.order_book import OrderBook  # noqa: E402
+from ccxt.base.order_book_side import Asks, Bids  # noqa: E402
+from ccxt.pro.base.order_book import OrderBook as ProOrderBook  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+random.seed(5)
+exchange = ccxt.Exchange()
+
+
+def levels(count):
+    return [[random.randint(1, count // 2) / 10, random.random()] for _ in range(count)]
+
+
+# the websocket exchanges keep the same books
+
+assert ProOrderBook is OrderBook
+
+# the snapshots are sorted like sort_by did
+
+for _ in range(50):
+    bids = exchange.aggregate(levels(100))
+    asks = exchange.aggregate(levels(100))
+    assert Bids(bids) == exchange.sort_by(bids, 0, True)
+    assert Asks(asks) == exchange.sort_by(asks, 0)
+
+# the deltas give the same book as applying them to a dict and sorting it
+
+for descending, side in [(True, Bids()), (False, Asks())]:
+    reference = {}
+    for _ in range(5000):
+        price = random.randint(1, 300)
+        amount = random.choice([0, 0, 1, 2.5])
+        side.store(price, amount)
+        if amount > 0:
+            reference[price] = amount
+        else:
+            reference.pop(price, None)
+        if random.random() < 0.01:
+            assert side == [[p, reference[p]] for p in sorted(reference, reverse=descending)]
+    assert side == [[p, reference[p]] for p in sorted(reference, reverse=descending)]
+
+# the book
+
+book = OrderBook({'symbol': 'BTC/USDT', 'bids': [[1, 1], [2, 1]], 'asks': [[4, 1], [3, 1]], 'timestamp': 1})
+assert book.best_bid() == [2, 1] and book.best_ask() == [3, 1]
+book.apply_delta([[2, 0], [2.5, 3]], [[3.5, 1]], 1660000000000, 7)
+assert book['bids'] == [[2.5, 3], [1, 1]] and book['asks'] == [[3, 1], [3.5, 1], [4, 1]]
+assert book['datetime'] == '2022-08-08T23:06:40.000Z' and book['nonce'] == 7
+assert json.loads(json.dumps(book))['bids'] == [[2.5, 3], [1, 1]]
+assert book.limit(1) == {'symbol': 'BTC/USDT', 'bids': [[2.5, 3]], 'asks': [[3, 1]], 'timestamp': 1660000000000, 'datetime': '2022-08-08T23:06:40.000Z', 'nonce': 7}
+assert OrderBook().best_bid() is None
+book = OrderBook({'asks': [[3, 1], [1, 1], [2, 1]]}, 2)
+book.apply_delta([], [[0.5, 1]])
+assert book.limit()['asks'] == [[0.5, 1], [1, 1]]
+
+# the checksums are computed from the strings of the levels
+
+book = OrderBook({'bids': [[3366.1, 7.0], [3366, 6]], 'asks': [[3368, 8], [3366.8, 9]]})
+checksum = zlib.crc32(b'3366.1:7:3366.8:9:3366:6:3368:8')
+assert book.checksum() == (checksum - 2 ** 32 if checksum >= 2 ** 31 else checksum)
+book.verify_checksum(str(book.checksum()))
+book = OrderBook({'bids': [[0.05, 0.000015]], 'asks': [[0.05005, 0.000005], [0.0501, 0.000005]]})
+kraken = (lambda level: ['%.5f' % level[0], '%.8f' % level[1]])
+assert book.checksum('kraken', None, kraken) == zlib.crc32(b'5005500501050050001500')
+try:
+    book.verify_checksum(123, 'kraken', None, kraken)
+    assert False
+except ccxt.InvalidNonce:
+    pass
+
+# with keepOrderBooks the book of the symbol is reset in place with the levels of parse_order_book(), apart from
+# the books of the websocket streams
+
+response = {'bids': [['1.5', '2'], ['1.7', '1'], ['1.6', '0']], 'asks': [['2.1', '1'], ['1.9', '3']]}
+exchange = ccxt.Exchange({'keepOrderBooks': True})
+orderbook = exchange.parse_order_book(response, 'BTC/USDT', 1660000000000)
+assert isinstance(orderbook, OrderBook)
+assert orderbook == ccxt.Exchange().parse_order_book(response, 'BTC/USDT', 1660000000000)
+assert orderbook == {
+    'symbol': 'BTC/USDT',
+    'bids': [[1.7, 1.0], [1.6, 0.0], [1.5, 2.0]],
+    'asks': [[1.9, 3.0], [2.1, 1.0]],
+    'timestamp': 1660000000000,
+    'datetime': '2022-08-08T23:06:40.000Z',
+    'nonce': None,
+}
+bids = orderbook['bids']
+assert exchange.kept_orderbooks['BTC/USDT'] is orderbook and exchange.orderbooks == {}
+# the deltas find the levels of the snapshot
+orderbook.apply_delta([[1.6, 0], [1.8, 4]], [[1.9, 0]])
+assert orderbook['bids'] == [[1.8, 4], [1.7, 1.0], [1.5, 2.0]] and orderbook['asks'] == [[2.1, 1.0]]
+assert exchange.parseOrderBook({'bids': [['1', '1']], 'asks': []}, 'BTC/USDT') is orderbook
+assert orderbook['bids'] is bids and bids == [[1, 1]] and orderbook['asks'] == []
+
+
+# the books parsed by the implementations of the exchanges are kept too
+
+
+class Parsing(ccxt.Exchange):
+    def parse_order_book(self, orderbook, symbol, timestamp=None, bidsKey='bids', asksKey='asks', priceKey=0, amountKey=1):
+        return super(Parsing, self).parse_order_book(orderbook['data'], symbol, timestamp, bidsKey, asksKey, priceKey, amountKey)
+
+
+exchange = Parsing({'keepOrderBooks': True})
+orderbook = exchange.parse_order_book({'data': response}, 'BTC/USDT')
+assert exchange.kept_orderbooks['BTC/USDT'] is orderbook
+assert orderbook['bids'] == [[1.7, 1.0], [1.5, 2.0]] and orderbook['asks'] == [[1.9, 3.0], [2.1, 1.0]]
+assert exchange.aggregate([[1, 2], [2, 1], [1, 3], [3, 0]]) == [[1, 5], [2, 1]]
+
+print('order book tests passed')
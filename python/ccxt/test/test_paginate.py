@@ -0,0 +1,173 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+minute = 60000
+listing = 1600000000000
+candles = [[listing + i * minute, 100 + i, 101 + i, 99 + i, 100.5 + i, i] for i in range(5000)]
+# three trades per second, sharing the same timestamp
+trades = [{'id': '%05d' % i, 'timestamp': listing + (i // 3) * 1000, 'price': 100 + i, 'amount': 1} for i in range(3000)]
+
+
+def klines(request):
+    # the fake exchange returns at most 500 candles, less than the requested limit
+    since = int(request['query']['since'])
+    limit = min(int(request['query']['limit']), 500)
+    return [candle for candle in candles if candle[0] >= since][:limit]
+
+
+def public_trades(request):
+    since = int(request['query']['since'])
+    limit = min(int(request['query']['limit']), 100)
+    return [trade for trade in trades if trade['timestamp'] >= since][:limit]
+
+
+def describe(url):
+    return {
+        'id': 'fake',
+        'rateLimit': 1,
+        'urls': {'api': {'public': url}},
+        'api': {'public': {'get': ['klines', 'trades']}},
+        'timeframes': {'1m': '1m', '1h': '1h'},
+        'has': {'fetchOHLCV': True, 'fetchTrades': True},
+    }
+
+
+class parsers(object):
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        url = self.urls['api'][api] + '/' + path + '?' + self.urlencode(params)
+        return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+    def parse_trade(self, trade, market=None):
+        # the numbers in the responses are parsed as strings
+        return self.safe_trade({
+            'id': self.safe_string(trade, 'id'),
+            'timestamp': self.safe_integer(trade, 'timestamp'),
+            'symbol': 'BTC/USDT',
+            'price': self.safe_string(trade, 'price'),
+            'amount': self.safe_string(trade, 'amount'),
+            'info': trade,
+        })
+
+
+class fake(parsers, ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), describe(self.url))
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        response = self.publicGetKlines(self.extend({'since': since, 'limit': limit}, params))
+        return self.parse_ohlcvs(response, None, timeframe, since, limit)
+
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        response = self.publicGetTrades(self.extend({'since': since, 'limit': limit}, params))
+        return self.parse_trades(response, None, since, limit)
+
+
+class async_fake(parsers, ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(async_fake, self).describe(), describe(self.url))
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        response = await self.publicGetKlines(self.extend({'since': since, 'limit': limit}, params))
+        return self.parse_ohlcvs(response, None, timeframe, since, limit)
+
+    async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        response = await self.publicGetTrades(self.extend({'since': since, 'limit': limit}, params))
+        return self.parse_trades(response, None, since, limit)
+
+
+def expected_candles(since, until):
+    return [candle for candle in candles if since <= candle[0] < until]
+
+
+def expected_trade_ids(since, until):
+    return [trade['id'] for trade in trades if since <= trade['timestamp'] < until]
+
+
+server = FakeServer({'/klines': klines, '/trades': public_trades}, delay=0.01).start()
+fake.url = async_fake.url = server.url
+
+try:
+
+    exchange = fake()
+
+    # candles are fetched in windows of limit * timeframe, the capped pages are continued within the window
+
+    since = listing + 30 * minute + 1
+    until = listing + 4000 * minute
+    result = list(exchange.paginate('fetch_ohlcv', 'BTC/USDT', since, until, '1m'))
+    assert result == expected_candles(since, until)
+    assert len(result) == 3969
+
+    # a range that ends after the last candle and the camelcase method name
+
+    result = list(exchange.paginate('fetchOHLCV', 'BTC/USDT', listing - 100 * minute, listing + 6000 * minute, '1m', 700))
+    assert result == candles
+
+    # trades are fetched from the timestamp of the last trade of the previous page, the overlap is removed
+
+    since = listing + 12345
+    until = listing + 700000
+    result = list(exchange.paginate('fetch_trades', 'BTC/USDT', since, until, limit=50))
+    assert [trade['id'] for trade in result] == expected_trade_ids(since, until)
+
+    # the generator stops issuing requests when the consumer stops
+
+    count = len(server.requests)
+    generator = exchange.paginate('fetch_trades', 'BTC/USDT', listing, limit=100)
+    assert next(generator)['id'] == '00000'
+    generator.close()
+    assert len(server.requests) == count + 1
+
+    try:
+        list(exchange.paginate('fetch_trades', 'BTC/USDT'))
+        assert False
+    except ccxt.ArgumentsRequired:
+        pass
+
+    # the async windows are fetched concurrently and yielded in order
+
+    async def test_async():
+        exchange = async_fake({'paginationConcurrency': 3})
+        server.max_in_flight = 0
+        since = listing + 30 * minute + 1
+        until = listing + 4000 * minute
+        result = [candle async for candle in exchange.paginate('fetch_ohlcv', 'BTC/USDT', since, until, '1m', 400)]
+        assert result == expected_candles(since, until)
+        assert 1 < server.max_in_flight <= 3
+        since = listing + 12345
+        until = listing + 700000
+        result = [trade async for trade in exchange.paginate('fetch_trades', 'BTC/USDT', since, until, limit=50)]
+        assert [trade['id'] for trade in result] == expected_trade_ids(since, until)
+        # the pages are yielded as they arrive, the windows stop fetching a few pages ahead of the consumer
+        count = len(server.requests)
+        generator = exchange.paginate('fetch_trades', 'BTC/USDT', listing, listing + 700000, limit=50)
+        assert (await generator.__anext__())['id'] == '00000'
+        await asyncio.sleep(0.3)
+        fetched = len(server.requests) - count
+        assert fetched <= 3 * (exchange.paginationBuffer + 2), fetched
+        await generator.aclose()
+        await asyncio.sleep(0.05)
+        assert len(server.requests) - count <= fetched + 3
+        await exchange.close()
+
+    asyncio.run(test_async())
+
+finally:
+    server.stop()
+
+print('paginate tests passed')
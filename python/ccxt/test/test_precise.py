@@ -0,0 +1,23 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+from ccxt.base.precise import Precise  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# the batch methods are specific to the python implementation,
+# the rest of the Precise tests are generated in test_decimal_to_precision.py
+
+assert Precise.string_sum(['1.5', '-0.25', '1e-8', '100']) == '101.25000001'
+assert Precise.string_sum(['0.1', None, '0.2']) == '0.3'
+assert Precise.string_sum(['0.5', '-0.50']) == '0'
+assert Precise.string_sum([None, None]) is None
+assert Precise.string_sum([]) is None
+
+assert Precise.string_mul_sum(['100.5', '200', None], ['0.1', '0.25', '1']) == '60.05'
+assert Precise.string_mul_sum(['1e8'], ['0.00000002']) == '2'
+assert Precise.string_mul_sum([None], ['1']) is None
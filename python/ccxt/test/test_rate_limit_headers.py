@@ -0,0 +1,155 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import time  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+delta = 30  # ms
+
+# a stand-in for an exchange that reports the weight used by everyone sharing the IP address in every
+# response, like X-MBX-USED-WEIGHT-1M, and the remaining orders, like the remaining quota headers
+
+state = {'weight': 0, 'orders': 10, 'retry': None}
+
+
+def used_weight(request):
+    state['weight'] += 1
+    return (200, {'X-MBX-USED-WEIGHT-1M': str(state['weight'])}, {})
+
+
+def order(request):
+    state['orders'] -= 1
+    return (200, {'X-RateLimit-Remaining-Orders': str(state['orders'])}, {})
+
+
+def banned(request):
+    return (429, {'Retry-After': state['retry']}, {'error': 'too many requests'})
+
+
+routes = {'/weight': used_weight, '/order': order, '/banned': banned}
+
+rate_limit_headers = {
+    # 100 weight per 10 seconds, the requests slow down at 90
+    'weight': {'header': 'x-mbx-used-weight-1m', 'limit': 100, 'interval': 10000},
+    # 20 orders per 10 seconds, only the POST requests count
+    'orders': {'header': 'X-RateLimit-Remaining-Orders', 'type': 'remaining', 'limit': 20, 'interval': 10000, 'cost': 1, 'methods': ['POST']},
+}
+
+
+def describe(url):
+    return {
+        'id': 'fake',
+        'rateLimit': 1,
+        'urls': {'api': {'public': url, 'private': url}},
+        'api': {
+            'public': {'get': ['weight', 'banned']},
+            'private': {'post': ['order']},
+        },
+        'rateLimitHeaders': rate_limit_headers,
+    }
+
+
+def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+    return {'url': self.urls['api'][api] + '/' + path, 'method': method, 'body': body, 'headers': headers}
+
+
+class fake(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), describe(self.url))
+
+    sign = sign
+
+
+class async_fake(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(async_fake, self).describe(), describe(self.url))
+
+    sign = sign
+
+
+def elapsed_ms(function):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+server = FakeServer(routes).start()
+fake.url = async_fake.url = server.url
+
+try:
+
+    # the local bucket alone lets the requests through while the reported usage is low
+
+    exchange = fake()
+    assert set(exchange.rate_limit_buckets) == {'weight', 'orders'}
+    assert elapsed_ms(lambda: [exchange.publicGetWeight() for _ in range(10)]) < 10 * delta
+
+    # another process sharing the IP address has used 94 of the 100: the reported usage is over the
+    # threshold of 90, the next request waits until 5 weight is refilled at 0.01 per millisecond
+
+    state['weight'] = 94
+    exchange.publicGetWeight()
+    elapsed = elapsed_ms(exchange.publicGetWeight)
+    assert abs(elapsed - 500) < delta, elapsed
+
+    # the remaining orders are counted against the POST requests only
+
+    exchange = fake()
+    state['weight'] = 0
+    state['orders'] = 2
+    exchange.privatePostOrder()
+    assert elapsed_ms(exchange.publicGetWeight) < delta
+    elapsed = elapsed_ms(exchange.privatePostOrder)
+    # 1 of 20 orders left, 19 used: the bucket was lowered to 18 - 19 and refills at 0.002 per millisecond
+    assert abs(elapsed - 500) < delta, elapsed
+
+    # a 429 response with a Retry-After header pauses all the buckets
+
+    exchange = fake()
+    state['retry'] = '0.3'
+    try:
+        exchange.publicGetBanned()
+        assert False
+    except ccxt.BaseError:
+        pass
+    elapsed = elapsed_ms(exchange.publicGetWeight)
+    assert abs(elapsed - 300) < delta, elapsed
+
+    # the exchanges without rateLimitHeaders don't look at the headers
+
+    exchange = fake()
+    exchange.rateLimitHeaders = {}
+    state['weight'] = 1000
+    exchange.publicGetWeight()
+    assert elapsed_ms(exchange.publicGetWeight) < delta
+
+    # the same feedback in the async exchange
+
+    async def test_async():
+        exchange = async_fake()
+        state['weight'] = 94
+        await exchange.publicGetWeight()
+        start = time.perf_counter()
+        await exchange.publicGetWeight()
+        elapsed = (time.perf_counter() - start) * 1000
+        assert abs(elapsed - 500) < delta, elapsed
+        await exchange.close()
+
+    asyncio.run(test_async())
+
+finally:
+    server.stop()
+
+print('rate limit headers tests passed')
@@ -0,0 +1,159 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import multiprocessing  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.throttler import SharedThrottler  # noqa: E402
+from ccxt.async_support.base.throttler import Throttler as AsyncThrottler  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+delta = 15  # ms
+processes = 4
+runs = 10
+rate_limit = 20  # ms
+
+
+def describe(url):
+    return {
+        'id': 'fake',
+        'rateLimit': rate_limit,
+        'urls': {'api': {'public': url}},
+        'api': {'public': {'get': ['time']}},
+    }
+
+
+def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+    return {'url': self.urls['api'][api] + '/' + path, 'method': method, 'body': body, 'headers': headers}
+
+
+class fake(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), describe(self.url))
+
+    sign = sign
+
+
+class async_fake(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(async_fake, self).describe(), describe(self.url))
+
+    sign = sign
+
+
+def throttle_worker(path, barrier, results):
+    throttle = SharedThrottler({'refillRate': 1 / rate_limit}, path)
+    barrier.wait()
+    times = []
+    for _ in range(runs):
+        throttle()
+        times.append(time.monotonic() * 1000)
+    results.put(times)
+
+
+def exchange_worker(directory, url, synchronous, barrier, results):
+    fake.url = async_fake.url = url
+    config = {'sharedRateLimitPath': directory}
+    if synchronous:
+        exchange = fake(config)
+        # the first request opens the connection, the rest are not delayed by it
+        exchange.publicGetTime()
+        barrier.wait()
+        for _ in range(runs):
+            exchange.publicGetTime()
+    else:
+        async def run():
+            exchange = async_fake(config)
+            await exchange.publicGetTime()
+            barrier.wait()
+            await asyncio.gather(*[exchange.publicGetTime() for _ in range(runs)])
+            await exchange.close()
+        asyncio.run(run())
+    results.put(True)
+
+
+def start(context, target, args):
+    workers = [context.Process(target=target, args=args(index)) for index in range(processes)]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+def assert_within_rate_limit(times, tolerance=delta):
+    # the requests of all the processes together never go faster than one per rateLimit
+    times = sorted(times)
+    assert len(times) == processes * runs
+    for index, timestamp in enumerate(times):
+        assert timestamp - times[0] >= index * rate_limit - tolerance, (index, timestamp - times[0])
+    # and the budget is used, the whole run does not take much longer than the rate limit allows
+    elapsed = times[-1] - times[0]
+    assert elapsed < (len(times) - 1) * rate_limit * 1.5, elapsed
+
+
+if __name__ == '__main__':
+
+    # fork is much faster to start, the spawned processes import ccxt again
+    context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        # the throttlers of the processes using the same file share one bucket
+
+        barrier = context.Barrier(processes)
+        results = context.Queue()
+        path = os.path.join(directory, 'bucket')
+        workers = start(context, throttle_worker, lambda index: (path, barrier, results))
+        times = sum([results.get(timeout=60) for _ in workers], [])
+        for worker in workers:
+            worker.join()
+        assert_within_rate_limit(times)
+
+        # the async throttler doesn't block the event loop while another process holds the bucket
+
+        async def test_async_lock():
+            path = os.path.join(directory, 'locked')
+            holder = SharedThrottler({'refillRate': 1 / rate_limit}, path)
+            holder.lock.acquire()
+            asyncio.get_running_loop().call_later(0.05, holder.lock.release)
+            throttle = AsyncThrottler({'refillRate': 1 / rate_limit}, None, SharedThrottler({'refillRate': 1 / rate_limit}, path))
+            request = asyncio.ensure_future(throttle(1))
+            ticks = 0
+            while not request.done():
+                ticks += 1
+                await asyncio.sleep(0.005)
+            assert ticks > 5, ticks
+
+        asyncio.run(test_async_lock())
+
+        # the sync and the async exchanges with the same sharedRateLimitPath, id and host share the budget
+
+        server = FakeServer({'/time': lambda request: {}}).start()
+        try:
+            barrier = context.Barrier(processes)
+            results = context.Queue()
+            workers = start(context, exchange_worker, lambda index: (directory, server.url, index % 2 == 0, barrier, results))
+            for _ in workers:
+                results.get(timeout=60)
+            for worker in workers:
+                worker.join()
+            # the arrival times at the server also vary with the latency of the connections
+            times = [request['time'] * 1000 for request in server.requests[processes:]]
+            assert_within_rate_limit(times, 2 * rate_limit)
+            host = server.url.split('//')[1].replace(':', '-')
+            assert os.path.exists(os.path.join(directory, 'fake-' + host + '.bucket'))
+        finally:
+            server.stop()
+
+    print('shared throttle tests passed')
@@ -0,0 +1,80 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import hashlib  # noqa: E402
+import hmac  # noqa: E402
+import threading  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.static_dependencies import ecdsa  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+Exchange = ccxt.Exchange
+encode = Exchange.encode
+
+# the signatures with the prepared state are the ones computed from the secret every time
+
+exchange = Exchange()
+for secret in [b'', b'short', b'x' * 200]:
+    for algorithm in [hashlib.sha256, hashlib.sha512, 'sha384', hashlib.md5]:
+        for request in [b'', b'symbol=BTCUSDT&timestamp=1660000000000', b'y' * 1000]:
+            expected = hmac.new(secret, request, algorithm).hexdigest()
+            assert exchange.hmac(request, secret, algorithm) == expected
+            assert exchange.hmac(request, secret, algorithm) == expected
+            assert Exchange.hmac(request, secret, algorithm) == expected
+assert exchange.hmac(b'request', bytearray(b'secret')) == hmac.new(b'secret', b'request', hashlib.sha256).hexdigest()
+assert exchange.jwt({'a': 1}, b'short') == Exchange.jwt({'a': 1}, b'short')
+
+# one context per secret of the instance, its keys are prepared once
+
+context = exchange.signing_context(b'short')
+assert exchange.signing_context(b'short') is context
+assert set(context.hmacs) == set([hashlib.sha256, hashlib.sha512, 'sha384', hashlib.md5])
+assert Exchange().signing_context(b'short') is not context
+private_key = '1a' * 32
+exchange.ecdsa('1a', private_key, 'secp256k1', 'sha256')
+secexp = exchange.signing_context(private_key).ecdsa_secret_exponent(ecdsa.SECP256k1)
+assert exchange.signing_context(private_key).ecdsa_secrets == {ecdsa.SECP256k1: secexp}
+assert secexp == int(private_key, 16)
+assert exchange.ecdsa('1a', private_key, 'secp256k1', 'sha256') == Exchange.ecdsa('1a', private_key, 'secp256k1', 'sha256')
+
+# the contexts are dropped when the credentials change
+
+exchange = Exchange({'secret': 'first'})
+first = exchange.hmac(b'request', encode(exchange.secret))
+context = exchange.signing_context(encode(exchange.secret))
+exchange.secret = 'second'
+assert exchange.hmac(b'request', encode(exchange.secret)) == hmac.new(b'second', b'request', hashlib.sha256).hexdigest() != first
+assert list(exchange.signing_contexts) == [b'second']
+assert exchange.signing_context(b'first') is not context
+
+# the keys derived for every request are not kept
+
+for i in range(100):
+    exchange.hmac(b'request', encode(str(i)))
+assert len(exchange.signing_contexts) <= 16
+
+# the threads of an instance share its contexts
+
+exchange = Exchange()
+results = []
+
+
+def sign():
+    results.append([exchange.hmac(encode(str(i)), b'threads', hashlib.sha256) for i in range(1000)])
+
+
+threads = [threading.Thread(target=sign) for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+expected = [hmac.new(b'threads', encode(str(i)), hashlib.sha256).hexdigest() for i in range(1000)]
+assert all(result == expected for result in results)
+
+print('signing tests passed')
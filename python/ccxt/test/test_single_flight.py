@@ -0,0 +1,150 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import asyncio  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+state = {'fail': False}
+
+
+def ticker(request):
+    if state['fail']:
+        return (500, {}, 'internal error')
+    return {'symbol': request['query'].get('symbol'), 'last': '19000.1'}
+
+
+def order(request):
+    return {'id': str(len(server.requests))}
+
+
+server = FakeServer({'/ticker': ticker, '/order': order}, delay=0.05).start()
+
+
+class fake(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), {
+            'id': 'fake',
+            'rateLimit': 10,
+            'urls': {'api': {'public': server.url, 'private': server.url}},
+            'api': {
+                'public': {'get': ['ticker']},
+                'private': {'get': ['order']},
+            },
+        })
+
+    signed = 0
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        # a timestamp in every request, like the public endpoints of some exchanges
+        self.signed += 1
+        url = self.urls['api'][api] + '/' + path + '?' + self.urlencode(self.extend(params, {'timestamp': self.microseconds()}))
+        return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+
+def requests_to(path):
+    return len([request for request in server.requests if request['path'] == path])
+
+
+async def test():
+    # 50 concurrent identical requests are signed and sent once, the callers get copies of the response
+
+    exchange = fake({'singleFlight': True})
+    responses = await asyncio.gather(*[exchange.publicGetTicker({'symbol': 'BTCUSDT'}) for _ in range(50)])
+    assert requests_to('/ticker') == 1
+    assert exchange.signed == 1
+    assert all(response == responses[0] for response in responses)
+    assert all(response is not responses[0] for response in responses[1:])
+    assert responses[0] == {'symbol': 'BTCUSDT', 'last': '19000.1'}
+    responses[0]['last'] = '0'
+    assert responses[1]['last'] == '19000.1'
+    assert exchange.single_flight_stats == {'hits': 49, 'cached': 0, 'misses': 1}
+    assert exchange.single_flight_requests == {}
+
+    # the requests with other params are not shared, and nothing is cached without a TTL
+
+    responses = await asyncio.gather(
+        exchange.publicGetTicker({'symbol': 'BTCUSDT'}),
+        exchange.publicGetTicker({'symbol': 'ETHUSDT'}),
+        exchange.publicGetTicker({'symbol': 'ETHUSDT'}),
+    )
+    assert [response['symbol'] for response in responses] == ['BTCUSDT', 'ETHUSDT', 'ETHUSDT']
+    assert requests_to('/ticker') == 3
+
+    # the private requests are never shared
+
+    await asyncio.gather(*[exchange.privateGetOrder() for _ in range(3)])
+    assert requests_to('/order') == 3
+
+    # the errors are raised to all the callers, and the next call sends a new request
+
+    state['fail'] = True
+    results = await asyncio.gather(*[exchange.publicGetTicker({'symbol': 'BTCUSDT'}) for _ in range(5)], return_exceptions=True)
+    assert all(isinstance(result, ccxt.ExchangeNotAvailable) for result in results), results
+    assert requests_to('/ticker') == 4
+    state['fail'] = False
+    await exchange.publicGetTicker({'symbol': 'BTCUSDT'})
+    assert requests_to('/ticker') == 5
+
+    # a cancelled caller does not cancel the request of the others
+
+    first = asyncio.ensure_future(exchange.publicGetTicker({'symbol': 'XRPUSDT'}))
+    second = asyncio.ensure_future(exchange.publicGetTicker({'symbol': 'XRPUSDT'}))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert (await second)['symbol'] == 'XRPUSDT'
+    assert requests_to('/ticker') == 6
+    await exchange.close()
+
+    # the responses are served from the cache for singleFlightTTL milliseconds
+
+    exchange = fake({'singleFlight': True, 'singleFlightTTL': 200})
+    await exchange.publicGetTicker({'symbol': 'BTCUSDT'})
+    cached = await asyncio.gather(*[exchange.publicGetTicker({'symbol': 'BTCUSDT'}) for _ in range(10)])
+    assert requests_to('/ticker') == 7
+    cached[0]['last'] = '0'
+    assert (await exchange.publicGetTicker({'symbol': 'BTCUSDT'}))['last'] == '19000.1'
+    assert exchange.single_flight_stats == {'hits': 0, 'cached': 11, 'misses': 1}
+    await asyncio.sleep(0.2)
+    await exchange.publicGetTicker({'symbol': 'BTCUSDT'})
+    assert requests_to('/ticker') == 8
+    # the expired responses are dropped from the front of the cache when a new one is stored
+    await exchange.publicGetTicker({'symbol': 'ETHUSDT'})
+    assert [key[2] for key in exchange.single_flight_cache] == ['symbol=BTCUSDT', 'symbol=ETHUSDT']
+    await asyncio.sleep(0.2)
+    await exchange.publicGetTicker({'symbol': 'XRPUSDT'})
+    assert [key[2] for key in exchange.single_flight_cache] == ['symbol=XRPUSDT']
+    assert requests_to('/ticker') == 10
+    await exchange.close()
+
+    # with singleFlightCopy disabled the callers share the same response object
+
+    exchange = fake({'singleFlight': True, 'singleFlightTTL': 200, 'singleFlightCopy': False})
+    responses = await asyncio.gather(*[exchange.publicGetTicker({'symbol': 'BTCUSDT'}) for _ in range(3)])
+    responses.append(await exchange.publicGetTicker({'symbol': 'BTCUSDT'}))
+    assert all(response is responses[0] for response in responses)
+    assert requests_to('/ticker') == 11
+    await exchange.close()
+
+    # disabled by default
+
+    exchange = fake()
+    await asyncio.gather(*[exchange.publicGetTicker({'symbol': 'BTCUSDT'}) for _ in range(3)])
+    assert requests_to('/ticker') == 14
+    await exchange.close()
+
+
+try:
+    asyncio.run(test())
+finally:
+    server.stop()
+
+print('single flight tests passed')
@@ -33,6 +33,8 @@ class Argv(object):
     nonce = None
     exchange = None
     symbol = None
+    record = None
+    replay = None
     pass
 
 
@@ -42,6 +44,8 @@ parser = argparse.ArgumentParser()
 
 parser.add_argument('--verbose', action='store_true', help='enable verbose output')
 parser.add_argument('--nonce', type=int, help='integer')
+parser.add_argument('--record', type=str, help='record the responses into the fixtures in this directory')
+parser.add_argument('--replay', type=str, help='replay the responses from the fixtures in this directory')
 parser.add_argument('exchange', type=str, help='exchange id in lowercase', nargs='?')
 parser.add_argument('symbol', type=str, help='symbol in uppercase', nargs='?')
 
@@ -592,6 +596,9 @@ for id in ccxt.exchanges:
         exchange_config.update()
     if id in config:
         exchange_config = ccxt.Exchange.deep_extend(exchange_config, config[id])
+    if argv.record or argv.replay:
+        exchange_config['fixturePath'] = os.path.join(argv.record or argv.replay, id + '.jsonl.gz')
+        exchange_config['fixtureMode'] = 'record' if argv.record else 'replay'
     exchanges[id] = exchange(exchange_config)
 
 # ------------------------------------------------------------------------------
@@ -0,0 +1,142 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+
+import time  # noqa: E402
+import threading  # noqa: E402
+import ccxt  # noqa: E402
+from ccxt.base.throttler import Throttler  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
+
+# ----------------------------------------------------------------------------
+
+delta = 15  # ms
+
+# the same cases as the asynchronous throttler in test_throttle.py
+
+test_cases = [
+    {'tokens': 0, 'refillRate': 1 / 50, 'cost': 1, 'runs': 20},
+    {'tokens': 20, 'refillRate': 1 / 50, 'cost': 1, 'runs': 30},
+    {'tokens': 0, 'refillRate': 1 / 20, 'cost': 1, 'runs': 50},
+    {'tokens': 100, 'refillRate': 1 / 20, 'cost': 5, 'runs': 30},
+    {'tokens': 0, 'refillRate': 1 / 40, 'cost': 2, 'runs': 10},
+    {'tokens': 5, 'refillRate': 1 / 100, 'cost': 1, 'runs': 10},
+    {'tokens': 0, 'refillRate': 1 / 10, 'cost': 1, 'runs': 100},
+]
+
+
+def expected_ms(case):
+    # the first tokens / cost runs and one more go through instantly, each of the rest waits for cost tokens
+    remaining = case['runs'] - case['tokens'] / case['cost'] - 1
+    return remaining * case['cost'] / case['refillRate']
+
+
+def assert_elapsed(elapsed, expected, *details):
+    # the requests are never let through early, a loaded machine can only make them late
+    assert elapsed > expected - delta, (elapsed, expected) + details
+    assert elapsed < expected * 1.5 + 100, (elapsed, expected) + details
+
+
+def elapsed_ms(function):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+def run(case, threads=1):
+    throttle = Throttler({'tokens': case['tokens'], 'refillRate': case['refillRate']})
+
+    def worker():
+        for _ in range(case['runs'] // threads):
+            throttle(case['cost'])
+
+    def start_workers():
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+    return elapsed_ms(start_workers)
+
+
+for case in test_cases:
+    expected = expected_ms(case)
+    assert_elapsed(run(case), expected, case)
+    # the same budget is shared by the threads using the same throttler
+    assert_elapsed(run(case, 5), expected, case)
+
+# the capacity allows bursts after some idle time, without it the 6 calls would take 250 ms
+
+throttle = Throttler({'refillRate': 1 / 50, 'capacity': 5})
+throttle()
+time.sleep(0.3)
+assert elapsed_ms(lambda: [throttle() for _ in range(6)]) < 100
+
+# the turns are handed out in the order of the calls
+
+throttle = Throttler({'refillRate': 1 / 10})
+order = []
+
+
+def ordered(index):
+    throttle()
+    order.append(index)
+
+
+threads = []
+for index in range(10):
+    thread = threading.Thread(target=ordered, args=(index,))
+    thread.start()
+    threads.append(thread)
+    time.sleep(0.002)
+for thread in threads:
+    thread.join()
+assert order == list(range(10))
+
+# the exchange throttles the requests by their cost, shared between the threads
+
+server = FakeServer({'/cheap': lambda request: {}, '/expensive': lambda request: {}}).start()
+
+
+class fake(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fake, self).describe(), {
+            'id': 'fake',
+            'rateLimit': 10,
+            'urls': {'api': {'public': server.url}},
+            'api': {'public': {'get': {'cheap': 1, 'expensive': 5}}},
+        })
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': self.urls['api'][api] + '/' + path, 'method': method, 'body': body, 'headers': headers}
+
+
+try:
+    exchange = fake()
+    # the first request goes through, the other 21 wait 10 ms each
+    assert_elapsed(elapsed_ms(lambda: [exchange.publicGetCheap() for _ in range(22)]), 210)
+    exchange = fake()
+    # 20 threads send one request of cost 5 each: the first one goes through, the other 19 wait 50 ms each
+    workers = [threading.Thread(target=exchange.publicGetExpensive) for _ in range(20)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    assert_elapsed((time.perf_counter() - start) * 1000, 19 * 50)
+    assert len(server.requests) == 42
+    # achieved rate
+    times = [request['time'] for request in server.requests[22:]]
+    rate = (len(times) - 1) / (max(times) - min(times))
+    # never above the limit
+    assert rate < 21, rate
+finally:
+    server.stop()
+
+print('sync throttle tests passed')
@@ -8,7 +8,10 @@ sys.path.append(root)
 
 import asyncio  # noqa: E402
 import time  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.errors import RequestTimeout  # noqa: E402
 from ccxt.async_support.base.throttler import Throttler as Throttle  # noqa: E402
+from ccxt.test.fake_server import FakeServer  # noqa: E402
 # from ccxt.async_support.base.throttle import throttle as Throttle
 
 
@@ -100,17 +103,182 @@ async def schedule(case):
         await throttle(case['cost'])
     end = time.perf_counter_ns()
     elapsed_ms = (end - start) / 1000000
-    result = abs(case['expected'] - elapsed_ms) < delta
+    # the runs are never released early, the sleeps of a loaded machine can release them a little late,
+    # by up to delta per second of the case, since the cases run concurrently on the same event loop
+    lateness = elapsed_ms - case['expected']
+    result = -delta < lateness < delta * max(1, case['expected'] / 1000)
     print(f'case {case["number"]} {"succeeded" if result else "failed"} in {elapsed_ms}ms expected {case["expected"]}ms')
     assert result
 
 
 async def main():
-    await asyncio.wait([schedule(case) for case in test_cases], return_when=asyncio.ALL_COMPLETED)
+    # asyncio.wait() no longer accepts coroutines, gather() also raises the failed assertions
+    await asyncio.gather(*[schedule(case) for case in test_cases])
 
 
 asyncio.run(main())
 
+
+async def test_event_driven():
+    # the requests are released in the order of the calls
+    throttle = Throttle({'refillRate': 1 / 10})
+    order = []
+
+    async def request(index):
+        await throttle(1)
+        order.append(index)
+
+    await asyncio.gather(*[request(index) for index in range(20)])
+    assert order == list(range(20))
+
+    # the looper sleeps once per release instead of polling the bucket every millisecond
+    sleeps = []
+    original_sleep = asyncio.sleep
+
+    async def counting_sleep(delay, *args, **kwargs):
+        sleeps.append(delay)
+        return await original_sleep(delay, *args, **kwargs)
+
+    asyncio.sleep = counting_sleep
+    try:
+        throttle = Throttle({'refillRate': 1 / 100})
+        await asyncio.gather(*[throttle(1) for _ in range(5)])
+    finally:
+        asyncio.sleep = original_sleep
+    assert len([delay for delay in sleeps if delay > 0]) <= 8, sleeps
+
+    # the cancelled requests take no tokens
+    throttle = Throttle({'refillRate': 1 / 100})
+    await throttle(1)
+    cancelled = [throttle(1) for _ in range(10)]
+    for future in cancelled:
+        future.cancel()
+    start = time.perf_counter()
+    await throttle(1)
+    assert (time.perf_counter() - start) * 1000 < 100 + delta
+
+    # the bucket refills up to its capacity while idle
+    throttle = Throttle({'refillRate': 1 / 10, 'capacity': 5})
+    await throttle(1)
+    await asyncio.sleep(0.1)
+    start = time.perf_counter()
+    await asyncio.gather(*[throttle(1) for _ in range(6)])
+    assert (time.perf_counter() - start) * 1000 < delta
+
+
+asyncio.run(test_event_driven())
+
+
+async def test_priorities():
+    # the requests with a lower priority are released first, FIFO within a priority
+    throttle = Throttle({'refillRate': 1 / 10})
+    order = []
+
+    async def request(name, priority):
+        await throttle(1, priority)
+        order.append(name)
+
+    backfill = [asyncio.ensure_future(request('ohlcv' + str(index), 2)) for index in range(10)]
+    await asyncio.sleep(0.025)
+    await asyncio.gather(request('order', 0), request('balance', 1), *backfill)
+    assert order[:3] == ['ohlcv0', 'ohlcv1', 'ohlcv2'], order
+    assert order[3:5] == ['order', 'balance'], order
+    assert order[5:] == ['ohlcv' + str(index) for index in range(3, 10)], order
+
+    # the requests still queued at their deadline fail with a RequestTimeout and take no tokens
+    throttle = Throttle({'refillRate': 1 / 50})
+    await throttle(1)
+    deadline = time.monotonic() * 1000 + 20
+    start = time.perf_counter()
+    try:
+        await throttle(1, 0, deadline)
+        assert False
+    except RequestTimeout:
+        pass
+    assert abs((time.perf_counter() - start) * 1000 - 20) < delta
+    start = time.perf_counter()
+    await throttle(1)
+    assert abs((time.perf_counter() - start) * 1000 - 30) < delta
+    # an expired deadline fails right away
+    try:
+        await throttle(1, 0, time.monotonic() * 1000 - 1)
+        assert False
+    except RequestTimeout:
+        pass
+
+    # the callers over maxCapacity wait for a place in the queue instead of failing
+    throttle = Throttle({'refillRate': 1 / 5, 'maxCapacity': 3})
+    order = []
+
+    async def backpressure(index):
+        await throttle(1)
+        order.append(index)
+
+    await asyncio.gather(*[backpressure(index) for index in range(10)])
+    assert order == list(range(10))
+    assert len(throttle.backlog) == 0
+
+    # up to maxBacklog of them
+    throttle = Throttle({'refillRate': 1 / 5, 'maxCapacity': 3, 'maxBacklog': 2})
+    futures = [throttle(1) for _ in range(5)]
+    try:
+        throttle(1)
+        assert False
+    except RuntimeError as e:
+        assert 'maxBacklog (2)' in str(e)
+    await asyncio.gather(*futures)
+
+
+asyncio.run(test_priorities())
+
+
+async def test_exchange_priorities():
+    # trading requests overtake the queued market data requests of the same exchange instance
+    server = FakeServer({'/klines': lambda request: [], '/order': lambda request: {}}).start()
+
+    class fake(ccxt.async_support.Exchange):
+
+        def describe(self):
+            return self.deep_extend(super(fake, self).describe(), {
+                'id': 'fake',
+                'rateLimit': 10,
+                'urls': {'api': {'public': server.url, 'private': server.url}},
+                'api': {
+                    'public': {'get': ['klines']},
+                    'private': {'post': ['order']},
+                },
+            })
+
+        def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+            url = self.urls['api'][api] + '/' + path + '?' + self.urlencode(params)
+            return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+    exchange = fake()
+    try:
+        backfill = [asyncio.ensure_future(exchange.publicGetKlines({'page': index})) for index in range(20)]
+        await asyncio.sleep(0.035)
+        await asyncio.gather(exchange.privatePostOrder(), *backfill)
+        paths = [request['path'] for request in server.requests]
+        assert paths.index('/order') < 8, paths
+        # the request params are not sent
+        await exchange.publicGetKlines({'requestPriority': 'trading', 'requestDeadline': exchange.milliseconds() + 1000})
+        assert server.requests[-1]['query'] == {}
+        # the deadline of a request that would wait too long
+        backfill = [asyncio.ensure_future(exchange.publicGetKlines()) for index in range(10)]
+        await asyncio.sleep(0)
+        try:
+            await exchange.publicGetKlines({'requestDeadline': exchange.milliseconds() + 30})
+            assert False
+        except RequestTimeout:
+            pass
+        await asyncio.gather(*backfill)
+    finally:
+        await exchange.close()
+        server.stop()
+
+
+asyncio.run(test_exchange_priorities())
+
 # output
 
 '''